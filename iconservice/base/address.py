@@ -19,6 +19,7 @@
 
 import hashlib
 from enum import IntEnum
+from functools import lru_cache
 from typing import Optional
 
 from .exception import InvalidParamsException
@@ -32,6 +33,9 @@ ICON_CONTRACT_ADDRESS_BYTES_SIZE = 21
 ICON_ADDRESS_BYTES_SIZE = 21
 ICON_ADDRESS_BODY_SIZE = 20
 
+# The maximum number of Address instances shared by from_string() and from_bytes()
+ADDRESS_INTERN_TABLE_SIZE = 100_000
+
 
 def is_icon_address_valid(address: str) -> bool:
     """Check whether address is in icon address format or not
@@ -98,8 +102,12 @@ class AddressPrefix(IntEnum):
 
 class Address(object):
     """Address class
+
+    Address is immutable, so the same instance is shared by from_string() and from_bytes()
     """
 
+    __slots__ = ("__prefix", "__body", "__hash")
+
     def __init__(self,
                  address_prefix: AddressPrefix,
                  address_body: bytes, ignore_length_validate: bool = False) -> None:
@@ -120,6 +128,7 @@ class Address(object):
 
         self.__prefix = address_prefix
         self.__body = address_body
+        self.__hash: Optional[int] = None
 
     @property
     def prefix(self) -> AddressPrefix:
@@ -171,7 +180,9 @@ class Address(object):
 
         :return: hash value
         """
-        return hash(self.__prefix.to_bytes(1, DATA_BYTE_ORDER) + self.__body)
+        if self.__hash is None:
+            self.__hash = hash(self.__prefix.to_bytes(1, DATA_BYTE_ORDER) + self.__body)
+        return self.__hash
 
     @property
     def is_contract(self) -> bool:
@@ -189,16 +200,10 @@ class Address(object):
 
         :return: :class:`.Address`
         """
-
-        if not is_icon_address_valid(address):
+        if not isinstance(address, str):
             raise InvalidParamsException('Invalid address')
 
-        prefix, body = split_icon_address(address)
-
-        address_prefix = AddressPrefix.from_string(prefix)
-        address_body = bytes.fromhex(body)
-
-        return Address(address_prefix, address_body)
+        return _address_from_string(address)
 
     @staticmethod
     def from_data(prefix: AddressPrefix, data: bytes) -> Optional['Address']:
@@ -229,11 +234,7 @@ class Address(object):
         if size not in (ICON_ADDRESS_BODY_SIZE, ICON_ADDRESS_BYTES_SIZE):
             return None
 
-        if size == ICON_ADDRESS_BYTES_SIZE:
-            prefix: 'AddressPrefix' = AddressPrefix(buf[0])
-            return Address(prefix, buf[1:])
-        else:
-            return Address(AddressPrefix.EOA, buf)
+        return _address_from_bytes(buf)
 
     def to_bytes(self) -> bytes:
         """
@@ -268,6 +269,9 @@ class Address(object):
 class MalformedAddress(Address):
     """This class only exists to support an invalid format address which was created by legacy bug
     """
+
+    __slots__ = ()
+
     def __init__(self,
                  address_prefix: AddressPrefix,
                  address_body: bytes) -> None:
@@ -299,6 +303,28 @@ class MalformedAddress(Address):
         return MalformedAddress(AddressPrefix.EOA, address_body)
 
 
+@lru_cache(maxsize=ADDRESS_INTERN_TABLE_SIZE)
+def _address_from_string(address: str) -> 'Address':
+    if not is_icon_address_valid(address):
+        raise InvalidParamsException('Invalid address')
+
+    prefix, body = split_icon_address(address)
+
+    address_prefix = AddressPrefix.from_string(prefix)
+    address_body = bytes.fromhex(body)
+
+    return Address(address_prefix, address_body)
+
+
+@lru_cache(maxsize=ADDRESS_INTERN_TABLE_SIZE)
+def _address_from_bytes(buf: bytes) -> 'Address':
+    if len(buf) == ICON_ADDRESS_BYTES_SIZE:
+        prefix: 'AddressPrefix' = AddressPrefix(buf[0])
+        return Address(prefix, buf[1:])
+    else:
+        return Address(AddressPrefix.EOA, buf)
+
+
 # cx0000000000000000000000000000000000000000
 SYSTEM_SCORE_ADDRESS = Address.from_string(SYSTEM_ADDRESS)
 ZERO_SCORE_ADDRESS = SYSTEM_SCORE_ADDRESS
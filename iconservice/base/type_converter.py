@@ -16,7 +16,7 @@
 
 import inspect
 from copy import deepcopy
-from typing import Union, Any, get_type_hints
+from typing import Union, Any, Callable, Dict, Optional, get_type_hints
 
 from .address import Address, MalformedAddress, is_icon_address_valid
 from .exception import InvalidParamsException
@@ -34,46 +34,8 @@ class TypeConverter:
         if param_type is None:
             return params
 
-        copied_params = deepcopy(params)  # to avoid corrupting original data
-        converted_params = TypeConverter._convert(copied_params, type_convert_templates[param_type])
-        return converted_params
-
-    @staticmethod
-    def _convert(params: Union[str, list, dict, None], template: Union[list, dict, ValueType]) -> Any:
-        if TypeConverter._skip_params(params, template):
-            return params
-
-        if isinstance(template, dict) and KEY_CONVERTER in template:
-            params = TypeConverter._convert_key(params, template[KEY_CONVERTER])
-
-        if isinstance(params, dict) and isinstance(template, dict):
-            new_params = {}
-            for key, value in params.items():
-                if TypeConverter._check_convert_using_method(key, template):
-                    ref_key_table = deepcopy(new_params)
-                    target_template = TypeConverter._get_convert_using_method_template(key, template)
-                    new_value = TypeConverter._convert_using_switch(value, ref_key_table, target_template)
-                else:
-                    new_value = TypeConverter._convert(value, template.get(key))
-                new_params[key] = new_value
-        elif isinstance(params, list) and isinstance(template, list):
-            new_params = []
-            for item in params:
-                if isinstance(item, list):
-                    new_item = []
-                    for element, templete_type in zip(item, template[0]):
-                        new_element = TypeConverter._convert(element, templete_type)
-                        new_item.append(new_element)
-                    new_params.append(new_item)
-                else:
-                    new_item = TypeConverter._convert(item, template[0])
-                    new_params.append(new_item)
-        elif isinstance(template, ValueType):
-            new_params = TypeConverter._convert_value(params, template)
-        else:
-            new_params = params
-
-        return new_params
+        # Original data is not changed because converters make new objects
+        return _converters[param_type](params)
 
     @staticmethod
     def _convert_key(params, key_convert_dict):
@@ -89,78 +51,14 @@ class TypeConverter:
         return new_params
 
     @staticmethod
-    def _check_convert_using_method(param: str, template: dict) -> bool:
-        params = template.get(param)
-        if isinstance(params, dict):
-            return CONVERT_USING_SWITCH_KEY in params
-        return False
-
-    @staticmethod
-    def _get_convert_using_method_template(key: str, template: dict) -> dict:
-        tmp_params = template.get(key)
-        return tmp_params.get(CONVERT_USING_SWITCH_KEY)
-
-    @staticmethod
-    def _skip_params(params: Union[str, dict, None], template: Union[list, dict, ValueType]) -> bool:
-        if params is None:
-            raise InvalidParamsException(f'TypeConvert Exception None value, template: {str(template)}')
-        if isinstance(params, str):
-            if params != "" and not template:
-                return True
-        elif not params or not template:
-            return True
-        return False
-    
-    @staticmethod
-    def _convert_using_switch(params: Union[str, dict, None],
-                              tmp_params: dict,
-                              template: Union[list, dict, ValueType]) -> Any:
-        if TypeConverter._skip_params(params, template):
-            return params
-
-        switch_key = template.get(SWITCH_KEY)
-        template_key = tmp_params.get(switch_key)
-        target_template = template.get(template_key)
-
-        if isinstance(params, dict) and isinstance(target_template, dict):
-            new_params = {}
-            for key, value in params.items():
-                new_value = TypeConverter._convert(value, target_template.get(key))
-                new_params[key] = new_value
-        elif isinstance(params, list) and isinstance(target_template, list):
-            new_params = []
-            for item in params:
-                new_item = TypeConverter._convert(item, target_template[0])
-                new_params.append(new_item)
-        elif isinstance(target_template, ValueType):
-            new_params = TypeConverter._convert_value(params, target_template)
-        else:
-            new_params = params
-
-        return new_params
+    def _raise_none_value(template: Union[list, dict, ValueType]):
+        raise InvalidParamsException(f'TypeConvert Exception None value, template: {str(template)}')
 
     @staticmethod
-    def _convert_value(value: Any, value_type: ValueType) -> Any:
-        if value_type == ValueType.INT:
-            converted_value = TypeConverter._convert_value_int(value)
-        elif value_type == ValueType.HEXADECIMAL:
-            converted_value = TypeConverter._convert_value_hexadecimal(value)
-        elif value_type == ValueType.STRING:
-            converted_value = TypeConverter._convert_value_string(value)
-        elif value_type == ValueType.BOOL:
-            converted_value = TypeConverter._convert_value_bool(value)
-        elif value_type == ValueType.ADDRESS:
-            if len(value) == 0:
-                converted_value = None
-            else:
-                converted_value = TypeConverter._convert_value_address(value)
-        elif value_type == ValueType.ADDRESS_OR_MALFORMED_ADDRESS:
-            converted_value = TypeConverter._convert_value_address_or_malformed_address(value)
-        elif value_type == ValueType.BYTES:  # hash...(block_hash, tx_hash)
-            converted_value = TypeConverter._convert_value_bytes(value)
-        else:
-            converted_value = value
-        return converted_value
+    def _convert_value_address_or_none(value: Any) -> Optional['Address']:
+        if len(value) == 0:
+            return None
+        return TypeConverter._convert_value_address(value)
 
     @staticmethod
     def _convert_value_int(value: str) -> int:
@@ -351,3 +249,202 @@ class TypeConverter:
             return bytes.hex(value)
         else:
             return f'0x{bytes.hex(value)}'
+
+
+def _copy(value: Any) -> Any:
+    # Values which are not converted are copied not to share them with the original data
+    if isinstance(value, (dict, list)):
+        return deepcopy(value)
+    return value
+
+
+def _compile(template: Union[list, dict, ValueType, None]) -> Callable[[Any], Any]:
+    """Makes a converter specialized for the template
+
+    The converter returns the same result as walking params along the template,
+    but all lookups of the template are done here only once
+    """
+    skip: bool = not template
+
+    if isinstance(template, dict):
+        return _compile_dict(template, skip)
+    if isinstance(template, list):
+        return _compile_list(template, skip)
+    if isinstance(template, ValueType):
+        return _compile_value(template, skip)
+
+    def convert(params: Any) -> Any:
+        if params is None:
+            TypeConverter._raise_none_value(template)
+        return _copy(params)
+
+    return convert
+
+
+def _compile_dict(template: dict, skip: bool) -> Callable[[Any], Any]:
+    has_key_converter: bool = KEY_CONVERTER in template
+    key_converter: Optional[dict] = template.get(KEY_CONVERTER)
+    converters: Dict[str, Callable[[Any], Any]] = {}
+    switch_converters: Dict[str, Callable[[Any, dict], Any]] = {}
+
+    for key, value in template.items():
+        if isinstance(value, dict) and CONVERT_USING_SWITCH_KEY in value:
+            switch_converters[key] = _compile_switch(value[CONVERT_USING_SWITCH_KEY])
+        else:
+            converters[key] = _compile(value)
+
+    convert_unknown: Callable[[Any], Any] = _compile(None)
+
+    def convert(params: Any) -> Any:
+        if params is None:
+            TypeConverter._raise_none_value(template)
+        if isinstance(params, str):
+            if params != "" and skip:
+                return params
+        elif not params or skip:
+            return _copy(params)
+
+        if has_key_converter:
+            params = TypeConverter._convert_key(params, key_converter)
+
+        if not isinstance(params, dict):
+            return _copy(params)
+
+        new_params = {}
+        for key, value in params.items():
+            if key in switch_converters:
+                new_params[key] = switch_converters[key](value, new_params)
+            else:
+                new_params[key] = converters.get(key, convert_unknown)(value)
+
+        return new_params
+
+    return convert
+
+
+def _compile_list(template: list, skip: bool) -> Callable[[Any], Any]:
+    item_converter: Optional[Callable[[Any], Any]] = None
+    row_converters: Optional[list] = None
+
+    if not skip:
+        item_template = template[0]
+        item_converter = _compile(item_template)
+        try:
+            # A nested list is converted along the item template element by element
+            row_converters = [_compile(element_template) for element_template in item_template]
+        except TypeError:
+            pass
+
+    def convert(params: Any) -> Any:
+        if params is None:
+            TypeConverter._raise_none_value(template)
+        if isinstance(params, str):
+            if params != "" and skip:
+                return params
+        elif not params or skip:
+            return _copy(params)
+
+        if not isinstance(params, list):
+            return _copy(params)
+
+        new_params = []
+        for item in params:
+            if isinstance(item, list):
+                if row_converters is None:
+                    # raises TypeError as the item template is not iterable
+                    zip(item, template[0])
+                new_params.append([element_converter(element)
+                                   for element, element_converter in zip(item, row_converters)])
+            else:
+                new_params.append(item_converter(item))
+
+        return new_params
+
+    return convert
+
+
+def _compile_value(template: ValueType, skip: bool) -> Callable[[Any], Any]:
+    convert_value: Callable[[Any], Any] = _value_converters.get(template, _copy)
+
+    def convert(params: Any) -> Any:
+        if params is None:
+            TypeConverter._raise_none_value(template)
+        if isinstance(params, str):
+            if params != "" and skip:
+                return params
+        elif not params or skip:
+            return _copy(params)
+
+        return convert_value(params)
+
+    return convert
+
+
+def _compile_switch(template: dict) -> Callable[[Any, dict], Any]:
+    switch_key: str = template.get(SWITCH_KEY)
+    converters: Dict[str, Callable[[Any], Any]] = {
+        key: _compile_switch_target(target_template) for key, target_template in template.items()
+    }
+
+    def convert(params: Any, converted_params: dict) -> Any:
+        """
+        :param params: params to convert
+        :param converted_params: params converted so far, which have the switch key
+        """
+        if params is None:
+            TypeConverter._raise_none_value(template)
+        if not isinstance(params, str) and not params:
+            return _copy(params)
+
+        converter: Optional[Callable[[Any], Any]] = converters.get(converted_params.get(switch_key))
+        if converter is None:
+            return _copy(params)
+
+        return converter(params)
+
+    return convert
+
+
+def _compile_switch_target(template: Union[list, dict, ValueType, None]) -> Callable[[Any], Any]:
+    # The template selected by the switch key is applied to params without checking params first
+    if isinstance(template, dict):
+        converters: Dict[str, Callable[[Any], Any]] = {
+            key: _compile(value) for key, value in template.items()
+        }
+        convert_unknown: Callable[[Any], Any] = _compile(None)
+
+        def convert(params: Any) -> Any:
+            if not isinstance(params, dict):
+                return _copy(params)
+            return {key: converters.get(key, convert_unknown)(value) for key, value in params.items()}
+
+    elif isinstance(template, list):
+        item_converter: Callable[[Any], Any] = _compile(template[0])
+
+        def convert(params: Any) -> Any:
+            if not isinstance(params, list):
+                return _copy(params)
+            return [item_converter(item) for item in params]
+
+    elif isinstance(template, ValueType):
+        convert = _value_converters.get(template, _copy)
+
+    else:
+        convert = _copy
+
+    return convert
+
+
+_value_converters: Dict[ValueType, Callable[[Any], Any]] = {
+    ValueType.INT: TypeConverter._convert_value_int,
+    ValueType.HEXADECIMAL: TypeConverter._convert_value_hexadecimal,
+    ValueType.STRING: TypeConverter._convert_value_string,
+    ValueType.BOOL: TypeConverter._convert_value_bool,
+    ValueType.ADDRESS: TypeConverter._convert_value_address_or_none,
+    ValueType.ADDRESS_OR_MALFORMED_ADDRESS: TypeConverter._convert_value_address_or_malformed_address,
+    ValueType.BYTES: TypeConverter._convert_value_bytes,
+}
+
+_converters: Dict[ParamType, Callable[[Any], Any]] = {
+    param_type: _compile(template) for param_type, template in type_convert_templates.items()
+}
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 
+import hashlib
 from collections import OrderedDict
 from collections.abc import MutableMapping
 from copy import copy
@@ -23,10 +24,12 @@ from typing import Optional, List
 from ..base.block import Block
 from ..base.exception import DatabaseException, AccessDeniedException
 from ..icx import IcxStorage
-from ..utils import sha3_256, to_camel_case
+from ..utils import to_camel_case
 
 
 class BatchValue:
+    __slots__ = ("_value", "_include_state_root_hash")
+
     def __init__(self, value: Optional[bytes], include_state_root_hash: bool):
         self._value: bytes = value
         self._include_state_root_hash: bool = include_state_root_hash
@@ -41,15 +44,19 @@ class BatchValue:
 
     def to_dict(self, casing: Optional[callable] = None) -> dict:
         new_dict = {}
-        for key, value in self.__dict__.items():
-            if key.startswith("_"):
-                key = key[1:]
-            new_dict[casing(key) if casing else key] = value
+        for cls in reversed(type(self).__mro__):
+            for key in getattr(cls, "__slots__", ()):
+                value = getattr(self, key)
+                if key.startswith("_"):
+                    key = key[1:]
+                new_dict[casing(key) if casing else key] = value
 
         return new_dict
 
 
 class TransactionBatchValue(BatchValue):
+    __slots__ = ("_tx_index",)
+
     def __init__(self, value: Optional[bytes], include_state_root_hash: bool, tx_index: int = -1):
         super().__init__(value, include_state_root_hash)
         self._tx_index: int = tx_index
@@ -74,6 +81,8 @@ class TransactionBatchValue(BatchValue):
 
 
 class BlockBatchValue(BatchValue):
+    __slots__ = ("_tx_indexes",)
+
     def __init__(self, value: Optional[bytes], include_state_root_hash: bool, tx_indexes: List[int]):
         super().__init__(value, include_state_root_hash)
         self._tx_indexes: List[int] = tx_indexes
@@ -91,8 +100,15 @@ class BlockBatchValue(BatchValue):
                self.tx_indexes == other.tx_indexes
 
 
+# The number of keys and values which are joined and fed to the hasher at once in digest()
+_DIGEST_CHUNK_SIZE = 1024
+
+
 def digest(ordered_dict: OrderedDict):
     # items in data MUST be byte-like objects
+    # data are joined and hashed chunk by chunk not to copy the whole states at once
+    hasher = hashlib.sha3_256()
+    separator = b''
     data = []
 
     for key, tx_batch_value in ordered_dict.items():
@@ -103,8 +119,18 @@ def digest(ordered_dict: OrderedDict):
         data.append(key)
         if value is not None:
             data.append(value)
-    value: bytes = b'|'.join(data)
-    return sha3_256(value)
+
+        if len(data) >= _DIGEST_CHUNK_SIZE:
+            hasher.update(separator)
+            hasher.update(b'|'.join(data))
+            separator = b'|'
+            data = []
+
+    if data:
+        hasher.update(separator)
+        hasher.update(b'|'.join(data))
+
+    return hasher.digest()
 
 
 class Batch(OrderedDict):
@@ -144,29 +170,24 @@ class TransactionBatch(MutableMapping):
         super().__init__()
         self.hash = tx_hash
         self._call_batches = [OrderedDict()]
+        # key: the newest TransactionBatchValue among all call_batches
+        self._index = {}
 
     def __getitem__(self, item):
-        for call_batch in reversed(self._call_batches):
-            if item in call_batch:
-                return call_batch[item]
-
-        return None
+        return self._index.get(item)
 
     def __setitem__(self, key, value):
         assert isinstance(value, TransactionBatchValue)
 
         call_batch: OrderedDict = self._call_batches[-1]
         call_batch[key] = value
+        self._index[key] = value
 
     def __delitem__(self, key):
         raise DatabaseException('delete item is not allowed')
 
     def __contains__(self, item):
-        for call_batch in self._call_batches:
-            if item in call_batch:
-                return True
-
-        return False
+        return item in self._index
 
     def __iter__(self):
         for call_batch in self._call_batches:
@@ -186,6 +207,16 @@ class TransactionBatch(MutableMapping):
 
     def revert_call(self):
         call_batch: OrderedDict = self._call_batches[-1]
+
+        # Restore the index with the values recorded by the outer calls
+        for key in call_batch:
+            for outer_call_batch in reversed(self._call_batches[:-1]):
+                if key in outer_call_batch:
+                    self._index[key] = outer_call_batch[key]
+                    break
+            else:
+                del self._index[key]
+
         call_batch.clear()
 
     def leave_call(self):
@@ -207,6 +238,7 @@ class TransactionBatch(MutableMapping):
     def clear(self):
         self.hash = None
         self._call_batches = [OrderedDict()]
+        self._index = {}
 
 
 class BlockBatch(Batch):
@@ -223,10 +255,43 @@ class BlockBatch(Batch):
         """
         super().__init__()
         self.block = block
+        # Merged view of this block batch and the uncommitted previous block batches
+        # key: the newest BlockBatchValue
+        self._overlay = {}
+        # key: the value in the state which this block is built on (pre-image)
+        self._pre_images = {}
 
     def __setitem__(self, key, value):
         raise AccessDeniedException("Can not set data on block batch directly.")
 
+    @property
+    def overlay(self) -> dict:
+        return self._overlay
+
+    def set_prev_overlay(self, prev_overlay: Optional[dict]):
+        """Rebuild the overlay on top of the one of the previous block batch
+
+        :param prev_overlay: the overlay of the previous uncommitted block batch
+            None means that the previous block has already been committed to stateDB
+        """
+        overlay = dict(prev_overlay) if prev_overlay else {}
+        overlay.update(self)
+        self._overlay = overlay
+
+    @property
+    def pre_images(self) -> dict:
+        return self._pre_images
+
+    def set_pre_image(self, key: bytes, value: Optional[bytes]):
+        """Keep the value of a key which is read from the state this block is built on
+        Only the first one is kept as it is the value before this block changes it
+
+        :param key:
+        :param value: the value in the previous block batches or stateDB
+        """
+        if key not in self._pre_images:
+            self._pre_images[key] = value
+
     def to_list(self) -> list:
         """
         Return list of key, value for Debugging
@@ -251,6 +316,7 @@ class BlockBatch(Batch):
                 tx_indexes: list = [value.tx_index]
             bbv = BlockBatchValue(value.value, value.include_state_root_hash, tx_indexes)
             super().__setitem__(key, bbv)
+            self._overlay[key] = bbv
 
     def update_block_hash(self, block_hash: bytes):
         self.block = Block(block_height=self.block.height,
@@ -266,7 +332,10 @@ class BlockBatch(Batch):
         block_value: 'BlockBatchValue' = BlockBatchValue(self.block.to_bytes(revision), False, [-1])
 
         super().__setitem__(block_key, block_value)
+        self._overlay[block_key] = block_value
 
     def clear(self) -> None:
         self.block = None
+        self._overlay = {}
+        self._pre_images = {}
         super().clear()
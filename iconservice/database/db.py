@@ -13,16 +13,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TYPE_CHECKING, Optional, Tuple, Iterable
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Optional, Tuple, Iterable, List
 
 import plyvel
 from iconcommons.logger import Logger
 
-from .batch import TransactionBatchValue
+from .batch import BatchValue, TransactionBatchValue
 from ..base.exception import DatabaseException
 from ..icon_constant import ICON_DB_LOG_TAG, IconScoreContextType
 
 if TYPE_CHECKING:
+    from .batch import BlockBatch
     from ..iconscore.icon_score_context import IconScoreContext
 
 
@@ -38,25 +41,205 @@ def _is_db_writable_on_context(context: 'IconScoreContext'):
         return not context.readonly
 
 
+class KeyValueCache(object):
+    """LRU cache for the values read from the committed state in LevelDB
+
+    The values in the cache are always the same as the ones in LevelDB,
+    so every write to LevelDB MUST invalidate the keys written.
+    None is also cached to remember the keys which do not exist.
+    """
+    # Rough memory usage of an entry except for the key and the value
+    # (OrderedDict node, dict slot and bytes object headers)
+    ENTRY_OVERHEAD = 160
+
+    def __init__(self, max_size: int):
+        """Constructor
+
+        :param max_size: memory budget of the cache in bytes
+        """
+        self._max_size: int = max_size
+        self._size: int = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        # Increased whenever keys are invalidated
+        # to prevent a value read before the invalidation from being cached
+        self._generation: int = 0
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    @classmethod
+    def _get_entry_size(cls, key: bytes, value: Optional[bytes]) -> int:
+        return cls.ENTRY_OVERHEAD + len(key) + (len(value) if value else 0)
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: bytes, generation: Optional[int] = None) -> Tuple[bool, Optional[bytes], int]:
+        """Look up the value for a given key
+
+        :param key:
+        :param generation: the cached values are ignored unless it is the same as the current generation
+            None means the current generation
+        :return: (hit, value, generation)
+            generation should be passed to put() on cache miss
+        """
+        with self._lock:
+            if generation in (None, self._generation) and key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, self._entries[key], self._generation
+
+            self._misses += 1
+            return False, None, self._generation
+
+    def put(self, key: bytes, value: Optional[bytes], generation: int):
+        """Cache the value read from LevelDB
+
+        :param key:
+        :param value:
+        :param generation: the one returned by get() before reading the value from LevelDB
+        """
+        entry_size: int = self._get_entry_size(key, value)
+        if entry_size > self._max_size:
+            return
+
+        with self._lock:
+            if generation != self._generation or key in self._entries:
+                return
+
+            self._entries[key] = value
+            self._size += entry_size
+
+            while self._size > self._max_size:
+                old_key, old_value = self._entries.popitem(last=False)
+                self._size -= self._get_entry_size(old_key, old_value)
+                self._evictions += 1
+
+    def invalidate(self, keys: Iterable[bytes]):
+        with self._lock:
+            self._generation += 1
+
+            for key in keys:
+                if key in self._entries:
+                    value: Optional[bytes] = self._entries.pop(key)
+                    self._size -= self._get_entry_size(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._size = 0
+
+    def get_status(self) -> dict:
+        with self._lock:
+            return {
+                "maxSize": self._max_size,
+                "size": self._size,
+                "count": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions
+            }
+
+
+class KeyValueSnapshot(object):
+    """Readonly view of KeyValueDatabase at the moment when it is taken
+    """
+
+    def __init__(self, db: 'KeyValueDatabase', snapshot: 'plyvel.Snapshot', generation: int):
+        """Constructor
+
+        :param db: KeyValueDatabase which this snapshot is taken from
+        :param snapshot: plyvel snapshot instance
+        :param generation: the generation of the cache of db when this snapshot is taken
+        """
+        self._db = db
+        self._snapshot = snapshot
+        self._generation = generation
+
+    @property
+    def db(self) -> 'KeyValueDatabase':
+        return self._db
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Get the value for the specified key at the moment when this snapshot is taken
+
+        The cache of db is used only if no key has been invalidated since this snapshot is taken
+
+        :param key: (bytes): key to retrieve
+        :return: value for the specified key, or None if not found
+        """
+        cache: Optional['KeyValueCache'] = self._db.cache
+        if cache is None:
+            return self._snapshot.get(key)
+
+        hit, value, _ = cache.get(key, self._generation)
+        if not hit:
+            value = self._snapshot.get(key)
+            cache.put(key, value, self._generation)
+
+        return value
+
+    def get_many(self, keys: Iterable[bytes]) -> List[Optional[bytes]]:
+        """Get the values for the specified keys at the moment when this snapshot is taken
+
+        :param keys: keys to retrieve
+        :return: values in the same order as keys, None for the keys which are not found
+        """
+        return [self.get(key) for key in keys]
+
+    def close(self):
+        self._snapshot.close()
+
+
 class KeyValueDatabase(object):
     @staticmethod
     def from_path(path: str,
-                  create_if_missing: bool = True) -> 'KeyValueDatabase':
+                  create_if_missing: bool = True,
+                  cache_size: int = 0) -> 'KeyValueDatabase':
         """
 
         :param path: db path
         :param create_if_missing:
+        :param cache_size: memory budget of the read cache in bytes (0: disabled)
         :return: KeyValueDatabase instance
         """
         db = plyvel.DB(path, create_if_missing=create_if_missing)
-        return KeyValueDatabase(db)
+        return KeyValueDatabase(db, cache_size)
 
-    def __init__(self, db: plyvel.DB) -> None:
+    def __init__(self, db: plyvel.DB, cache_size: int = 0) -> None:
         """Constructor
 
         :param db: plyvel db instance
+        :param cache_size: memory budget of the read cache in bytes (0: disabled)
         """
         self._db = db
+        self._cache: Optional['KeyValueCache'] = KeyValueCache(cache_size) if cache_size > 0 else None
+        # The snapshot taken at the last commit boundary
+        self._snapshot: Optional['KeyValueSnapshot'] = None
+
+    @property
+    def cache(self) -> Optional['KeyValueCache']:
+        return self._cache
+
+    @property
+    def snapshot(self) -> Optional['KeyValueSnapshot']:
+        return self._snapshot
+
+    def take_snapshot(self) -> 'KeyValueSnapshot':
+        """Replace the current snapshot with a new one
+        It should be called only at commit boundaries on the thread which writes data to this db
+
+        The replaced snapshot is released when no context refers to it anymore
+        :return: new snapshot
+        """
+        generation: int = self._cache.generation if self._cache is not None else 0
+        self._snapshot = KeyValueSnapshot(self, self._db.snapshot(), generation)
+        return self._snapshot
 
     def get(self, key: bytes) -> bytes:
         """Get the value for the specified key.
@@ -64,7 +247,52 @@ class KeyValueDatabase(object):
         :param key: (bytes): key to retrieve
         :return: value for the specified key, or None if not found
         """
-        return self._db.get(key)
+        if self._cache is None:
+            return self._db.get(key)
+
+        hit, value, generation = self._cache.get(key)
+        if not hit:
+            value = self._db.get(key)
+            self._cache.put(key, value, generation)
+
+        return value
+
+    def get_many(self, keys: Iterable[bytes]) -> List[Optional[bytes]]:
+        """Get the values for the specified keys at once.
+
+        The keys which are not cached are read from one plyvel snapshot,
+        so their values are consistent with each other
+
+        :param keys: keys to retrieve
+        :return: values in the same order as keys, None for the keys which are not found
+        """
+        keys: list = list(keys)
+        values: List[Optional[bytes]] = [None] * len(keys)
+        cache: Optional['KeyValueCache'] = self._cache
+        generation: int = cache.generation if cache is not None else 0
+
+        missing_indexes: List[int] = []
+        for i, key in enumerate(keys):
+            if cache is not None:
+                hit, value, _ = cache.get(key)
+                if hit:
+                    values[i] = value
+                    continue
+            missing_indexes.append(i)
+
+        if len(missing_indexes) == 1:
+            i: int = missing_indexes[0]
+            values[i] = self._db.get(keys[i])
+        elif len(missing_indexes) > 1:
+            with self._db.snapshot() as snapshot:
+                for i in missing_indexes:
+                    values[i] = snapshot.get(keys[i])
+
+        if cache is not None:
+            for i in missing_indexes:
+                cache.put(keys[i], values[i], generation)
+
+        return values
 
     def put(self, key: bytes, value: bytes) -> None:
         """Set a value for the specified key.
@@ -74,6 +302,9 @@ class KeyValueDatabase(object):
         """
         self._db.put(key, value)
 
+        if self._cache is not None:
+            self._cache.invalidate((key,))
+
     def delete(self, key: bytes) -> None:
         """Delete the key/value pair for the specified key.
 
@@ -81,9 +312,19 @@ class KeyValueDatabase(object):
         """
         self._db.delete(key)
 
+        if self._cache is not None:
+            self._cache.invalidate((key,))
+
     def close(self) -> None:
         """Close the database.
         """
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+        if self._cache is not None:
+            self._cache.clear()
+
         if self._db:
             self._db.close()
             self._db = None
@@ -111,6 +352,8 @@ class KeyValueDatabase(object):
         if it is None:
             return size
 
+        keys = []
+
         with self._db.write_batch() as wb:
             for key, value in it:
                 if value:
@@ -118,8 +361,12 @@ class KeyValueDatabase(object):
                 else:
                     wb.delete(key)
 
+                keys.append(key)
                 size += 1
 
+        if self._cache is not None:
+            self._cache.invalidate(keys)
+
         return size
 
 
@@ -202,11 +449,54 @@ class ContextDatabase(object):
         """
         context_type = context.type
 
-        if context_type in (IconScoreContextType.DIRECT, IconScoreContextType.QUERY):
+        if context_type == IconScoreContextType.DIRECT:
             return self.key_value_db.get(key)
+        elif context_type == IconScoreContextType.QUERY:
+            return self._get_from_state_db(context, key)
         else:
             return self.get_from_batch(context, key)
 
+    def get_many(self, context: Optional['IconScoreContext'], keys: Iterable[bytes]) -> List[Optional[bytes]]:
+        """Returns values indicated by keys from batch or StateDB at once
+
+        :param context:
+        :param keys:
+        :return: values in the same order as keys
+        """
+        context_type = context.type
+
+        if context_type == IconScoreContextType.DIRECT:
+            return self.key_value_db.get_many(keys)
+        elif context_type == IconScoreContextType.QUERY:
+            return self._get_many_from_state_db(context, keys)
+        else:
+            return self.get_many_from_batch(context, keys)
+
+    def _get_from_state_db(self,
+                           context: 'IconScoreContext',
+                           key: bytes) -> bytes:
+        """Returns a value for a given key from the snapshot which the context is pinned to
+        If the context is not pinned to any snapshot of this db, read the latest state
+
+        :param context:
+        :param key:
+        :return: a value for a given key
+        """
+        snapshot: Optional['KeyValueSnapshot'] = context.snapshot
+        if snapshot is not None and snapshot.db is self.key_value_db:
+            return snapshot.get(key)
+
+        return self.key_value_db.get(key)
+
+    def _get_many_from_state_db(self,
+                                context: 'IconScoreContext',
+                                keys: Iterable[bytes]) -> List[Optional[bytes]]:
+        snapshot: Optional['KeyValueSnapshot'] = context.snapshot
+        if snapshot is not None and snapshot.db is self.key_value_db:
+            return snapshot.get_many(keys)
+
+        return self.key_value_db.get_many(keys)
+
     def get_from_batch(self,
                        context: 'IconScoreContext',
                        key: bytes) -> bytes:
@@ -214,22 +504,73 @@ class ContextDatabase(object):
 
         Search order
         1. TransactionBatch
-        2. Current BlockBatch
-        3. Prev BlockBatch
-        4. StateDB
+        2. Current BlockBatch + Prev BlockBatches (merged into BlockBatch.overlay)
+        3. StateDB
+
+        A value which is not changed by the current block yet is kept as a pre-image
+        in order to write a backup file on commit without reading stateDB again
 
         :param context:
         :param key:
 
         :return: a value for a given key
         """
-        # Find the value from tx_batch, block_batch and prev_block_batches with a given key
-        for batch in context.get_batches():
-            if key in batch:
-                return batch[key].value
+        batch_value: Optional['BatchValue'] = context.tx_batch[key]
+        if batch_value is not None:
+            return batch_value.value
+
+        block_batch: 'BlockBatch' = context.block_batch
+        batch_value = block_batch.overlay.get(key)
+        if batch_value is None:
+            # get value from state_db
+            value: Optional[bytes] = self._get_from_state_db(context, key)
+        elif key in block_batch:
+            return batch_value.value
+        else:
+            value: Optional[bytes] = batch_value.value
 
-        # get value from state_db
-        return self.key_value_db.get(key)
+        block_batch.set_pre_image(key, value)
+        return value
+
+    def get_many_from_batch(self,
+                            context: 'IconScoreContext',
+                            keys: Iterable[bytes]) -> List[Optional[bytes]]:
+        """Returns values for given keys in the same way as get_from_batch()
+        The keys which are not found in batches are read from StateDB at once
+
+        :param context:
+        :param keys:
+        :return: values in the same order as keys
+        """
+        keys: list = list(keys)
+        values: List[Optional[bytes]] = [None] * len(keys)
+        block_batch: 'BlockBatch' = context.block_batch
+
+        missing_indexes: List[int] = []
+        for i, key in enumerate(keys):
+            batch_value: Optional['BatchValue'] = context.tx_batch[key]
+            if batch_value is not None:
+                values[i] = batch_value.value
+                continue
+
+            batch_value = block_batch.overlay.get(key)
+            if batch_value is None:
+                missing_indexes.append(i)
+                continue
+
+            values[i] = batch_value.value
+            if key not in block_batch:
+                block_batch.set_pre_image(key, batch_value.value)
+
+        if missing_indexes:
+            state_values: List[Optional[bytes]] = \
+                self._get_many_from_state_db(context, [keys[i] for i in missing_indexes])
+
+            for i, value in zip(missing_indexes, state_values):
+                values[i] = value
+                block_batch.set_pre_image(keys[i], value)
+
+        return values
 
     @staticmethod
     def _check_tx_batch_value(context: Optional['IconScoreContext'],
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from ..icon_constant import IconScoreContextType
+
+if TYPE_CHECKING:
+    from ..iconscore.icon_score_context import IconScoreContext
+
+
+class BlockDecodeCache(object):
+    """Keeps the objects decoded from stateDB values during the block being invoked
+
+    A cached object is used only while the value in db is the same as the one it is decoded from.
+    As the value is read through tx_batch and block_batch,
+    the cache follows enter_call(), revert_call() and leave_call() of tx_batch.
+
+    Only the invoke thread uses the cache and it is reset whenever a new block is invoked.
+    Cached objects have to provide copy() because callers get a copy of them to change.
+    """
+
+    def __init__(self):
+        # key: db key, value: (bytes read from db, decoded object)
+        self._cache: Dict[bytes, Tuple[bytes, Any]] = {}
+        self._block_height: int = -1
+
+    def get(self,
+            context: Optional['IconScoreContext'],
+            key: bytes,
+            value: bytes,
+            from_bytes: Callable[[bytes], Any]) -> Any:
+        """Returns the object decoded from a value read from db
+
+        :param context:
+        :param key: db key
+        :param value: the value of key read from db
+        :param from_bytes: decodes value when there is no cached object for it
+        :return: the decoded object which the caller can change
+        """
+        cache: Optional[dict] = self._get_cache(context)
+        if cache is None:
+            return from_bytes(value)
+
+        cached: Optional[tuple] = cache.get(key)
+        if cached is None or cached[0] != value:
+            cached = value, from_bytes(value)
+            cache[key] = cached
+
+        return cached[1].copy()
+
+    def put(self, context: Optional['IconScoreContext'], key: bytes, value: bytes, obj: Any):
+        """Caches the object which has just been written to db not to decode it again in the same block
+
+        :param context:
+        :param key: db key
+        :param value: the value of key written to db
+        :param obj: the object encoded to value which is not changed after this call
+        """
+        cache: Optional[dict] = self._get_cache(context)
+        if cache is not None:
+            cache[key] = value, obj
+
+    def clear(self):
+        self._cache.clear()
+        self._block_height = -1
+
+    def _get_cache(self, context: Optional['IconScoreContext']) -> Optional[dict]:
+        if context is None or context.type != IconScoreContextType.INVOKE:
+            return None
+
+        if self._block_height != context.block.height:
+            self.clear()
+            self._block_height = context.block.height
+
+        return self._cache
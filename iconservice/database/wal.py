@@ -138,7 +138,7 @@ class IissWAL(WALogable):
                 key: bytes = iiss_data.make_key(tx_index)
             else:
                 key: bytes = iiss_data.make_key()
-            value: bytes = iiss_data.make_value()
+            value: bytes = iiss_data.get_encoded_value()
             yield key, value
 
         if tx_index > self._tx_index:
@@ -167,11 +167,26 @@ class WriteAheadLogWriter(object):
     Every number is written in big endian format
     """
 
-    def __init__(self, revision: int, max_log_count: int, block: 'Block', instant_block_hash: bytes):
+    def __init__(self,
+                 revision: int,
+                 max_log_count: int,
+                 block: 'Block',
+                 instant_block_hash: bytes,
+                 group_sync: bool = False):
+        """Constructor
+
+        :param revision:
+        :param max_log_count:
+        :param block:
+        :param instant_block_hash:
+        :param group_sync: If True, flush_state() does not fsync a state change
+            and it is synced to disk together with the next flush()
+        """
         Logger.debug(tag=TAG,
                      msg=f"__init__(revision={revision}, "
                          f"max_log_out={max_log_count}, "
-                         f"block={block} start")
+                         f"block={block}, "
+                         f"group_sync={group_sync}) start")
 
         self._magic_key = _MAGIC_KEY
         self._version = _FILE_VERSION
@@ -182,6 +197,7 @@ class WriteAheadLogWriter(object):
 
         self._instant_block_hash = instant_block_hash
         self._block = block
+        self._group_sync: bool = group_sync
         self._fp = None
 
         Logger.debug(tag=TAG, msg="__init__() end")
@@ -191,7 +207,8 @@ class WriteAheadLogWriter(object):
             raise InternalServiceErrorException("WAL file pointer is not None")
 
         try:
-            self._fp = open(path, "wb")
+            # Unbuffered: every log is written with a single system call without being copied
+            self._fp = open(path, "wb", buffering=0)
             self._write_header()
             self._write_block()
         except:
@@ -222,6 +239,16 @@ class WriteAheadLogWriter(object):
             fp.flush()
             os.fsync(fp.fileno())
 
+    def flush_state(self):
+        """Flush a state change written by write_state()
+
+        In group sync mode, a state change is only handed over to OS without fsync.
+        If it is lost by a power failure, the recovery with this WAL file
+        repeats the steps after the last synced state, which are idempotent
+        """
+        if not self._group_sync:
+            self.flush()
+
     def close(self):
         if self._fp:
             self._fp.close()
@@ -237,32 +264,36 @@ class WriteAheadLogWriter(object):
         return ret
 
     def write_walogable(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
-        self._fp.seek(0, 2)
-        start_offset: int = self._fp.tell()
-
-        size = 0
-        self._write_uint32(size)
-
+        # Encode all records into the internal buffer of packer
+        packer = msgpack.Packer(autoreset=False)
         for key, value in it:
-            size += self._write_key_value(key, value)
+            assert isinstance(key, bytes)
+            packer.pack([key, value])
 
-        # Return to the WALogable start offset, writing its data size
-        self._fp.seek(-size - 4, 1)
-        self._write_uint32(size)
+        data: memoryview = packer.getbuffer()
+        size: int = len(data)
+
+        start_offset: int = self._fp.seek(0, 2)
+        self._write_all(_uint32_to_bytes(size), data)
+        data.release()
 
         self._write_log_start_offset(self._log_count, start_offset)
         self._write_log_count()
 
         return size
 
-    def _write_key_value(self, key: bytes, value: bytes) -> int:
-        assert isinstance(key, bytes)
-
-        data: bytes = msgpack.packb([key, value])
-        size = self._fp.write(data)
-        assert size == len(data)
-
-        return size
+    def _write_all(self, *buffers):
+        """Write buffers to the current position of a file at once
+        """
+        fd: int = self._fp.fileno()
+        size: int = sum(len(buf) for buf in buffers)
+
+        written: int = os.writev(fd, buffers)
+        if written < size:
+            # Write the rest if the vectored write is partially done
+            data: memoryview = memoryview(b"".join(buffers))
+            while written < size:
+                written += os.write(fd, data[written:])
 
     def write_state(self, state: int, add: bool = False):
         offset = _OFFSET_STATE
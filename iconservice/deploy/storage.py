@@ -21,9 +21,11 @@ from typing import TYPE_CHECKING, Optional, Tuple
 from ..base.ComponentBase import StorageBase
 from ..base.address import Address, ICON_EOA_ADDRESS_BYTES_SIZE, ICON_CONTRACT_ADDRESS_BYTES_SIZE
 from ..base.exception import InvalidParamsException, AccessDeniedException
+from ..database.decode_cache import BlockDecodeCache
 from ..icon_constant import DEFAULT_BYTE_SIZE, Revision, ZERO_TX_HASH, DeployState, DeployType
 
 if TYPE_CHECKING:
+    from ..database.db import ContextDatabase
     from ..iconscore.icon_score_context import IconScoreContext
 
 
@@ -158,6 +160,10 @@ class IconScoreDeployInfo(object):
     def score_address(self):
         return self._score_address
 
+    def copy(self) -> 'IconScoreDeployInfo':
+        return IconScoreDeployInfo(
+            self._score_address, self.deploy_state, self.owner, self.current_tx_hash, self.next_tx_hash)
+
     @staticmethod
     def from_bytes(buf: bytes) -> 'IconScoreDeployInfo':
         """Create IconScoreDeployInfo object from bytes data
@@ -200,6 +206,13 @@ class Storage(StorageBase):
     _DEPLOY_STORAGE_DEPLOY_INFO_PREFIX = _DEPLOY_STORAGE_PREFIX + b'di|'
     _DEPLOY_STORAGE_DEPLOY_TX_PARAMS_PREFIX = _DEPLOY_STORAGE_PREFIX + b'dtp|'
 
+    def __init__(self, db: 'ContextDatabase'):
+        super().__init__(db)
+        self._deploy_info_cache = BlockDecodeCache()
+
+    def rollback(self, context: 'IconScoreContext', block_height: int, block_hash: bytes):
+        self._deploy_info_cache.clear()
+
     def put_deploy_info_and_tx_params(self,
                                       context: 'IconScoreContext',
                                       score_address: 'Address',
@@ -271,6 +284,7 @@ class Storage(StorageBase):
         value: bytes = deploy_info.to_bytes()
 
         self._db.put(context, key, value)
+        self._deploy_info_cache.put(context, key, value, deploy_info.copy())
 
     def get_deploy_info(self, context: Optional['IconScoreContext'], score_address: 'Address') \
             -> Optional['IconScoreDeployInfo']:
@@ -281,7 +295,7 @@ class Storage(StorageBase):
         if data is None:
             return None
 
-        return IconScoreDeployInfo.from_bytes(data)
+        return self._deploy_info_cache.get(context, key, data, IconScoreDeployInfo.from_bytes)
 
     def put_deploy_tx_params(self, context: 'IconScoreContext', deploy_tx_params: 'IconScoreDeployTXParams') -> None:
         """
@@ -22,7 +22,8 @@ from .icon_constant import (
     ConfigKey, TERM_PERIOD, IISS_DAY_BLOCK, PREP_MAIN_PREPS,
     PREP_MAIN_AND_SUB_PREPS, PENALTY_GRACE_PERIOD, LOW_PRODUCTIVITY_PENALTY_THRESHOLD,
     BLOCK_VALIDATION_PENALTY_THRESHOLD, BACKUP_FILES, BLOCK_INVOKE_TIMEOUT_S,
-    IISS_INITIAL_IREP, PREP_REGISTRATION_FEE, UNSTAKE_SLOT_MAX)
+    IISS_INITIAL_IREP, PREP_REGISTRATION_FEE, UNSTAKE_SLOT_MAX, STATE_DB_CACHE_SIZE,
+    QUERY_THREAD_COUNT, VALIDATE_THREAD_COUNT)
 
 _TAG = "CFG"
 ConfigValue = Union[bool, dict, float, int, str]
@@ -41,6 +42,9 @@ default_icon_config = {
     ConfigKey.AMQP_TARGET: "127.0.0.1",
     ConfigKey.BUILTIN_SCORE_OWNER: "hxebf3a409845cd09dcb5af31ed5be5e34e2af9433",
     ConfigKey.IPC_TIMEOUT: 10,
+    ConfigKey.IPC_LOG_INTERVAL: 1,
+    ConfigKey.ISCORE_QUERY_CACHE_TTL: 0,
+    ConfigKey.ISCORE_CLAIM_PIPELINE: False,
     ConfigKey.SERVICE: {
         ConfigKey.SERVICE_FEE: False,
         ConfigKey.SERVICE_AUDIT: False,
@@ -77,6 +81,11 @@ default_icon_config = {
     ConfigKey.BLOCK_INVOKE_TIMEOUT: BLOCK_INVOKE_TIMEOUT_S,
     ConfigKey.TBEARS_MODE: False,
     ConfigKey.UNSTAKE_SLOT_MAX: UNSTAKE_SLOT_MAX,
+    ConfigKey.STATE_DB_CACHE_SIZE: STATE_DB_CACHE_SIZE,
+    ConfigKey.QUERY_THREAD_COUNT: QUERY_THREAD_COUNT,
+    ConfigKey.VALIDATE_THREAD_COUNT: VALIDATE_THREAD_COUNT,
+    ConfigKey.WAL_GROUP_SYNC: False,
+    ConfigKey.SCORE_INSTANCE_POOL: False,
 }
 
 
@@ -183,6 +183,9 @@ class ConfigKey:
     PREP_MAIN_PREPS = 'mainPRepCount'
     PREP_MAIN_AND_SUB_PREPS = 'mainAndSubPRepCount'
     IPC_TIMEOUT = 'ipcTimeout'
+    IPC_LOG_INTERVAL = 'ipcLogInterval'
+    ISCORE_QUERY_CACHE_TTL = 'iscoreQueryCacheTTL'
+    ISCORE_CLAIM_PIPELINE = 'iscoreClaimPipeline'
 
     # log
     LOG = 'log'
@@ -229,6 +232,21 @@ class ConfigKey:
 
     UNSTAKE_SLOT_MAX = "unstakeSlotMax"
 
+    # The memory budget of the read cache for state_db in bytes (0: disabled)
+    STATE_DB_CACHE_SIZE = "stateDbCacheSize"
+
+    # The number of worker threads for each of query and status requests
+    QUERY_THREAD_COUNT = "queryThreadCount"
+
+    # The number of worker threads for transaction validation requests
+    VALIDATE_THREAD_COUNT = "validateThreadCount"
+
+    # If True, the state changes in WAL file are not fsynced one by one on commit
+    WAL_GROUP_SYNC = "walGroupSync"
+
+    # If True, a SCORE instance is reused across calls if it is safe to do so
+    SCORE_INSTANCE_POOL = "scoreInstancePool"
+
     # The list of items(address, unstake, unstake_block_height)
     # containing invalid expired unstakes to remove
     INVALID_EXPIRED_UNSTAKES_PATH = "invalidExpiredUnstakesPath"
@@ -362,6 +380,12 @@ BACKUP_FILES = 10
 
 BLOCK_INVOKE_TIMEOUT_S = 15
 
+STATE_DB_CACHE_SIZE = 0
+
+QUERY_THREAD_COUNT = 1
+
+VALIDATE_THREAD_COUNT = 1
+
 
 class RCStatus(IntEnum):
     NOT_READY = 0
@@ -15,7 +15,7 @@
 import asyncio
 import json
 from concurrent.futures.thread import ThreadPoolExecutor
-from typing import Any, TYPE_CHECKING, Optional
+from typing import Any, TYPE_CHECKING, Optional, List
 
 from earlgrey import message_queue_task, MessageQueueStub, MessageQueueService
 
@@ -26,7 +26,7 @@ from iconservice.base.exception import ExceptionCode, IconServiceBaseException,
     FatalException, ServiceNotReadyException
 from iconservice.base.type_converter import TypeConverter, ParamType
 from iconservice.base.type_converter_templates import ConstantKeys
-from iconservice.icon_constant import EnableThreadFlag, ENABLE_THREAD_FLAG, RPCMethod
+from iconservice.icon_constant import EnableThreadFlag, ENABLE_THREAD_FLAG, RPCMethod, ConfigKey
 from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.utils import check_error_response, to_camel_case, BytesToHexJSONEncoder, bytes_to_hex
 
@@ -60,12 +60,19 @@ class IconScoreInnerTask(object):
         self._icon_service_engine = IconServiceEngine()
         self._open()
 
+        # Query requests only read the committed states with QUERY contexts
+        # and each thread has its own context stack, so they can be processed concurrently
+        query_thread_count: int = conf[ConfigKey.QUERY_THREAD_COUNT]
+        Logger.info(tag=_TAG, msg=f"query_thread_count={query_thread_count}")
+        validate_thread_count: int = conf[ConfigKey.VALIDATE_THREAD_COUNT]
+        Logger.info(tag=_TAG, msg=f"validate_thread_count={validate_thread_count}")
+
         self._thread_pool = {
             THREAD_INVOKE: ThreadPoolExecutor(1),
-            THREAD_STATUS: ThreadPoolExecutor(1),
-            THREAD_QUERY: ThreadPoolExecutor(1),
+            THREAD_STATUS: ThreadPoolExecutor(query_thread_count),
+            THREAD_QUERY: ThreadPoolExecutor(query_thread_count),
             THREAD_ESTIMATE: ThreadPoolExecutor(1),
-            THREAD_VALIDATE: ThreadPoolExecutor(1)
+            THREAD_VALIDATE: ThreadPoolExecutor(validate_thread_count)
         }
 
     def _open(self):
@@ -447,6 +454,84 @@ class IconScoreInnerTask(object):
         self._icon_service_engine.clear_context_stack()
         return response
 
+    @message_queue_task
+    async def validate_transactions(self, request: dict):
+        """Validate a batch of transactions before putting them into transaction pool
+
+        :param request: {"transactions": [validate_transaction request, ...]}
+        :return: the list of validate_transaction responses in request order
+        """
+        try:
+            self._check_icon_service_ready()
+        except ServiceNotReadyException as e:
+            return [MakeResponse.make_error_response(e.code, str(e)) for _ in request[ConstantKeys.TRANSACTIONS]]
+
+        if self._is_thread_flag_on(EnableThreadFlag.VALIDATE):
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._thread_pool[THREAD_VALIDATE],
+                                              self._validate_transactions, request)
+        else:
+            return self._validate_transactions(request)
+
+    def _validate_transactions(self, request: dict) -> List[dict]:
+        tx_requests: List[dict] = request[ConstantKeys.TRANSACTIONS]
+        Logger.info(tag=_TAG, msg=f'validate_transactions Request: count={len(tx_requests)}')
+
+        responses: List[Optional[dict]] = [None] * len(tx_requests)
+        indexes: List[int] = []
+        converted_requests: List[dict] = []
+        origin_requests: List[dict] = []
+
+        for i, tx_request in enumerate(tx_requests):
+            try:
+                converted_requests.append(TypeConverter.convert(tx_request, ParamType.VALIDATE_TRANSACTION))
+                origin_requests.append(tx_request)
+                indexes.append(i)
+            except FatalException as e:
+                self._log_exception(e, _TAG)
+                responses[i] = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+            except IconServiceBaseException as icon_e:
+                self._log_exception(icon_e, _TAG)
+                responses[i] = MakeResponse.make_error_response(icon_e.code, icon_e.message)
+            except Exception as e:
+                self._log_exception(e, _TAG)
+                responses[i] = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+
+        try:
+            if len(converted_requests) > 0:
+                results = self._icon_service_engine.validate_transactions(converted_requests, origin_requests)
+                for i, result in zip(indexes, results):
+                    responses[i] = self._make_validate_response(result)
+        except FatalException as e:
+            self._log_exception(e, _TAG)
+            for i in indexes:
+                responses[i] = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+        except IconServiceBaseException as icon_e:
+            self._log_exception(icon_e, _TAG)
+            for i in indexes:
+                responses[i] = MakeResponse.make_error_response(icon_e.code, icon_e.message)
+        except Exception as e:
+            self._log_exception(e, _TAG)
+            for i in indexes:
+                responses[i] = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+
+        self._icon_service_engine.clear_context_stack()
+        return responses
+
+    def _make_validate_response(self, result: Optional[BaseException]) -> dict:
+        """Make the response of a transaction from its result of IconServiceEngine.validate_transactions
+
+        :param result: None for a valid transaction or the exception raised for an invalid one
+        """
+        if result is None:
+            return MakeResponse.make_response(ExceptionCode.OK)
+
+        self._log_exception(result, _TAG)
+        if isinstance(result, IconServiceBaseException):
+            return MakeResponse.make_error_response(result.code, result.message)
+        else:
+            return MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(result))
+
     @message_queue_task
     async def change_block_hash(self, _params):
         try:
@@ -15,6 +15,7 @@
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from enum import IntEnum
 from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Union, Any
@@ -96,6 +97,7 @@ from .utils.timer import Timer
 from .utils.test_env import is_under_testing
 
 if TYPE_CHECKING:
+    from .database.db import KeyValueCache
     from .iconscore.icon_score_event_log import EventLog
     from .prep.data import Term
 
@@ -125,6 +127,9 @@ class IconServiceEngine(ContextContainer):
         self._wal_reader: Optional['WriteAheadLogReader'] = None
         self._backup_manager: Optional[BackupManager] = None
         self._backup_cleaner: Optional[BackupCleaner] = None
+        # Runs the commit tasks which are not on the critical path in order
+        self._commit_executor: Optional[ThreadPoolExecutor] = None
+        self._wal_group_sync: bool = False
         self._conf: Optional[Dict[str, Union[str, int]]] = None
         self._block_invoke_timeout_s: int = BLOCK_INVOKE_TIMEOUT_S
         self._log_dir: str = "."
@@ -166,18 +171,22 @@ class IconServiceEngine(ContextContainer):
         os.makedirs(backup_root_path, exist_ok=True)
 
         # Share one context db with all SCORE
-        ContextDatabaseFactory.open(state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB)
+        ContextDatabaseFactory.open(state_db_root_path,
+                                    ContextDatabaseFactory.Mode.SINGLE_DB,
+                                    conf[ConfigKey.STATE_DB_CACHE_SIZE])
         self._state_db_root_path = state_db_root_path
         self._rc_data_path = rc_data_path
         self._backup_root_path = backup_root_path
 
         self._icx_context_db = ContextDatabaseFactory.create_by_name(ICON_DEX_DB_NAME)
-        self._context_factory = IconScoreContextFactory()
+        self._context_factory = IconScoreContextFactory(self._icx_context_db.key_value_db)
 
         self._deposit_handler = DepositHandler()
         self._icon_pre_validator = IconPreValidator()
         self._backup_manager = BackupManager(backup_root_path, rc_data_path)
         self._backup_cleaner = BackupCleaner(backup_root_path, conf[ConfigKey.BACKUP_FILES])
+        self._commit_executor = ThreadPoolExecutor(max_workers=1)
+        self._wal_group_sync = conf[ConfigKey.WAL_GROUP_SYNC]
 
         IconScoreClassLoader.init(score_root_path)
         IconScoreContext.score_root_path = score_root_path
@@ -193,6 +202,7 @@ class IconServiceEngine(ContextContainer):
         IconScoreContext.log_level = conf[ConfigKey.LOG][ConfigKey.LOG_LEVEL]
         IconScoreContext.precommitdata_log_flag = conf[ConfigKey.PRECOMMIT_DATA_LOG_FLAG]
         IconScoreContext.unstake_slot_max = conf[ConfigKey.UNSTAKE_SLOT_MAX]
+        IconScoreContext.score_instance_pool = conf[ConfigKey.SCORE_INSTANCE_POOL]
         self._init_component_context()
 
         # Recover incomplete state on wal and rollback process
@@ -221,6 +231,9 @@ class IconServiceEngine(ContextContainer):
                                      conf[ConfigKey.LOW_PRODUCTIVITY_PENALTY_THRESHOLD],
                                      conf[ConfigKey.BLOCK_VALIDATION_PENALTY_THRESHOLD],
                                      conf[ConfigKey.IPC_TIMEOUT],
+                                     conf[ConfigKey.IPC_LOG_INTERVAL],
+                                     conf[ConfigKey.ISCORE_QUERY_CACHE_TTL],
+                                     conf[ConfigKey.ISCORE_CLAIM_PIPELINE],
                                      conf[ConfigKey.ICON_RC_DIR_PATH],
                                      conf[ConfigKey.ICON_RC_MONITOR])
 
@@ -236,6 +249,9 @@ class IconServiceEngine(ContextContainer):
         self._precommit_data_writer = PrecommitDataWriter(log_dir)
         self._log_dir = log_dir
 
+        # Queries read the committed states from this snapshot
+        self._icx_context_db.key_value_db.take_snapshot()
+
     def _init_component_context(self):
         engine: 'ContextEngine' = ContextEngine(deploy=DeployEngine(),
                                                 fee=FeeEngine(),
@@ -278,6 +294,9 @@ class IconServiceEngine(ContextContainer):
                                 low_productivity_penalty_threshold: int,
                                 block_validation_penalty_threshold: int,
                                 ipc_timeout: int,
+                                ipc_log_interval: int,
+                                iscore_query_cache_ttl: float,
+                                iscore_claim_pipeline: bool,
                                 icon_rc_path: str,
                                 icon_rc_monitor: bool):
         # storages MUST be prepared prior to engines because engines use them on open()
@@ -299,6 +318,9 @@ class IconServiceEngine(ContextContainer):
                                           rc_data_path,
                                           rc_socket_path,
                                           ipc_timeout,
+                                          ipc_log_interval,
+                                          iscore_query_cache_ttl,
+                                          iscore_claim_pipeline,
                                           icon_rc_path,
                                           icon_rc_monitor)
         IconScoreContext.engine.prep.open(context,
@@ -379,6 +401,9 @@ class IconServiceEngine(ContextContainer):
             IconScoreClassLoader.close(context.score_root_path)
         finally:
             self._pop_context()
+            if self._commit_executor is not None:
+                self._commit_executor.shutdown(wait=True)
+                self._commit_executor = None
             ContextDatabaseFactory.close()
             self._clear_context()
 
@@ -453,75 +478,83 @@ class IconServiceEngine(ContextContainer):
                                          prev_block_generator,
                                          prev_block_votes)
 
-        if block.height == 0:
-            # Assume that there is only one tx in genesis_block
-            tx_result = self._invoke_genesis(context, tx_requests[0], 0)
-            block_result.append(tx_result)
-            context.block_batch.update(context.tx_batch)
-            context.tx_batch.clear()
-        else:
-            one_tx_timer = Timer()
-            tx_timer = Timer()
-            tx_timer.start()
-
-            for index, tx_request in enumerate(tx_requests):
-                one_tx_timer.start()
-
-                tx_hash: Optional[bytes] = tx_request["params"].get("txHash")
-                Logger.debug(_TAG, f"INVOKE tx: tx_hash={bytes_to_hex(tx_hash)} {tx_request}")
-
-                # Adjust the number of transactions in a block to make sure that
-                # a leader can broadcast a block candidate to validators in a specific period.
-                if is_block_editable and not self._continue_to_invoke(tx_request, tx_timer):
-                    Logger.info(
-                        tag=_TAG,
-                        msg=f"Stop to invoke remaining transactions: {index} / {len(tx_requests)}")
-                    break
-
-                if index == BASE_TRANSACTION_INDEX and context.is_decentralized():
-                    if not tx_request['params'].get('dataType') == "base":
-                        raise InvalidBaseTransactionException(
-                            "Invalid block: first transaction must be an base transaction")
-                    tx_result = self._invoke_base_request(context, tx_request, is_block_editable)
-                else:
-                    tx_result = self._invoke_request(context, tx_request, index)
-
-                self._log_step_trace(context)
+        context.engine.iiss.start_claim_pipeline(context, tx_requests)
+        try:
+            if block.height == 0:
+                # Assume that there is only one tx in genesis_block
+                tx_result = self._invoke_genesis(context, tx_requests[0], 0)
                 block_result.append(tx_result)
-                context.update_batch()
+                context.block_batch.update(context.tx_batch)
+                context.tx_batch.clear()
+            else:
+                one_tx_timer = Timer()
+                tx_timer = Timer()
+                tx_timer.start()
+
+                for index, tx_request in enumerate(tx_requests):
+                    one_tx_timer.start()
+
+                    tx_hash: Optional[bytes] = tx_request["params"].get("txHash")
+                    Logger.debug(_TAG, f"INVOKE tx: tx_hash={bytes_to_hex(tx_hash)} {tx_request}")
+
+                    # Adjust the number of transactions in a block to make sure that
+                    # a leader can broadcast a block candidate to validators in a specific period.
+                    if is_block_editable and not self._continue_to_invoke(tx_request, tx_timer):
+                        Logger.info(
+                            tag=_TAG,
+                            msg=f"Stop to invoke remaining transactions: {index} / {len(tx_requests)}")
+                        break
+
+                    if index == BASE_TRANSACTION_INDEX and context.is_decentralized():
+                        if not tx_request['params'].get('dataType') == "base":
+                            raise InvalidBaseTransactionException(
+                                "Invalid block: first transaction must be an base transaction")
+                        tx_result = self._invoke_base_request(context, tx_request, is_block_editable)
+                    else:
+                        tx_result = self._invoke_request(context, tx_request, index)
 
-                # for migration governance SCORE
-                context.engine.inv.update_inv_container_by_result(context, tx_result)
+                    self._log_step_trace(context)
+                    block_result.append(tx_result)
+                    context.update_batch()
 
-                if context.is_revision_changed(Revision.IISS.value):
-                    context.revision_changed_flag |= RevisionChangedFlag.GENESIS_IISS_CALC
+                    # for migration governance SCORE
+                    context.engine.inv.update_inv_container_by_result(context, tx_result)
 
-                if context.revision >= Revision.IISS.value:
-                    context.block_batch.block.cumulative_fee += tx_result.step_price * tx_result.step_used
+                    if context.is_revision_changed(Revision.IISS.value):
+                        context.revision_changed_flag |= RevisionChangedFlag.GENESIS_IISS_CALC
 
-                if context.is_revision_changed(Revision.FIX_BALANCE_BUG.value):
-                    self._run_unstake_patcher(context)
+                    if context.revision >= Revision.IISS.value:
+                        context.block_batch.block.cumulative_fee += tx_result.step_price * tx_result.step_used
 
-                if tx_request["params"].get("dataType") == "call":
-                    data = tx_request["params"].get("data")
-                    if data:
-                        method: str = data.get("method", "EMPTY_METHOD")
-                    else:
-                        method: str = "NOT_SCORE_CALL"
-                else:
-                    method: str = "NOT_CALL_DATA_TYPE"
+                    if context.is_revision_changed(Revision.FIX_BALANCE_BUG.value):
+                        self._run_unstake_patcher(context)
 
-                Logger.info(
-                    tag=_TAG,
-                    msg=f"TX_END: "
-                        f"BH={tx_result.block_height} "
-                        f"txIndex={tx_result.tx_index} "
-                        f"to={tx_result.to} "
-                        f"method={method} "
-                        f"duration={one_tx_timer.duration}"
-                )
+                    if tx_request["params"].get("dataType") == "call":
+                        data = tx_request["params"].get("data")
+                        if data:
+                            method: str = data.get("method", "EMPTY_METHOD")
+                        else:
+                            method: str = "NOT_SCORE_CALL"
+                    else:
+                        method: str = "NOT_CALL_DATA_TYPE"
 
-                Logger.debug(tag=_TAG, msg=f"INVOKE txResult: {tx_result}")
+                    Logger.info(
+                        tag=_TAG,
+                        msg=f"TX_END: "
+                            f"BH={tx_result.block_height} "
+                            f"txIndex={tx_result.tx_index} "
+                            f"to={tx_result.to} "
+                            f"method={method} "
+                            f"duration={one_tx_timer.duration}"
+                    )
+
+                    Logger.debug(tag=_TAG, msg=f"INVOKE txResult: {tx_result}")
+        except BaseException:
+            # Claims sent ahead are reverted without hiding the exception which fails the block
+            context.engine.iiss.abort_claim_pipeline(context)
+            raise
+
+        context.engine.iiss.end_claim_pipeline(context)
 
         if self._check_end_block_height_of_calc(context):
             context.revision_changed_flag |= RevisionChangedFlag.IISS_CALC
@@ -1133,39 +1166,88 @@ class IconServiceEngine(ContextContainer):
         """
         assert self._get_context_stack_size() == 0
 
-        method = request['method']
-        assert method in ('icx_sendTransaction', 'debug_estimateStep')
-        assert 'params' in request
+        context = self._context_factory.create(IconScoreContextType.QUERY, self._get_last_block())
+        context.set_step_counter()
 
-        params: dict = request['params']
-        to: 'Address' = params.get('to')
+        try:
+            self._push_context(context)
+            self._validate_transaction(context, self._icon_pre_validator, request, origin_request)
+        finally:
+            self._pop_context()
+
+    def validate_transactions(self,
+                              requests: List[dict],
+                              origin_requests: List[dict]) -> List[Optional[BaseException]]:
+        """Validate a batch of JSON-RPC transaction requests
+        before putting them into transaction pool
+
+        All transactions are validated on the same context of the last block
+        and the balances and SCORE deploy info read during the validation are reused across the batch.
+        The result of each transaction is independent of the others in the batch
+
+        :param requests: JSON-RPC requests converted in IconInnerService
+        :param origin_requests: JSON-RPC original requests
+        :return: None for a valid transaction or the exception raised for an invalid one, in request order
+        """
+        assert self._get_context_stack_size() == 0
+        assert len(requests) == len(origin_requests)
 
         context = self._context_factory.create(IconScoreContextType.QUERY, self._get_last_block())
         context.set_step_counter()
+        pre_validator = IconPreValidator(use_cache=True)
 
-        origin_params = origin_request['params']
+        results: List[Optional[BaseException]] = []
 
         try:
             self._push_context(context)
 
-            step_price: int = context.step_counter.step_price
-            minimum_step: int = context.inv_container.step_costs.get(StepType.DEFAULT, 0)
+            for request, origin_request in zip(requests, origin_requests):
+                try:
+                    self._validate_transaction(context, pre_validator, request, origin_request)
+                    results.append(None)
+                except IconServiceBaseException as icon_e:
+                    results.append(icon_e)
+                except Exception as e:
+                    results.append(e)
+        finally:
+            self._pop_context()
 
-            if 'data' in params:
-                # minimum_step is the sum of
-                # default STEP cost and input STEP costs if data field exists
-                data = params['data']
-                input_size = get_input_data_size(context.revision, data)
-                minimum_step += input_size * context.inv_container.step_costs.get(StepType.INPUT, 0)
-            self._icon_pre_validator.origin_request_execute(origin_params, context.revision)
-            self._icon_pre_validator.execute(context, params, step_price, minimum_step)
+        return results
 
-            if to.is_contract:
-                # SCORE updating is not blocked by SCORE blacklist
-                IconScoreContextUtil.validate_score_blacklist(context, to)
+    @staticmethod
+    def _validate_transaction(context: 'IconScoreContext',
+                              pre_validator: 'IconPreValidator',
+                              request: dict,
+                              origin_request: dict):
+        method = request['method']
+        assert method in ('icx_sendTransaction', 'debug_estimateStep')
+        assert 'params' in request
 
-        finally:
-            self._pop_context()
+        params: dict = request['params']
+        to: 'Address' = params.get('to')
+        origin_params = origin_request['params']
+
+        step_price: int = context.step_counter.step_price
+        minimum_step: int = context.inv_container.step_costs.get(StepType.DEFAULT, 0)
+        input_size: Optional[int] = None
+
+        if 'data' in params:
+            # minimum_step is the sum of
+            # default STEP cost and input STEP costs if data field exists
+            data = params['data']
+            input_size = get_input_data_size(context.revision, data)
+            minimum_step += input_size * context.inv_container.step_costs.get(StepType.INPUT, 0)
+
+            # Below Revision.THREE, input data is measured in another way from the latest one
+            if context.revision < Revision.THREE.value:
+                input_size = None
+
+        pre_validator.origin_request_execute(origin_params, context.revision)
+        pre_validator.execute(context, params, step_price, minimum_step, input_size)
+
+        if to.is_contract:
+            # SCORE updating is not blocked by SCORE blacklist
+            IconScoreContextUtil.validate_score_blacklist(context, to)
 
     def _call(self,
               context: 'IconScoreContext',
@@ -1552,15 +1634,17 @@ class IconServiceEngine(ContextContainer):
         :param event_logs: The event logs
         :return: Bloom data
         """
-        logs_bloom = BloomFilter()
-
-        for event_log in event_logs:
-            logs_bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
-            for i, indexed_item in enumerate(event_log.indexed):
-                indexed_bytes = EventLogEmitter.get_ordered_bytes(i, indexed_item)
-                logs_bloom.add(indexed_bytes)
-
-        return logs_bloom
+        def _gen():
+            score_address = None
+            for event_log in event_logs:
+                # Event logs of a tx are mostly emitted by the same SCORE
+                if event_log.score_address != score_address:
+                    score_address = event_log.score_address
+                    yield EventLogEmitter.get_ordered_bytes(0xff, score_address)
+                for i, indexed_item in enumerate(event_log.indexed):
+                    yield EventLogEmitter.get_ordered_bytes(i, indexed_item)
+
+        return BloomFilter.from_iterable(_gen())
 
     @classmethod
     def _handle_icx_get_score_api(cls,
@@ -1584,6 +1668,10 @@ class IconServiceEngine(ContextContainer):
         if not bool(params) or params.get('filter'):
             last_block_status = self._make_last_block_status()
             response['lastBlock'] = last_block_status
+
+            cache: Optional['KeyValueCache'] = self._icx_context_db.key_value_db.cache
+            if cache is not None:
+                response['stateDbCache'] = cache.get_status()
         return response
 
     def _make_last_block_status(self) -> Optional[dict]:
@@ -1649,7 +1737,8 @@ class IconServiceEngine(ContextContainer):
         wal_writer.flush()
 
         # Backup the previous block state
-        self._backup_manager.run(
+        # A backup file is written on the commit worker while iiss_wal is being written to rc_db
+        backup_future = self._backup_manager.run(
             icx_db=self._icx_context_db.key_value_db,
             rc_db=context.storage.rc.key_value_db,
             revision=context.revision,
@@ -1657,21 +1746,25 @@ class IconServiceEngine(ContextContainer):
             block_batch=precommit_data.block_batch,
             iiss_wal=iiss_wal,
             is_calc_period_start_block=is_calc_period_start_block,
-            instant_block_hash=instant_block_hash)
+            instant_block_hash=instant_block_hash,
+            executor=self._commit_executor)
 
-        # Clean up the oldest backup file
-        self._backup_cleaner.run_on_commit(context.block.height)
+        # Clean up the oldest backup file on the commit worker after the backup above
+        self._commit_executor.submit(self._backup_cleaner.run_on_commit, context.block.height)
 
         # Write iiss_wal to rc_db
         standby_db_info: Optional['RewardCalcDBInfo'] = \
             self._process_iiss_commit(context, precommit_data, iiss_wal, is_calc_period_start_block)
         wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
-        wal_writer.flush()
+        wal_writer.flush_state()
+
+        # The previous states in state_db should be backed up before they are overwritten
+        backup_future.result()
 
         # Write state_wal to state_db
         self._process_state_commit(context, precommit_data, state_wal)
         wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
-        wal_writer.flush()
+        wal_writer.flush_state()
 
         # send IPC
         self._process_ipc(context, wal_writer, precommit_data, standby_db_info, instant_block_hash)
@@ -1711,7 +1804,8 @@ class IconServiceEngine(ContextContainer):
             WriteAheadLogWriter(precommit_data.revision,
                                 max_log_count=2,
                                 block=block,
-                                instant_block_hash=instant_block_hash)
+                                instant_block_hash=instant_block_hash,
+                                group_sync=self._wal_group_sync)
         wal_writer.open(wal_path)
 
         if is_calc_period_start_block:
@@ -1726,11 +1820,16 @@ class IconServiceEngine(ContextContainer):
                               context: 'IconScoreContext',
                               precommit_data: 'PrecommitData',
                               state_wal: 'StateWAL'):
+        self._icx_context_db.write_batch(context, state_wal)
+
+        # Pin the queries which start from now on to the newly committed states
+        # before they can see the new score mapper, last block and INV values
+        self._icx_context_db.key_value_db.take_snapshot()
+
         new_icon_score_mapper = precommit_data.score_mapper
         if new_icon_score_mapper:
             IconScoreContext.icon_score_mapper.update(new_icon_score_mapper)
 
-        self._icx_context_db.write_batch(context, state_wal)
         context.storage.icx.set_last_block(precommit_data.block_batch.block)
         context.engine.inv.commit(context, precommit_data)
         self._precommit_data_manager.commit(precommit_data.block_batch.block)
@@ -1782,7 +1881,7 @@ class IconServiceEngine(ContextContainer):
         context.engine.iiss.send_commit(
             precommit_data.block.height, commit_block_hash)
         wal_writer.write_state(WALState.SEND_COMMIT_BLOCK.value, add=True)
-        wal_writer.flush()
+        wal_writer.flush_state()
 
         if standby_db_info is not None:
             iiss_db_path: str = context.storage.rc.rename_standby_db_to_iiss_db(standby_db_info.path)
@@ -1802,6 +1901,9 @@ class IconServiceEngine(ContextContainer):
         last_block: 'Block' = self._get_last_block()
         Logger.info(tag=_TAG, msg=f"last_block={last_block}")
 
+        # Backup files can be used only after all pending commit tasks are done
+        self._wait_for_commit_tasks()
+
         # If rollback is not possible for the current state,
         # self._is_rollback_needed() should raise an InternalServiceErrorException
         try:
@@ -1835,6 +1937,13 @@ class IconServiceEngine(ContextContainer):
 
         return response
 
+    def _wait_for_commit_tasks(self):
+        """Wait until all the tasks submitted to the commit worker are done
+        """
+        if self._commit_executor is not None:
+            # The commit worker runs its tasks in order
+            self._commit_executor.submit(lambda: None).result()
+
     def _is_rollback_needed(self, last_block: 'Block', block_height: int, block_hash: bytes) -> bool:
         """Check if rollback is needed
         """
@@ -1909,6 +2018,9 @@ class IconServiceEngine(ContextContainer):
         # Reset last_block
         self._init_last_block_info(context)
 
+        # Pin the queries which start from now on to the rolled-back states
+        self._icx_context_db.key_value_db.take_snapshot()
+
     def clear_context_stack(self):
         """Clear IconScoreContext stacks
         """
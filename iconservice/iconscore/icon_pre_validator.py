@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Dict
 
 from iconcommons.logger import Logger
 
@@ -81,10 +81,14 @@ class IconPreValidator:
     It does not validate query requests like icx_getBalance, icx_call and so on
     """
 
-    def __init__(self) -> None:
+    def __init__(self, use_cache: bool = False) -> None:
         """Constructor
+
+        :param use_cache: whether to reuse the balances and deploy info read once.
+            Only for validating a batch of transactions on the same states
         """
-        pass
+        self._balances: Optional[Dict['Address', int]] = {} if use_cache else None
+        self._deploy_infos: Optional[Dict['Address', Optional['IconScoreDeployInfo']]] = {} if use_cache else None
 
     def origin_request_execute(self, params: dict, revision: int):
         if revision < Revision.IMPROVED_PRE_VALIDATOR.value:
@@ -149,7 +153,12 @@ class IconPreValidator:
     def is_address_type(cls, value: str) -> bool:
         return is_icon_address_valid(value)
 
-    def execute(self, context: 'IconScoreContext', params: dict, step_price: int, minimum_step: int):
+    def execute(self,
+                context: 'IconScoreContext',
+                params: dict,
+                step_price: int,
+                minimum_step: int,
+                input_data_size: Optional[int] = None):
         """Validate a transaction on icx_sendTransaction
         If failed to validate a tx, raise an exception
 
@@ -160,9 +169,10 @@ class IconPreValidator:
         :param params: params of icx_sendTransaction JSON-RPC request
         :param step_price:
         :param minimum_step: minimum step
+        :param input_data_size: size of input data already measured by the caller not to measure it again
         """
 
-        self._check_input_data(params)
+        self._check_input_data(params, input_data_size)
 
         value: int = params.get('value', 0)
         if value < 0:
@@ -187,11 +197,12 @@ class IconPreValidator:
             self._check_from_can_charge_fee_v3(context, params, step_price)
 
     @staticmethod
-    def _check_input_data(params: dict):
+    def _check_input_data(params: dict, input_data_size: Optional[int] = None):
         """
         Validates input data. It checks the input data type and the input data size.
 
         :param params: params of icx_sendTransaction JSON-RPC request
+        :param input_data_size: size of input data measured on the latest revision rule
         :return:
         """
 
@@ -201,7 +212,7 @@ class IconPreValidator:
         else:
             IconPreValidator._check_input_data_type(input_data)
 
-        IconPreValidator._check_input_data_size(input_data)
+        IconPreValidator._check_input_data_size(input_data, input_data_size)
 
     @staticmethod
     def _check_message_data(data: Any):
@@ -234,7 +245,7 @@ class IconPreValidator:
             raise InvalidRequestException('Invalid data type')
 
     @staticmethod
-    def _check_input_data_size(input_data: Any):
+    def _check_input_data_size(input_data: Any, input_data_size: Optional[int] = None):
         """
         Validates transaction data whether total bytes is less than MAX_DATA_SIZE
         If the property is a key-value object, counts key and value.
@@ -244,10 +255,14 @@ class IconPreValidator:
         But the field of 'data' has not been converted (TypeConvert marks it as LATER)
 
         :param input_data: data field of icx_sendTransaction JSON-RPC request
+        :param input_data_size: size of input_data if it has already been measured
         """
 
         if input_data is not None:
-            size = get_input_data_size(Revision.LATEST.value, input_data)
+            if input_data_size is None:
+                size = get_input_data_size(Revision.LATEST.value, input_data)
+            else:
+                size = input_data_size
 
             if size > MAX_DATA_SIZE:
                 raise InvalidRequestException('Invalid message length')
@@ -399,8 +414,7 @@ class IconPreValidator:
         if 'action' not in data:
             raise InvalidRequestException('Action not found')
 
-    @classmethod
-    def _validate_new_score_address_on_deploy_transaction(cls, context: 'IconScoreContext', params: dict):
+    def _validate_new_score_address_on_deploy_transaction(self, context: 'IconScoreContext', params: dict):
         """Check if a newly generated score address is available
         Assume that data_type is 'deploy'
 
@@ -423,7 +437,7 @@ class IconPreValidator:
 
                 score_address: 'Address' = generate_score_address(from_, timestamp, nonce)
 
-                deploy_info = context.storage.deploy.get_deploy_info(context, score_address)
+                deploy_info = self._get_deploy_info(context, score_address)
                 if deploy_info is not None:
                     raise InvalidRequestException(f'SCORE address already in use: {score_address}')
             elif content_type == 'application/tbears':
@@ -436,9 +450,8 @@ class IconPreValidator:
         except BaseException as e:
             raise e
 
-    @classmethod
-    def _check_balance(cls, context: 'IconScoreContext', from_: 'Address', value: int, fee: int):
-        balance = context.engine.icx.get_balance(context, from_)
+    def _check_balance(self, context: 'IconScoreContext', from_: 'Address', value: int, fee: int):
+        balance = self._get_balance(context, from_)
 
         if context.revision >= Revision.LOCK_ADDRESS.value and is_address_locked(from_):
             Logger.warning(
@@ -461,11 +474,30 @@ class IconPreValidator:
             and not self._is_score_active(context, address)
         )
 
-    @classmethod
-    def _is_score_active(cls, context: 'IconScoreContext', address: 'Address') -> bool:
-        deploy_info: 'IconScoreDeployInfo' = context.storage.deploy.get_deploy_info(context, address)
+    def _is_score_active(self, context: 'IconScoreContext', address: 'Address') -> bool:
+        deploy_info: 'IconScoreDeployInfo' = self._get_deploy_info(context, address)
 
         if deploy_info is None:
             return False
 
         return deploy_info.deploy_state == DeployState.ACTIVE
+
+    def _get_balance(self, context: 'IconScoreContext', address: 'Address') -> int:
+        if self._balances is None:
+            return context.engine.icx.get_balance(context, address)
+
+        balance: Optional[int] = self._balances.get(address)
+        if balance is None:
+            balance = context.engine.icx.get_balance(context, address)
+            self._balances[address] = balance
+
+        return balance
+
+    def _get_deploy_info(self, context: 'IconScoreContext', address: 'Address') -> Optional['IconScoreDeployInfo']:
+        if self._deploy_infos is None:
+            return context.storage.deploy.get_deploy_info(context, address)
+
+        if address not in self._deploy_infos:
+            self._deploy_infos[address] = context.storage.deploy.get_deploy_info(context, address)
+
+        return self._deploy_infos[address]
@@ -45,6 +45,7 @@ if TYPE_CHECKING:
     from ..prep.prep_address_converter import PRepAddressConverter
     from ..inv.container import Container as INVContainer
     from ..database.batch import Batch
+    from ..database.db import KeyValueDatabase, KeyValueSnapshot
 
 
 class IconScoreContext(ABC):
@@ -69,6 +70,7 @@ class IconScoreContext(ABC):
     step_trace_flag: bool = False
     log_level: str = None
     unstake_slot_max: int = UNSTAKE_SLOT_MAX
+    score_instance_pool: bool = False
 
     """Contains the useful information to process user's JSON-RPC request
     """
@@ -87,6 +89,8 @@ class IconScoreContext(ABC):
         self.current_address: Optional['Address'] = None
         self.block_batch: Optional['BlockBatch'] = None
         self.tx_batch: Optional['TransactionBatch'] = None
+        # The snapshot of state_db which QUERY and ESTIMATION contexts read the committed states from
+        self.snapshot: Optional['KeyValueSnapshot'] = None
         # For 2-depth block invocation
         self._prev_block_batches: Optional[List['BlockBatch']] = \
             [] if context_type == IconScoreContextType.INVOKE else None
@@ -162,7 +166,8 @@ class IconScoreContext(ABC):
 
     def get_batches(self) -> Iterable['Batch']:
         """Used to support 2-depth block invocation
-        It is called in ContextDatabase.get_from_batch() on estimation or invoke
+        ContextDatabase.get_from_batch() looks up tx_batch and block_batch.overlay instead,
+        which contain the same data in the same searching order
 
         Searching order: tx_batch -> block_batch -> prev_block_batch -> state_db
         """
@@ -365,8 +370,12 @@ class IconScoreContext(ABC):
 
 
 class IconScoreContextFactory(object):
-    def __init__(self):
-        pass
+    def __init__(self, state_db: Optional['KeyValueDatabase'] = None):
+        """Constructor
+
+        :param state_db: QUERY and ESTIMATION contexts are pinned to the last snapshot of it
+        """
+        self._state_db: Optional['KeyValueDatabase'] = state_db
 
     def create(self,
                context_type: 'IconScoreContextType',
@@ -381,6 +390,12 @@ class IconScoreContextFactory(object):
         # For 2-depth block invocation
         if prev_block_batches:
             context._prev_block_batches = [batch for batch in prev_block_batches]
+
+        # Keep reading the same committed states even if a new block is committed during the process
+        if self._state_db is not None and context_type in (IconScoreContextType.QUERY,
+                                                            IconScoreContextType.ESTIMATION):
+            context.snapshot = self._state_db.snapshot
+
         self._set_context_attributes_for_processing_tx(context)
         return context
 
@@ -392,6 +407,9 @@ class IconScoreContextFactory(object):
     def _set_context_attributes_for_processing_tx(cls, context: 'IconScoreContext'):
         if context.type in (IconScoreContextType.INVOKE, IconScoreContextType.ESTIMATION):
             context.block_batch = BlockBatch(Block.from_block(context.block))
+            if context._prev_block_batches:
+                # The newest prev_block_batch has the merged view of all uncommitted block batches
+                context.block_batch.set_prev_overlay(context._prev_block_batches[0].overlay)
             context.tx_batch = TransactionBatch()
 
             context.new_icon_score_mapper = IconScoreMapper()
@@ -93,6 +93,47 @@ class IconScoreContextUtil(object):
         # to prevent consensus failure by using wrong member variables in SCORE
         return score_info.get_score(context.revision)
 
+    @staticmethod
+    def acquire_icon_score(context: 'IconScoreContext', address: 'Address') -> Optional['IconScoreBase']:
+        """Return a SCORE instance to call its method, which can be reused across calls
+
+        The instance should be given back by release_icon_score() after the call
+
+        :param context:
+        :param address:
+        :return:
+        """
+        if not context.score_instance_pool:
+            return IconScoreContextUtil.get_icon_score(context, address)
+
+        score_info: 'IconScoreInfo' = IconScoreContextUtil.get_score_info(context, address)
+        if score_info is None:
+            return None
+
+        return score_info.acquire_score(context)
+
+    @staticmethod
+    def release_icon_score(context: 'IconScoreContext', address: 'Address', score: 'IconScoreBase'):
+        """Give back the SCORE instance provided by acquire_icon_score()
+
+        :param context:
+        :param address:
+        :param score:
+        """
+        if not context.score_instance_pool:
+            return
+
+        score_info: Optional['IconScoreInfo'] = None
+
+        if context.type == IconScoreContextType.INVOKE:
+            score_info = context.new_icon_score_mapper.get(address)
+
+        if score_info is None:
+            score_info = context.icon_score_mapper.get(address)
+
+        if score_info is not None:
+            score_info.release_score(score)
+
     @staticmethod
     def get_score_info(context: 'IconScoreContext', address: 'Address') -> Optional['IconScoreInfo']:
         """Returns the score_info associated with the currently active score
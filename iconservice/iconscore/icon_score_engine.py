@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING, Any
 from .icon_score_constant import STR_FALLBACK, ATTR_SCORE_GET_API, ATTR_SCORE_CALL
 from .icon_score_context import IconScoreContext
 from .icon_score_context_util import IconScoreContextUtil
-from .typing.conversion import convert_score_parameters, ConvertOption
+from .typing.conversion import ConvertOption
 from .typing.element import (
     ScoreElementMetadata,
     get_score_element_metadata,
@@ -84,8 +84,12 @@ class IconScoreEngine(object):
         IconScoreEngine._validate_score_blacklist(context, icon_score_address)
 
         icon_score = IconScoreEngine._get_icon_score(context, icon_score_address)
-        get_api = getattr(icon_score, ATTR_SCORE_GET_API)
-        return get_api()
+
+        try:
+            get_api = getattr(icon_score, ATTR_SCORE_GET_API)
+            return get_api()
+        finally:
+            IconScoreContextUtil.release_icon_score(context, icon_score_address, icon_score)
 
     @staticmethod
     def _validate_score_blacklist(context: 'IconScoreContext', icon_score_address: 'Address'):
@@ -109,16 +113,19 @@ class IconScoreEngine(object):
 
         icon_score = cls._get_icon_score(context, icon_score_address)
 
-        converted_params = cls._convert_score_params_by_annotations(
-            context, icon_score, func_name, kw_params)
-        context.set_func_type_by_icon_score(icon_score, func_name)
-        context.current_address = icon_score_address
+        try:
+            converted_params = cls._convert_score_params_by_annotations(
+                context, icon_score, func_name, kw_params)
+            context.set_func_type_by_icon_score(icon_score, func_name)
+            context.current_address = icon_score_address
 
-        score_func = getattr(icon_score, ATTR_SCORE_CALL)
-        ret = score_func(func_name=func_name, kw_params=converted_params)
+            score_func = getattr(icon_score, ATTR_SCORE_CALL)
+            ret = score_func(func_name=func_name, kw_params=converted_params)
 
-        # No problem even though ret is None
-        return deepcopy(ret)
+            # No problem even though ret is None
+            return deepcopy(ret)
+        finally:
+            IconScoreContextUtil.release_icon_score(context, icon_score_address, icon_score)
 
     @classmethod
     def _convert_score_params_by_annotations(
@@ -136,7 +143,7 @@ class IconScoreEngine(object):
             options = ConvertOption.IGNORE_UNKNOWN_PARAMS
 
         element_metadata: ScoreElementMetadata = get_score_element_metadata(icon_score, func_name)
-        params = convert_score_parameters(kw_params, element_metadata.signature, options)
+        params = element_metadata.converter(kw_params, options)
 
         return params
 
@@ -150,12 +157,17 @@ class IconScoreEngine(object):
         """
         icon_score = IconScoreEngine._get_icon_score(context, score_address)
 
-        score_func = getattr(icon_score, ATTR_SCORE_CALL)
-        score_func(STR_FALLBACK)
+        try:
+            score_func = getattr(icon_score, ATTR_SCORE_CALL)
+            score_func(STR_FALLBACK)
+        finally:
+            IconScoreContextUtil.release_icon_score(context, score_address, icon_score)
 
     @staticmethod
     def _get_icon_score(context: 'IconScoreContext', icon_score_address: 'Address'):
-        icon_score = IconScoreContextUtil.get_icon_score(context, icon_score_address)
+        """Return a SCORE instance which should be given back by IconScoreContextUtil.release_icon_score()
+        """
+        icon_score = IconScoreContextUtil.acquire_icon_score(context, icon_score_address)
         if icon_score is None:
             raise ScoreNotFoundException(
                 f'SCORE not found: {icon_score_address}')
@@ -31,6 +31,8 @@ class EventLog(object):
     """ A DataClass of a event log.
     """
 
+    __slots__ = ("score_address", "indexed", "data")
+
     def __init__(
             self,
             score_address: 'Address',
@@ -53,7 +55,7 @@ class EventLog(object):
         self.data: 'List[BaseType]' = data
 
     def __str__(self) -> str:
-        return '\n'.join([f'{k}: {v}' for k, v in self.__dict__.items()])
+        return '\n'.join([f'{k}: {getattr(self, k)}' for k in self.__slots__])
 
     def to_dict(self, casing: Optional[callable] = None) -> dict:
         """
@@ -61,7 +63,8 @@ class EventLog(object):
         :return: a dict
         """
         new_dict = {}
-        for key, value in self.__dict__.items():
+        for key in self.__slots__:
+            value = getattr(self, key)
             if value is None:
                 # Excludes properties which have `None` value
                 continue
@@ -14,17 +14,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
 
+from .icon_container_db import ArrayDB, DictDB, VarDB
 from ..base.address import Address
 from ..base.exception import InvalidParamsException
-from ..icon_constant import Revision
+from ..icon_constant import Revision, IconScoreContextType
 from ..utils import is_builtin_score
 
 if TYPE_CHECKING:
     from .icon_score_base import IconScoreBase
+    from .icon_score_context import IconScoreContext
+    from .icon_score_step import IconScoreStepCounter, StepType
     from ..database.db import IconScoreDatabase
 
+# Member variables of IconScoreBase which are set in IconScoreBase.__init__()
+_SCORE_BASE_MEMBERS = (
+    "_IconScoreBase__db",
+    "_IconScoreBase__address",
+    "_IconScoreBase__owner",
+    "_IconScoreBase__icx",
+)
+# Icx instance is created lazily on a call and the pooled SCORE discards it on every reuse
+_SCORE_LAZY_MEMBER = "_IconScoreBase__icx"
+
+
+class _StepCounterProbe(object):
+    """Passes all steps to the given step counter and records whether any step is applied
+    """
+
+    def __init__(self, step_counter: 'IconScoreStepCounter'):
+        self._step_counter = step_counter
+        self.applied = False
+
+    def apply_step(self, step_type: 'StepType', count: int) -> int:
+        self.applied = True
+        return self._step_counter.apply_step(step_type, count)
+
+    def consume_step(self, step_type: 'StepType', step: int) -> int:
+        self.applied = True
+        return self._step_counter.consume_step(step_type, step)
+
+    def __getattr__(self, name: str):
+        return getattr(self._step_counter, name)
+
 
 class IconScoreInfo(object):
     """Contains information on one icon score
@@ -43,6 +77,15 @@ class IconScoreInfo(object):
         self._score_class = score_class
         self._score_db = score_db
         self._score = None
+        self._is_builtin_score = is_builtin_score(str(score_db.address))
+
+        # A SCORE instance reused across calls: see acquire_score()
+        self._pool_lock = Lock()
+        self._poolable = True
+        self._pooled_score: Optional['IconScoreBase'] = None
+        self._pooled_score_members: Optional[dict] = None
+        self._pooled_score_revision = -1
+        self._pooled_score_in_use = False
 
     @property
     def tx_hash(self) -> bytes:
@@ -68,7 +111,7 @@ class IconScoreInfo(object):
         :param revision:
         :return:
         """
-        if revision <= Revision.TWO.value or is_builtin_score(str(self.address)):
+        if revision <= Revision.TWO.value or self._is_builtin_score:
             if self._score is None:
                 self._score = self.create_score()
 
@@ -79,6 +122,117 @@ class IconScoreInfo(object):
     def create_score(self) -> 'IconScoreBase':
         return self._score_class(self._score_db)
 
+    @property
+    def poolable(self) -> bool:
+        return self._poolable
+
+    def acquire_score(self, context: 'IconScoreContext') -> 'IconScoreBase':
+        """Provide a score instance to call its method
+
+        If IconScoreContext.score_instance_pool is enabled,
+        the score instance can be reused across calls instead of being created every time.
+        It is allowed only when creating a new instance makes no difference to the result of a call:
+
+        1. Its __init__() applies no step whatever the step costs are, e.g. no state DB access
+        2. Its member variables are only container DBs after __init__()
+        3. It has never changed its member variables after __init__() in a call
+
+        The member variables are restored to the ones right after __init__() whenever it is reused
+        and a score instance which is in use, e.g. reentrancy by inter-SCORE calls, is never shared.
+        The instance should be given back by release_score() after the call.
+
+        :param context:
+        :return: score instance
+        """
+        revision: int = context.revision
+
+        if not self._can_use_pool(context):
+            return self.get_score(revision)
+
+        with self._pool_lock:
+            score = self._pooled_score
+            if score is not None and not self._pooled_score_in_use and self._pooled_score_revision == revision:
+                self._pooled_score_in_use = True
+                members = score.__dict__
+                members.clear()
+                members.update(self._pooled_score_members)
+                return score
+
+        # Regardless of step costs, find out whether __init__() applies any step, e.g. state DB access
+        step_counter = context.step_counter
+        step_counter_probe = _StepCounterProbe(step_counter)
+        context.step_counter = step_counter_probe
+        try:
+            score = self.create_score()
+        finally:
+            context.step_counter = step_counter
+
+        if step_counter_probe.applied or not self._is_poolable_members(score.__dict__):
+            self._disable_pool()
+            return score
+
+        with self._pool_lock:
+            if self._poolable and not self._pooled_score_in_use:
+                self._pooled_score = score
+                self._pooled_score_members = dict(score.__dict__)
+                self._pooled_score_revision = revision
+                self._pooled_score_in_use = True
+
+        return score
+
+    def release_score(self, score: 'IconScoreBase'):
+        """Give back the score instance provided by acquire_score()
+
+        :param score: score instance
+        """
+        with self._pool_lock:
+            if score is not self._pooled_score:
+                return
+
+            self._pooled_score_in_use = False
+
+            if not self._is_unchanged_members(score.__dict__):
+                self._poolable = False
+                self._pooled_score = None
+                self._pooled_score_members = None
+
+    def _can_use_pool(self, context: 'IconScoreContext') -> bool:
+        return (
+            context.score_instance_pool
+            and self._poolable
+            and context.type in (IconScoreContextType.INVOKE, IconScoreContextType.QUERY)
+            and context.step_counter is not None
+            and context.revision > Revision.TWO.value
+            and not self._is_builtin_score
+        )
+
+    def _disable_pool(self):
+        with self._pool_lock:
+            self._poolable = False
+            self._pooled_score = None
+            self._pooled_score_members = None
+
+    @staticmethod
+    def _is_poolable_members(members: dict) -> bool:
+        for name, value in members.items():
+            if name in _SCORE_BASE_MEMBERS:
+                continue
+            if not isinstance(value, (VarDB, DictDB, ArrayDB)):
+                return False
+
+        return True
+
+    def _is_unchanged_members(self, members: dict) -> bool:
+        pooled_members: dict = self._pooled_score_members
+        if members.keys() != pooled_members.keys():
+            return False
+
+        for name, value in members.items():
+            if name != _SCORE_LAZY_MEMBER and value is not pooled_members[name]:
+                return False
+
+        return True
+
 
 class IconScoreMapperObject(dict):
     def __getitem__(self, key: 'Address') -> 'IconScoreInfo':
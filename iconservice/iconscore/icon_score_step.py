@@ -27,6 +27,10 @@ if TYPE_CHECKING:
     from ..inv.container import Container as INVContainer
 
 
+# Making an encoder on every json.dumps() call costs as much as encoding small data
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
 def get_input_data_size(revision: int, input_data: Any) -> int:
     """
     Returns size of input data of a transaction
@@ -45,7 +49,7 @@ def get_input_data_size(revision: int, input_data: Any) -> int:
 
 
 def get_data_size_using_json_dumps(data) -> int:
-    data = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    data = _JSON_ENCODER.encode(data)
     return len(data.encode())
 
 
@@ -147,8 +147,10 @@ class InternalCall(object):
         context.current_address = addr_to
         context.msg = Message(sender=addr_from, value=amount)
 
+        icon_score = None
+
         try:
-            icon_score = IconScoreContextUtil.get_icon_score(context, addr_to)
+            icon_score = IconScoreContextUtil.acquire_icon_score(context, addr_to)
             context.set_func_type_by_icon_score(icon_score, func_name)
             score_func = getattr(icon_score, ATTR_SCORE_CALL)
 
@@ -158,6 +160,8 @@ class InternalCall(object):
 
             return score_func(func_name=func_name, arg_params=arg_params, kw_params=kw_params)
         finally:
+            if icon_score is not None:
+                IconScoreContextUtil.release_icon_score(context, addr_to, icon_score)
             context.func_type = prev_func_type
             context.current_address = addr_from
             context.msg = context.msg_stack.pop()
@@ -16,7 +16,7 @@
 from collections import OrderedDict
 from enum import Flag, auto
 from inspect import Signature, Parameter
-from typing import Optional, Dict, Union, Any, List
+from typing import Optional, Dict, Union, Any, List, Callable
 
 from . import (
     BaseObject,
@@ -127,42 +127,175 @@ def convert_score_parameters(
     :param options:
     :return:
     """
-    _verify_arguments(params, sig)
+    return ScoreParametersConverter(sig)(params, options)
 
-    converted_params = {}
-    parameters = sig.parameters
 
-    for k, v in params.items():
-        if not isinstance(k, str):
-            raise InvalidParamsException(f"Invalid key type: key={k}")
+class ScoreParametersConverter(object):
+    """Converts string values in score parameters to object values
 
-        try:
-            parameter: Parameter = parameters[k]
-            converted_params[k] = str_to_object(v, parameter.annotation)
-        except KeyError:
-            if not (options & ConvertOption.IGNORE_UNKNOWN_PARAMS):
-                raise InvalidParamsException(f"Unknown param: key={k} value={v}")
+    Type hints in a signature are compiled into converters only once,
+    so that they are not resolved again on every call
+    """
 
-    set_default_value_to_params(params, parameters)
+    def __init__(self, sig: Signature):
+        """
+        :param sig: normalized signature
+        """
+        parameters = sig.parameters
 
-    return converted_params
+        self._parameters = parameters
+        self._required_params = tuple(
+            k for k, parameter in parameters.items() if parameter.default is Parameter.empty)
+        self._converters: Dict[str, Callable[[Any], Any]] = {
+            k: compile_str_to_object(parameter.annotation) for k, parameter in parameters.items()
+        }
 
+    def __call__(self,
+                 params: Dict[str, Any],
+                 options: ConvertOption = ConvertOption.NONE) -> Dict[str, Any]:
+        self._verify_arguments(params)
 
-def _verify_arguments(params: Dict[str, Any], sig: Signature):
-    """Check if all required arguments are present
+        converted_params = {}
+        converters = self._converters
 
-    :param params:
-    :param sig: normalized signature
+        for k, v in params.items():
+            if not isinstance(k, str):
+                raise InvalidParamsException(f"Invalid key type: key={k}")
+
+            try:
+                converter = converters[k]
+            except KeyError:
+                if not (options & ConvertOption.IGNORE_UNKNOWN_PARAMS):
+                    raise InvalidParamsException(f"Unknown param: key={k} value={v}")
+                continue
+
+            converted_params[k] = converter(v)
+
+        set_default_value_to_params(params, self._parameters)
+
+        return converted_params
+
+    def _verify_arguments(self, params: Dict[str, Any]):
+        """Check if all required arguments are present
+
+        :param params:
+        :return:
+        """
+        for k in self._required_params:
+            if k not in params:
+                raise InvalidParamsException(f"Argument not found: {k}")
+
+
+def compile_str_to_object(type_hint: type) -> Callable[[Any], Any]:
+    """Returns a function which works the same as str_to_object(value, type_hint)
+
+    Invalid values are passed to str_to_object() in order to raise the same exceptions
+
+    :param type_hint:
+    :return:
+    """
+    origin = get_origin(type_hint)
+    args = get_args(type_hint)
+
+    if is_base_type(origin):
+        return _compile_str_to_base_object(type_hint, origin)
+    elif is_struct(origin):
+        return _compile_str_to_object_in_struct(type_hint)
+    elif origin is list and len(args) == 1:
+        return _compile_str_to_object_in_list(type_hint, args[0])
+    elif origin is dict and len(args) == 2:
+        return _compile_str_to_object_in_dict(type_hint, args[1])
+    elif origin is Union and len(args) > 0:
+        return _compile_str_to_object_in_union(args[0])
+
+    def convert(value: Any) -> Any:
+        return str_to_object(value, type_hint)
+
+    return convert
+
+
+_STR_TO_BASE_OBJECT = {
+    bool: lambda value: bool(str_to_int(value)),
+    bytes: hex_to_bytes,
+    int: str_to_int,
+    str: lambda value: value,
+    Address: Address.from_string,
+}
+
+
+def _compile_str_to_base_object(type_hint: type, origin: type) -> Callable[[Any], BaseObject]:
+    func = _STR_TO_BASE_OBJECT[origin]
+
+    def convert(value: Any) -> BaseObject:
+        if isinstance(value, str):
+            return func(value)
+
+        return str_to_object(value, type_hint)
+
+    return convert
+
+
+def _compile_str_to_object_in_struct(type_hint: type) -> Callable[[Any], Dict[str, Any]]:
+    annotations = get_annotations(type_hint, None)
+    converters = {k: compile_str_to_object(annotations[k]) for k in annotations}
+    size = len(converters)
+
+    def convert(value: Any) -> Dict[str, Any]:
+        if not isinstance(value, dict):
+            return str_to_object(value, type_hint)
+
+        ret = OrderedDict()
+
+        for k, v in value.items():
+            if k not in converters:
+                raise InvalidParamsException(f"Unknown field in struct: key={k}")
+
+            ret[k] = converters[k](v)
+
+        if len(ret) != size:
+            raise InvalidParamsException(f"Missing field in struct")
+
+        return ret
+
+    return convert
+
+
+def _compile_str_to_object_in_list(type_hint: type, item_type_hint: type) -> Callable[[Any], List[Any]]:
+    converter = compile_str_to_object(item_type_hint)
+
+    def convert(value: Any) -> List[Any]:
+        if not isinstance(value, list):
+            return str_to_object(value, type_hint)
+
+        return [converter(i) for i in value]
+
+    return convert
+
+
+def _compile_str_to_object_in_dict(type_hint: type, value_type_hint: type) -> Callable[[Any], Dict[str, Any]]:
+    converter = compile_str_to_object(value_type_hint)
+
+    def convert(value: Any) -> Dict[str, Any]:
+        if not isinstance(value, dict):
+            return str_to_object(value, type_hint)
+
+        return OrderedDict((k, converter(v)) for k, v in value.items())
+
+    return convert
+
+
+def _compile_str_to_object_in_union(type_hint: type) -> Callable[[Any], Optional[Any]]:
+    """Assume that only the specific type of Union (= Optional) is allowed in iconservice
+
+    :param type_hint: the first type argument of Union
     :return:
     """
-    parameters = sig.parameters
+    converter = compile_str_to_object(type_hint)
 
-    for k in parameters:
-        parameter: Parameter = parameters[k]
-        param = params.get(k, parameter.default)
+    def convert(value: Any) -> Optional[Any]:
+        return None if value is None else converter(value)
 
-        if param is Parameter.empty:
-            raise InvalidParamsException(f"Argument not found: {k}")
+    return convert
 
 
 def str_to_object(value: Union[str, list, dict, None], type_hint: type) -> Any:
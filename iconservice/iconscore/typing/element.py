@@ -33,6 +33,7 @@ from . import (
     name_to_type,
 )
 from . import isinstance_ex
+from .conversion import ScoreParametersConverter
 from ..icon_score_constant import (
     CONST_SCORE_FLAG,
     ScoreFlag,
@@ -244,6 +245,7 @@ class ScoreElementMetadata(object):
     def __init__(self, element: callable):
         self._signature: Signature = normalize_signature(element)
         self._element = element
+        self._converter = ScoreParametersConverter(self._signature)
 
     @property
     def element(self) -> callable:
@@ -261,6 +263,10 @@ class ScoreElementMetadata(object):
     def signature(self) -> Signature:
         return self._signature
 
+    @property
+    def converter(self) -> ScoreParametersConverter:
+        return self._converter
+
 
 class FunctionMetadata(ScoreElementMetadata):
     """Represents metadata of an exposed function in a SCORE
@@ -25,6 +25,8 @@ class BasePartState(Flag):
 
 
 class BasePart(object):
+    __slots__ = ("_states",)
+
     def __init__(self, states: 'BasePartState' = BasePartState.NONE):
         self._states = states
 
@@ -46,3 +48,12 @@ class BasePart(object):
 
     def is_set(self, states: 'BasePartState') -> bool:
         return self._states & states == states
+
+    def copy(self) -> 'BasePart':
+        """Returns a copy of this part without decoding it from bytes again
+
+        Subclasses MUST copy their own slots as well
+        """
+        part = object.__new__(self.__class__)
+        part._states = self._states
+        return part
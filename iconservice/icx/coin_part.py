@@ -61,6 +61,8 @@ class CoinPart(BasePart):
     # version(1) | type(1) | flags(1) | reserved(1) |
     # icx(DEFAULT_BYTE_SIZE)
 
+    __slots__ = ("_is_first", "_type", "_flags", "_balance")
+
     _VERSION = CoinPartVersion.MSG_PACK
     _STRUCT_PACKED_BYTES_SIZE = 36
     _STRUCT_FORMAT = Struct(f'>BBBx{DEFAULT_BYTE_SIZE}s')
@@ -174,6 +176,14 @@ class CoinPart(BasePart):
         self._balance += value
         self.set_dirty(True)
 
+    def copy(self) -> 'CoinPart':
+        part = super().copy()
+        part._is_first = self._is_first
+        part._type = self._type
+        part._flags = self._flags
+        part._balance = self._balance
+        return part
+
     def __eq__(self, other) -> bool:
         """operator == overriding
 
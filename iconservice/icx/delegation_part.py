@@ -23,6 +23,8 @@ from ..utils.msgpack_for_db import MsgPackForDB
 
 
 class DelegationPart(BasePart):
+    __slots__ = ("_delegations", "_delegated_amount", "_delegations_amount")
+
     _VERSION = 0
     PREFIX = b"aod|"
 
@@ -93,6 +95,13 @@ class DelegationPart(BasePart):
 
         self.set_dirty(True)
 
+    def copy(self) -> 'DelegationPart':
+        part = super().copy()
+        part._delegations = list(self._delegations)
+        part._delegated_amount = self._delegated_amount
+        part._delegations_amount = self._delegations_amount
+        return part
+
     @staticmethod
     def from_bytes(buf: bytes) -> 'DelegationPart':
         """Create DelegationPart object from bytes data
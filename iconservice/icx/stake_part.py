@@ -26,6 +26,8 @@ if TYPE_CHECKING:
 
 
 class StakePart(BasePart):
+    __slots__ = ("_stake", "_unstake", "_unstake_block_height", "_unstakes_info")
+
     _VERSION = 0
     PREFIX = b"aos|"
 
@@ -211,6 +213,14 @@ class StakePart(BasePart):
 
         return unstake
 
+    def copy(self) -> 'StakePart':
+        part = super().copy()
+        part._stake = self._stake
+        part._unstake = self._unstake
+        part._unstake_block_height = self._unstake_block_height
+        part._unstakes_info = [list(info) for info in self._unstakes_info]
+        return part
+
     @staticmethod
     def from_bytes(buf: bytes) -> 'StakePart':
         """Create Account of Stake object from bytes data
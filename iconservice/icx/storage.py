@@ -16,7 +16,7 @@
 
 import json
 from enum import IntEnum, IntFlag
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Optional, Union, List, Iterator, Tuple
 
 from iconcommons import Logger
 
@@ -27,6 +27,7 @@ from .stake_part import StakePart
 from ..base.ComponentBase import StorageBase
 from ..base.address import Address
 from ..base.block import Block, NULL_BLOCK
+from ..database.decode_cache import BlockDecodeCache
 from ..icon_constant import DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER, ICX_LOG_TAG, ROLLBACK_LOG_TAG, Revision
 from ..utils import bytes_to_hex
 
@@ -73,6 +74,8 @@ class Storage(StorageBase):
         self._genesis: Optional['Address'] = None
         self._fee_treasury: Optional['Address'] = None
 
+        self._part_cache = BlockDecodeCache()
+
     def open(self, context: 'IconScoreContext'):
         self._load_special_address(context, self._GENESIS_DB_KEY)
         self._load_special_address(context, self._TREASURY_DB_KEY)
@@ -84,6 +87,7 @@ class Storage(StorageBase):
         self._load_special_address(context, self._GENESIS_DB_KEY)
         self._load_special_address(context, self._TREASURY_DB_KEY)
         self.load_last_block_info(context)
+        self._part_cache.clear()
 
         Logger.info(tag=ROLLBACK_LOG_TAG, msg="rollback() end")
 
@@ -259,16 +263,23 @@ class Storage(StorageBase):
             If the account indicated by address is not present,
             create a new account.
         """
+        return self.get_accounts(context, [address], intent)[0]
 
-        coin_part: Optional['CoinPart'] = None
-        stake_part: Optional['StakePart'] = None
-        delegation_part: Optional['DelegationPart'] = None
+    def get_accounts(self,
+                     context: 'IconScoreContext',
+                     addresses: List['Address'],
+                     intent: 'Intent' = Intent.TRANSFER) -> List['Account']:
+        """Returns the accounts indicated by addresses.
+        All the parts of the accounts are read from db at once
 
+        :param context:
+        :param addresses: account addresses
+        :param intent:
+        :return: accounts in the same order as addresses
+        """
         part_flags: 'AccountPartFlag' = AccountPartFlag(intent)
 
         if AccountPartFlag.COIN in part_flags:
-            coin_part: 'CoinPart' = self._get_part(context, CoinPart, address)
-
             """
             Ref IS-1208.
             Mismatch has_unstake flag and actual unstake info below rev 10.
@@ -287,20 +298,42 @@ class Storage(StorageBase):
                     params,
                     step_price=context.step_counter.step_price)
             """
-            if context.revision >= Revision.FIX_BALANCE_BUG.value or \
-                    CoinPartFlag.HAS_UNSTAKE in coin_part.flags:
+            if context.revision >= Revision.FIX_BALANCE_BUG.value:
                 part_flags |= AccountPartFlag.STAKE
 
-        if AccountPartFlag.STAKE in part_flags:
-            stake_part: 'StakePart' = self._get_part(context, StakePart, address)
+        part_classes: list = [
+            part_class for flag, part_class in (
+                (AccountPartFlag.COIN, CoinPart),
+                (AccountPartFlag.STAKE, StakePart),
+                (AccountPartFlag.DELEGATION, DelegationPart)
+            ) if flag in part_flags
+        ]
 
-        if AccountPartFlag.DELEGATION in part_flags:
-            delegation_part: 'DelegationPart' = self._get_part(context, DelegationPart, address)
+        keys: List[bytes] = [part_class.make_key(address) for address in addresses for part_class in part_classes]
+        items: Iterator[Tuple[bytes, Optional[bytes]]] = zip(keys, self._db.get_many(context, keys))
 
-        return Account(address, context.block.height, context.revision,
-                       coin_part=coin_part,
-                       stake_part=stake_part,
-                       delegation_part=delegation_part)
+        accounts: List['Account'] = []
+        for address in addresses:
+            parts: dict = {
+                part_class: self._to_part(context, part_class, address, *next(items))
+                for part_class in part_classes
+            }
+
+            coin_part: Optional['CoinPart'] = parts.get(CoinPart)
+            stake_part: Optional['StakePart'] = parts.get(StakePart)
+            delegation_part: Optional['DelegationPart'] = parts.get(DelegationPart)
+
+            # Below Revision.FIX_BALANCE_BUG, StakePart is loaded only if CoinPart has unstake info (IS-1208)
+            if stake_part is None and coin_part is not None and CoinPartFlag.HAS_UNSTAKE in coin_part.flags:
+                stake_part: 'StakePart' = self._get_part(context, StakePart, address)
+
+            accounts.append(
+                Account(address, context.block.height, context.revision,
+                        coin_part=coin_part,
+                        stake_part=stake_part,
+                        delegation_part=delegation_part))
+
+        return accounts
 
     def get_treasury_account(self, context: 'IconScoreContext') -> 'Account':
         """Returns the instance of treasury account
@@ -318,10 +351,40 @@ class Storage(StorageBase):
         key: bytes = part_class.make_key(address)
         value: bytes = self._db.get(context, key)
 
+        return self._to_part(context, part_class, address, key, value)
+
+    def _to_part(
+            self,
+            context: 'IconScoreContext',
+            part_class: Union[type(CoinPart), type(StakePart), type(DelegationPart)],
+            address: 'Address',
+            key: bytes,
+            value: Optional[bytes]) -> Union['CoinPart', 'StakePart', 'DelegationPart']:
         if value is None and part_class is CoinPart:
             Logger.info(tag="PV", msg=f"No CoinPart: {address} {context.block}")
 
-        return part_class.from_bytes(value) if value else part_class()
+        if not value:
+            return part_class()
+
+        return self._part_cache.get(context, key, value, part_class.from_bytes)
+
+    def _cache_part(self,
+                    context: 'IconScoreContext',
+                    key: bytes,
+                    value: bytes,
+                    part: Union['CoinPart', 'StakePart', 'DelegationPart']):
+        """Caches the part which has just been written to db not to decode it again in the same block
+
+        Below Revision.FIX_COIN_PART_BYTES_ENCODING, a part decoded from its bytes
+        can be different from the part itself, so it is not cached
+        """
+        if context.revision < Revision.FIX_COIN_PART_BYTES_ENCODING.value:
+            return
+
+        part = part.copy()
+        part.set_dirty(False)
+        part.set_complete(False)
+        self._part_cache.put(context, key, value, part)
 
     def put_account(self,
                     context: 'IconScoreContext',
@@ -344,6 +407,7 @@ class Storage(StorageBase):
                     value: bytes = part.to_bytes()
 
                 self._db.put(context, key, value)
+                self._cache_part(context, key, value, part)
 
     def delete_account(self,
                        context: 'IconScoreContext',
@@ -419,3 +483,4 @@ class Storage(StorageBase):
         value: bytes = part.to_bytes(context.revision)
 
         self._db.put(context, key, value)
+        self._cache_part(context, key, value, part)
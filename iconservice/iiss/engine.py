@@ -14,8 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import time
 from collections import OrderedDict
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional, List, Dict, Tuple
 
 from iconcommons.logger import Logger
@@ -109,20 +111,32 @@ class Engine(EngineBase):
         self._reward_calc_proxy: Optional['RewardCalcProxy'] = None
         self._listeners: List['IISSEngineListener'] = []
 
+        # CLAIM requests sent ahead of claimIScore transactions in a block being invoked
+        # tx_hash: (address, tx_index, future)
+        self._claim_pipeline: bool = False
+        self._claim_pipeline_started: bool = False
+        self._pending_claims: Dict[bytes, Tuple['Address', int, 'concurrent.futures.Future']] = {}
+        self._commit_claim_futures: List['concurrent.futures.Future'] = []
+
     def open(self, context: 'IconScoreContext',
-             log_dir: str, data_path: str, socket_path: str, ipc_timeout: int,
-             icon_rc_path: str, icon_rc_monitor: bool):
+             log_dir: str, data_path: str, socket_path: str, ipc_timeout: int, ipc_log_interval: int,
+             iscore_query_cache_ttl: float, claim_pipeline: bool, icon_rc_path: str, icon_rc_monitor: bool):
         """
         :param context:
         :param log_dir:
         :param data_path:
         :param socket_path:
         :param ipc_timeout:
+        :param ipc_log_interval: log every n-th IPC message. 0 means no message logging
+        :param iscore_query_cache_ttl: seconds to cache I-Score queried under query mode. 0 means no caching
+        :param claim_pipeline: send CLAIM requests for claimIScore transactions in a block ahead of their execution
         :param icon_rc_path: ex) "/usr/local/bin"
         :param icon_rc_monitor: Boolean which determines Opening RC monitor channel
         :return:
         """
-        self._init_reward_calc_proxy(log_dir, data_path, socket_path, ipc_timeout, icon_rc_path, icon_rc_monitor)
+        self._claim_pipeline = claim_pipeline
+        self._init_reward_calc_proxy(log_dir, data_path, socket_path, ipc_timeout, ipc_log_interval,
+                                     iscore_query_cache_ttl, icon_rc_path, icon_rc_monitor)
 
     def add_listener(self, listener: 'IISSEngineListener'):
         assert isinstance(listener, IISSEngineListener)
@@ -227,10 +241,13 @@ class Engine(EngineBase):
         Logger.info(tag=_TAG, msg=f"calculate done callback called with {cb_data}")
 
     def _init_reward_calc_proxy(self, log_dir: str, data_path: str, socket_path: str, ipc_timeout: int,
+                                ipc_log_interval: int, iscore_query_cache_ttl: float,
                                 icon_rc_path: str, icon_rc_monitor: bool):
         self._reward_calc_proxy = RewardCalcProxy(calc_done_callback=self.calculate_done_callback,
                                                   ready_callback=self.ready_callback,
                                                   ipc_timeout=ipc_timeout,
+                                                  ipc_log_interval=ipc_log_interval,
+                                                  iscore_query_cache_ttl=iscore_query_cache_ttl,
                                                   icon_rc_path=icon_rc_path)
         self._reward_calc_proxy.open(sock_path=socket_path)
         self._reward_calc_proxy.start(
@@ -679,8 +696,12 @@ class Engine(EngineBase):
         tx: 'Transaction' = context.tx
 
         if context.type == IconScoreContextType.INVOKE and self._check_claim_tx(context):
-            iscore, block_height = self._reward_calc_proxy.claim_iscore(
-                address, block.height, block.hash, tx.index, tx.hash)
+            future: Optional['concurrent.futures.Future'] = self._pop_pending_claim(context, address)
+            if future is not None:
+                iscore, block_height = self._reward_calc_proxy.get_claim_iscore_result(future)
+            else:
+                iscore, block_height = self._reward_calc_proxy.claim_iscore(
+                    address, block.height, block.hash, tx.index, tx.hash)
         else:
             # For debug_estimateStep request
             iscore, block_height = 0, 0
@@ -709,7 +730,169 @@ class Engine(EngineBase):
             success = False
             raise e
         finally:
-            self._reward_calc_proxy.commit_claim(success, address, block.height, block.hash, tx.index, tx.hash)
+            if self._claim_pipeline_started:
+                self._commit_claim_futures.append(
+                    self._reward_calc_proxy.send_commit_claim(
+                        success, address, block.height, block.hash, tx.index, tx.hash))
+            else:
+                self._reward_calc_proxy.commit_claim(success, address, block.height, block.hash, tx.index, tx.hash)
+
+    def start_claim_pipeline(self, context: 'IconScoreContext', tx_requests: list):
+        """Sends CLAIM requests for claimIScore transactions in a block ahead of their execution
+
+        The responses are consumed in the order of transactions and
+        COMMIT_CLAIM requests are sent without waiting for their responses until end_claim_pipeline().
+        Only an account which sends one claimIScore transaction in the block is claimed ahead,
+        so that the results are the same as those of sequential execution.
+
+        :param context:
+        :param tx_requests: transactions in a block including a base transaction
+        """
+        self._clear_claim_pipeline()
+
+        if not self._claim_pipeline \
+                or context.type != IconScoreContextType.INVOKE \
+                or context.revision < Revision.IISS.value:
+            return
+
+        # address: (tx_index, tx_hash) or None if the address claims more than once in the block
+        claims: Dict['Address', Optional[Tuple[int, bytes]]] = OrderedDict()
+        for index, tx_request in enumerate(tx_requests):
+            claim: Optional[Tuple['Address', bytes]] = self._get_claim_tx(tx_request)
+            if claim is None:
+                continue
+
+            address, tx_hash = claim
+            claims[address] = None if address in claims else (index, tx_hash)
+
+        block: 'Block' = context.block
+        for address, claim in claims.items():
+            if claim is None:
+                continue
+
+            tx_index, tx_hash = claim
+            future = self._reward_calc_proxy.send_claim_iscore(address, block.height, block.hash, tx_index, tx_hash)
+            self._pending_claims[tx_hash] = (address, tx_index, future)
+
+        self._claim_pipeline_started = True
+
+    def end_claim_pipeline(self, context: 'IconScoreContext'):
+        """Reverts the claims whose transactions have not claimed I-Score
+        and waits for the responses to COMMIT_CLAIM requests
+
+        :exception TimeoutException: The operation has timed-out
+        """
+        if not self._claim_pipeline_started:
+            return
+
+        try:
+            for tx_hash in list(self._pending_claims):
+                self._revert_pending_claim(context, tx_hash)
+
+            for future in self._commit_claim_futures:
+                self._reward_calc_proxy.wait_for_commit_claim(future)
+        finally:
+            self._clear_claim_pipeline()
+
+    def abort_claim_pipeline(self, context: 'IconScoreContext'):
+        """Reverts the claims whose transactions have not claimed I-Score when a block fails
+
+        Reward calculator is not waited for, and errors are logged instead of raised
+        so as not to hide the exception which fails the block
+        """
+        if not self._claim_pipeline_started:
+            return
+
+        try:
+            block: 'Block' = context.block
+            for tx_hash in list(self._pending_claims):
+                address, tx_index, future = self._pending_claims.pop(tx_hash)
+                future.add_done_callback(
+                    partial(self._revert_claim_on_response, address, block.height, block.hash, tx_index, tx_hash))
+        except BaseException as e:
+            Logger.exception(tag=_TAG, msg=f"Failed to abort claim pipeline: {e}")
+        finally:
+            self._clear_claim_pipeline()
+
+    def _revert_claim_on_response(self, address: 'Address', block_height: int, block_hash: bytes,
+                                  tx_index: int, tx_hash: bytes, future: 'concurrent.futures.Future'):
+        """Sends COMMIT_CLAIM(False) for a claim sent ahead as soon as its CLAIM response arrives
+        """
+        try:
+            iscore, _ = self._reward_calc_proxy.get_claim_iscore_result(future)
+            if iscore > 0:
+                self._reward_calc_proxy.send_commit_claim(False, address, block_height, block_hash, tx_index, tx_hash)
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to revert claim: tx_hash={bytes_to_hex(tx_hash)} {e}")
+
+    def _clear_claim_pipeline(self):
+        if len(self._pending_claims) > 0 or len(self._commit_claim_futures) > 0:
+            Logger.warning(tag=_TAG, msg=f"Drop claim pipeline: "
+                                         f"claims={len(self._pending_claims)} "
+                                         f"commit_claims={len(self._commit_claim_futures)}")
+
+        self._claim_pipeline_started = False
+        self._pending_claims.clear()
+        self._commit_claim_futures.clear()
+
+    @staticmethod
+    def _get_claim_tx(tx_request: dict) -> Optional[Tuple['Address', bytes]]:
+        """Returns the sender and the hash of a claimIScore transaction
+
+        :return: (address, tx_hash) or None if tx_request is not a claimIScore transaction
+        """
+        if tx_request.get("method") != "icx_sendTransaction":
+            return None
+
+        params: dict = tx_request.get("params", {})
+        data = params.get("data")
+        if params.get("to") != SYSTEM_SCORE_ADDRESS \
+                or params.get("dataType") != "call" \
+                or not isinstance(data, dict) \
+                or data.get("method") != Method.CLAIM_ISCORE:
+            return None
+
+        address = params.get("from")
+        tx_hash = params.get("txHash")
+        if not isinstance(address, Address) or not isinstance(tx_hash, bytes) or tx_hash in INVALID_CLAIM_TX:
+            return None
+
+        return address, tx_hash
+
+    def _pop_pending_claim(self, context: 'IconScoreContext',
+                           address: 'Address') -> Optional['concurrent.futures.Future']:
+        tx: 'Transaction' = context.tx
+        claim: Optional[tuple] = self._pending_claims.get(tx.hash)
+        if claim is None:
+            return None
+
+        if claim[:2] != (address, tx.index):
+            self._revert_pending_claim(context, tx.hash)
+            return None
+
+        del self._pending_claims[tx.hash]
+        return claim[2]
+
+    def _revert_pending_claim(self, context: 'IconScoreContext', tx_hash: bytes):
+        """Cancels a claim sent ahead as if it had not been sent
+        """
+        address, tx_index, future = self._pending_claims.pop(tx_hash)
+
+        try:
+            iscore, _ = self._reward_calc_proxy.get_claim_iscore_result(future)
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to revert claim: tx_hash={bytes_to_hex(tx_hash)} {e}")
+            return
+
+        # Sequential execution does not send COMMIT_CLAIM for a claim without I-Score either
+        if iscore > 0:
+            block: 'Block' = context.block
+            self._commit_claim_futures.append(
+                self._reward_calc_proxy.send_commit_claim(False, address, block.height, block.hash, tx_index, tx_hash))
+
+    def _revert_pending_claims_of(self, context: 'IconScoreContext', address: 'Address'):
+        for tx_hash in [tx_hash for tx_hash, claim in self._pending_claims.items() if claim[0] == address]:
+            self._revert_pending_claim(context, tx_hash)
 
     def handle_query_iscore(self, context: 'IconScoreContext', address: 'Address') -> dict:
         if not isinstance(address, Address):
@@ -717,6 +900,12 @@ class Engine(EngineBase):
 
         tx_hash = context.tx.hash if isinstance(context.tx, Transaction) else None
         block = context.block if isinstance(context.block, Block) else None
+
+        # Reward calculator should not know the claim which has not been made yet
+        # The claim pipeline belongs to the invoke thread, so other contexts never touch it
+        if context.type == IconScoreContextType.INVOKE and tx_hash is not None and self._claim_pipeline_started:
+            self._revert_pending_claims_of(context, address)
+
         iscore, block_height = self._reward_calc_proxy.query_iscore(address, block, tx_hash)
 
         data = {
@@ -37,6 +37,13 @@ class MessageQueue(object):
     async def get(self) -> 'Request':
         return await self._requests.get()
 
+    def get_nowait(self) -> 'Request':
+        """Returns a request immediately if available, otherwise raises asyncio.QueueEmpty
+
+        :return:
+        """
+        return self._requests.get_nowait()
+
     def put(self, request, wait_for_response: bool = True) -> Optional[asyncio.Future]:
         assert isinstance(request, Request)
 
@@ -18,8 +18,9 @@ __all__ = 'RewardCalcProxy'
 import asyncio
 import concurrent.futures
 import os
+import time
 from subprocess import Popen
-from typing import TYPE_CHECKING, Callable, Any, Tuple
+from typing import TYPE_CHECKING, Callable, Any, Tuple, Dict
 
 from iconcommons.logger import Logger
 
@@ -70,12 +71,15 @@ class RewardCalcProxy(object):
                  icon_rc_path: str,
                  ipc_timeout: int,
                  ready_callback: Callable[['ReadyNotification'], Any] = None,
-                 calc_done_callback: Callable[['CalculateDoneNotification'], Any] = None):
+                 calc_done_callback: Callable[['CalculateDoneNotification'], Any] = None,
+                 ipc_log_interval: int = 1,
+                 iscore_query_cache_ttl: float = 0):
         Logger.debug(tag=_TAG, msg="__init__() start")
-        Logger.info(tag=_TAG, msg=f"ipc_timeout: {ipc_timeout}")
+        Logger.info(tag=_TAG, msg=f"ipc_timeout: {ipc_timeout} ipc_log_interval: {ipc_log_interval} "
+                                  f"iscore_query_cache_ttl: {iscore_query_cache_ttl}")
 
         self._loop = None
-        self._ipc_server = IPCServer()
+        self._ipc_server = IPCServer(log_interval=ipc_log_interval)
         self._message_queue: Optional['MessageQueue'] = None
         self._reward_calc: Optional[Popen] = None
 
@@ -87,6 +91,13 @@ class RewardCalcProxy(object):
         self._icon_rc_path = icon_rc_path
         self._rc_block: Optional[RewardCalcBlock] = None
 
+        # I-Score queries under query mode, keyed by (address, block_height, block_hash)
+        # They are written only on the event loop and read on query threads without a lock
+        self._iscore_query_cache_ttl: float = iscore_query_cache_ttl
+        self._iscore_query_cache: Dict[tuple, Tuple[float, 'QueryResponse']] = {}
+        self._iscore_query_futures: Dict[tuple, asyncio.Future] = {}
+        self._iscore_query_generation: int = 0
+
         Logger.debug(tag=_TAG, msg="__init__() end")
 
     def open(self, sock_path: str):
@@ -129,6 +140,8 @@ class RewardCalcProxy(object):
         self._message_queue = None
         self._loop = None
         self._rc_block = None
+        self._iscore_query_cache.clear()
+        self._iscore_query_futures.clear()
 
         Logger.debug(tag=_TAG, msg="close() end")
 
@@ -226,17 +239,38 @@ class RewardCalcProxy(object):
                 f"address({address}) block_height({block_height}) block_hash({block_hash.hex()})"
         )
 
-        future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(
+        future: concurrent.futures.Future = self.send_claim_iscore(
+            address, block_height, block_hash, tx_index, tx_hash)
+        iscore, block_height = self.get_claim_iscore_result(future)
+
+        Logger.debug(tag=_TAG, msg=f"claim_iscore() end: iscore({iscore})")
+
+        return iscore, block_height
+
+    def send_claim_iscore(self, address: 'Address',
+                          block_height: int, block_hash: bytes,
+                          tx_index: int, tx_hash: bytes) -> concurrent.futures.Future:
+        """Sends CLAIM request without waiting for its response
+
+        Requests are sent to reward calculator in the order of calls
+
+        :return: future to pass to get_claim_iscore_result()
+        """
+        return asyncio.run_coroutine_threadsafe(
             self._claim_iscore(address, block_height, block_hash, tx_index, tx_hash), self._loop)
 
+    def get_claim_iscore_result(self, future: concurrent.futures.Future) -> Tuple[int, int]:
+        """Waits for the response to a CLAIM request sent by send_claim_iscore()
+
+        :return: [i-score(int), block_height(int)]
+        :exception TimeoutException: The operation has timed-out
+        """
         try:
             response: 'ClaimResponse' = future.result(self._ipc_timeout)
         except asyncio.TimeoutError:
             future.cancel()
             raise TimeoutException("claim_iscore message to RewardCalculator has timed-out")
 
-        Logger.debug(tag=_TAG, msg=f"claim_iscore() end: iscore({response.iscore})")
-
         return response.iscore, response.block_height
 
     async def _claim_iscore(self, address: 'Address',
@@ -274,11 +308,27 @@ class RewardCalcProxy(object):
                 f"tx_hash={bytes_to_hex(tx_hash)}"
         )
 
-        future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(
-            self._commit_claim(success, address, block_height, block_hash, tx_index, tx_hash),
-            self._loop
-        )
+        future: concurrent.futures.Future = self.send_commit_claim(
+            success, address, block_height, block_hash, tx_index, tx_hash)
+        self.wait_for_commit_claim(future)
+
+        Logger.debug(tag=_TAG, msg="commit_claim() end")
+
+    def send_commit_claim(self, success: bool, address: 'Address',
+                          block_height: int, block_hash: bytes,
+                          tx_index: int, tx_hash: bytes) -> concurrent.futures.Future:
+        """Sends COMMIT_CLAIM request without waiting for its response
+
+        :return: future to pass to wait_for_commit_claim()
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._commit_claim(success, address, block_height, block_hash, tx_index, tx_hash), self._loop)
 
+    def wait_for_commit_claim(self, future: concurrent.futures.Future):
+        """Waits for the response to a COMMIT_CLAIM request sent by send_commit_claim()
+
+        :exception TimeoutException: The operation has timed-out
+        """
         try:
             future.result(self._ipc_timeout)
 
@@ -286,8 +336,6 @@ class RewardCalcProxy(object):
             future.cancel()
             raise TimeoutException("COMMIT_CLAIM message to RewardCalculator has timed-out")
 
-        Logger.debug(tag=_TAG, msg="commit_claim() end")
-
     async def _commit_claim(self, success: bool, address: 'Address',
                             block_height: int, block_hash: bytes,
                             tx_index: int, tx_hash: bytes) -> 'CommitClaimResponse':
@@ -307,6 +355,8 @@ class RewardCalcProxy(object):
         future: asyncio.Future = self._message_queue.put(request)
         await future
 
+        self._invalidate_iscore_query_cache(address)
+
         Logger.debug(tag=_TAG, msg="_commit_claim() end")
 
         return future.result()
@@ -315,6 +365,8 @@ class RewardCalcProxy(object):
         """Returns the I-Score of a given address
 
         It should be called on query thread
+        Under query mode, the result is cached for iscore_query_cache_ttl seconds
+        and concurrent queries for the same address share one QUERY request
 
         :param address: the address to query
         :param tx_hash: the hash of transaction where this query is called, it should be None under query mode
@@ -325,6 +377,12 @@ class RewardCalcProxy(object):
 
         Logger.debug(tag=_TAG, msg="query_iscore() start")
 
+        if tx_hash is None:
+            response: Optional['QueryResponse'] = self._get_cached_iscore(self._get_iscore_query_key(address, block))
+            if response is not None:
+                Logger.debug(tag=_TAG, msg="query_iscore() end: cached")
+                return response.iscore, response.block_height
+
         future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(
             self._query_iscore(address, block, tx_hash), self._loop)
 
@@ -347,6 +405,42 @@ class RewardCalcProxy(object):
         """
         Logger.debug(tag=_TAG, msg="_query_iscore() start")
 
+        if tx_hash is not None:
+            response: 'QueryResponse' = await self._send_query_request(address, block, tx_hash)
+        else:
+            key: tuple = self._get_iscore_query_key(address, block)
+
+            response: Optional['QueryResponse'] = self._get_cached_iscore(key)
+            if response is None:
+                future: Optional[asyncio.Future] = self._iscore_query_futures.get(key)
+                if future is None:
+                    future = asyncio.ensure_future(self._query_iscore_to_cache(key, address, block))
+                    self._iscore_query_futures[key] = future
+
+                # A cancelled caller should not cancel the request which other callers are waiting for
+                response = await asyncio.shield(future)
+
+        Logger.debug(tag=_TAG, msg="_query_iscore() end")
+
+        return response
+
+    async def _query_iscore_to_cache(self, key: tuple, address: 'Address', block: Optional[Block]) -> 'QueryResponse':
+        generation: int = self._iscore_query_generation
+
+        try:
+            response: 'QueryResponse' = await self._send_query_request(address, block, None)
+        finally:
+            if self._iscore_query_futures.get(key) is asyncio.current_task():
+                del self._iscore_query_futures[key]
+
+        # The response can be stale if the cache was invalidated while waiting for it
+        if self._iscore_query_cache_ttl > 0 and generation == self._iscore_query_generation:
+            self._iscore_query_cache[key] = (time.monotonic() + self._iscore_query_cache_ttl, response)
+
+        return response
+
+    async def _send_query_request(self, address: 'Address', block: Optional[Block],
+                                  tx_hash: Optional[bytes]) -> 'QueryResponse':
         request = QueryRequest(
             address,
             block.height if block is not None else 0,
@@ -357,10 +451,40 @@ class RewardCalcProxy(object):
         future: asyncio.Future = self._message_queue.put(request)
         await future
 
-        Logger.debug(tag=_TAG, msg="_query_iscore() end")
-
         return future.result()
 
+    @staticmethod
+    def _get_iscore_query_key(address: 'Address', block: Optional[Block]) -> tuple:
+        if block is None:
+            return address, 0, None
+
+        return address, block.height, block.hash
+
+    def _get_cached_iscore(self, key: tuple) -> Optional['QueryResponse']:
+        item: Optional[Tuple[float, 'QueryResponse']] = self._iscore_query_cache.get(key)
+        if item is None or item[0] < time.monotonic():
+            return None
+
+        return item[1]
+
+    def _invalidate_iscore_query_cache(self, address: Optional['Address'] = None):
+        """Drops cached I-Score and detaches in-flight queries from new callers
+
+        It should be called on the event loop
+
+        :param address: the address whose I-Score has changed. None means every address
+        """
+        self._iscore_query_generation += 1
+
+        if address is None:
+            self._iscore_query_cache.clear()
+            self._iscore_query_futures.clear()
+            return
+
+        for items in (self._iscore_query_cache, self._iscore_query_futures):
+            for key in [key for key in items if key[0] == address]:
+                del items[key]
+
     def query_calculate_status(self) -> tuple:
         Logger.debug(tag=_TAG, msg="query_calculate_status() start")
 
@@ -456,6 +580,8 @@ class RewardCalcProxy(object):
         future: asyncio.Future = self._message_queue.put(request)
         await future
 
+        self._invalidate_iscore_query_cache()
+
         # Logger.debug(tag=_TAG, msg="_commit_block() end")
 
         return future.result()
@@ -524,6 +650,8 @@ class RewardCalcProxy(object):
         future: asyncio.Future = self._message_queue.put(request)
         await future
 
+        self._invalidate_iscore_query_cache()
+
         Logger.debug(tag=_TAG, msg="_rollback() end")
 
         return future.result()
@@ -542,6 +670,9 @@ class RewardCalcProxy(object):
 
     def calculate_done_handler(self, response: 'Response'):
         Logger.debug(tag=_TAG, msg=f"calculate_done_handler() start {response}")
+        # I-Score of every account can change with the calculation result
+        self._invalidate_iscore_query_cache()
+
         if self._calculate_done_callback is not None:
             self._calculate_done_callback(response)
 
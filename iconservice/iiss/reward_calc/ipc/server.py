@@ -15,24 +15,33 @@
 
 import asyncio
 from asyncio import StreamReader, StreamWriter
-from typing import Optional
+from typing import Optional, List, Union
 
 from iconcommons import Logger
-from .message import MessageType, Request
+from .message import MessageType, Request, Response
 from .message_queue import MessageQueue
 from .message_unpacker import MessageUnpacker
 
 _TAG = "RCP"
 
+# Requests queued while the previous write is drained are sent with a single write
+_MAX_REQUESTS_PER_WRITE = 1024
+_RECV_BUFFER_SIZE = 64 * 1024
+
 
 class IPCServer(object):
-    def __init__(self):
+    def __init__(self, log_interval: int = 1):
+        """
+        :param log_interval: log every n-th message sent or received. 0 means no message logging
+        """
         self._running = False
         self._loop = None
         self._path = None
         self._queue: Optional['MessageQueue'] = None
         self._unpacker: Optional['MessageUnpacker'] = MessageUnpacker()
         self._tasks = []
+        self._log_interval: int = log_interval
+        self._message_count: int = 0
 
     def open(self, loop,  message_queue: 'MessageQueue', path: str):
         Logger.info(tag=_TAG, msg="open() start")
@@ -93,19 +102,32 @@ class IPCServer(object):
 
         while self._running:
             try:
-                request: 'Request' = await self._queue.get()
-                self._queue.task_done()
-
-                if request.msg_type == MessageType.NONE:
-                    # Stopping IPCServer
+                requests: List['Request'] = await self._get_requests()
+                stopped: bool = False
+                chunks: List[bytes] = []
+
+                for request in requests:
+                    if request.msg_type == MessageType.NONE:
+                        # Stopping IPCServer
+                        stopped = True
+                        break
+
+                    try:
+                        data: bytes = request.to_bytes()
+                    except BaseException as e:
+                        Logger.warning(tag=_TAG, msg=str(e))
+                        continue
+
+                    self._log_message("Sending Data", request, data)
+                    chunks.append(data)
+
+                if len(chunks) > 0:
+                    writer.write(b"".join(chunks))
+                    await writer.drain()
+
+                if stopped:
                     break
 
-                data: bytes = request.to_bytes()
-                Logger.debug(tag=_TAG, msg=f"on_send(): data({data.hex()}")
-                Logger.info(tag=_TAG, msg=f"Sending Data : {request}")
-                writer.write(data)
-                await writer.drain()
-
             except asyncio.CancelledError:
                 # task got cancel request. stop service
                 break
@@ -116,21 +138,39 @@ class IPCServer(object):
 
         Logger.info(tag=_TAG, msg="_on_send() end")
 
+    async def _get_requests(self) -> List['Request']:
+        """Waits for a request and takes the other requests queued behind it
+
+        :return: requests to send with a single write
+        """
+        request: 'Request' = await self._queue.get()
+        self._queue.task_done()
+        requests: List['Request'] = [request]
+
+        while len(requests) < _MAX_REQUESTS_PER_WRITE:
+            try:
+                request = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+
+            self._queue.task_done()
+            requests.append(request)
+
+        return requests
+
     async def _on_recv(self, reader: 'StreamReader'):
         Logger.info(tag=_TAG, msg="_on_recv() start")
 
         while self._running:
             try:
-                data: bytes = await reader.read(1024)
+                data: bytes = await reader.read(_RECV_BUFFER_SIZE)
                 if not isinstance(data, bytes) or len(data) == 0:
                     break
 
-                Logger.debug(tag=_TAG, msg=f"_on_recv(): data({data.hex()})")
-
                 self._unpacker.feed(data)
 
                 for response in self._unpacker:
-                    Logger.info(tag=_TAG, msg=f"Received Data : {response}")
+                    self._log_message("Received Data", response)
                     self._queue.message_handler(response)
 
             except asyncio.CancelledError:
@@ -140,3 +180,21 @@ class IPCServer(object):
                 Logger.warning(tag=_TAG, msg=str(e))
 
         Logger.info(tag=_TAG, msg="_on_recv() end")
+
+    def _log_message(self, prefix: str, message: Union['Request', 'Response'], data: bytes = None):
+        """Logs only every n-th message not to format every message on a busy IPC channel
+
+        :param prefix:
+        :param message: request or response
+        :param data: encoded request
+        """
+        if self._log_interval <= 0:
+            return
+
+        self._message_count += 1
+        if self._message_count % self._log_interval != 0:
+            return
+
+        if data is not None:
+            Logger.debug(tag=_TAG, msg=f"{prefix} : data({data.hex()})")
+        Logger.info(tag=_TAG, msg=f"{prefix} : {message}")
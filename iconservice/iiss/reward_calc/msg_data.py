@@ -34,6 +34,9 @@ class TxType(IntEnum):
 
 
 class Data:
+    # Value made by make_value() on the first call to get_encoded_value()
+    _encoded_value: Optional[bytes] = None
+
     @abstractmethod
     def make_key(self, *args, **kwargs) -> bytes:
         pass
@@ -42,6 +45,17 @@ class Data:
     def make_value(self) -> bytes:
         pass
 
+    def get_encoded_value(self) -> bytes:
+        """Returns the value encoded only once
+
+        Data in rc_block_batch is written to the precommit data log, IissWAL and RC DB,
+        so it should not be changed after being put to the batch.
+        """
+        if self._encoded_value is None:
+            self._encoded_value = self.make_value()
+
+        return self._encoded_value
+
     @staticmethod
     def from_bytes(*args, **kwargs) -> 'Data':
         pass
@@ -111,7 +111,7 @@ class PrecommitDataWriter:
             else:
                 key: bytes = data.make_key()
 
-            value: bytes = data.make_value()
+            value: bytes = data.get_encoded_value()
             new_list.append({
                 "key": key,
                 "value": value
@@ -325,6 +325,19 @@ class PrecommitDataManager(object):
         self._remove_sibling_precommit_data(block)
         del self._precommit_data_mapper[self._root.block.hash]
         self._set_root(node)
+        self._rebuild_overlays(node)
+
+    @classmethod
+    def _rebuild_overlays(cls, parent: 'PrecommitDataManager.Node'):
+        """Exclude the states which have been written to stateDB from the overlays of descendant block batches
+
+        :param parent: the node whose children's overlays are rebuilt
+        """
+        prev_overlay: Optional[dict] = None if parent.is_root() else parent.precommit_data.block_batch.overlay
+
+        for child in parent.children():
+            child.precommit_data.block_batch.set_prev_overlay(prev_overlay)
+            cls._rebuild_overlays(child)
 
     def _remove_sibling_precommit_data(self, block_to_commit: 'Block'):
         """Remove the sibling blocks whose height is the same as that of the block to commit
@@ -35,6 +35,13 @@ class PRepDictType(Enum):
 
 
 class PRep(Sortable):
+    __slots__ = (
+        "_address", "_flags", "_stake", "_delegated", "_status", "_penalty", "_grade",
+        "_name", "_country", "_city", "_email", "_website", "_details", "_p2p_endpoint",
+        "_irep", "_irep_block_height", "_last_generate_block_height", "_block_height", "_tx_index",
+        "_total_blocks", "_validated_blocks", "_unvalidated_sequence_blocks", "_is_frozen", "_node_address"
+    )
+
     PREFIX: bytes = b"prep"
     _VERSION: int = 2
     _UNKNOWN_COUNTRY = iso3166.Country(u"Unknown", "ZZ", "ZZZ", "000", u"Unknown")
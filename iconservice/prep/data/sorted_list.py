@@ -18,6 +18,8 @@ from typing import Union, Iterable, List, Optional
 
 
 class Sortable(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def order(self):
         pass
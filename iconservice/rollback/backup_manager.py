@@ -15,18 +15,19 @@
 
 import os
 from enum import Flag
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, List, Tuple
 
 from iconcommons import Logger
+from iconservice.database.batch import BlockBatch
 from iconservice.database.db import KeyValueDatabase
 from iconservice.database.wal import WriteAheadLogWriter
 from iconservice.icon_constant import ROLLBACK_LOG_TAG
 from iconservice.rollback import get_backup_filename
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
     from iconservice.database.wal import IissWAL
     from iconservice.base.block import Block
-    from iconservice.database.batch import BlockBatch
 
 TAG = ROLLBACK_LOG_TAG
 
@@ -71,9 +72,15 @@ class BackupManager(object):
             block_batch: 'BlockBatch',
             iiss_wal: 'IissWAL',
             is_calc_period_start_block: bool,
-            instant_block_hash: bytes):
+            instant_block_hash: bytes,
+            executor: Optional['Executor'] = None) -> Optional['Future']:
         """Backup the previous block state
 
+        The previous values in rc_db are read on the calling thread
+        because rc_db is written right after this call.
+        If executor is given, the rest of the backup which reads icx_db and writes a backup file
+        is done on the executor. block_batch MUST NOT be written to icx_db until the returned future is done
+
         :param icx_db:
         :param rc_db:
         :param revision:
@@ -82,13 +89,34 @@ class BackupManager(object):
         :param iiss_wal:
         :param is_calc_period_start_block:
         :param instant_block_hash:
-        :return:
+        :param executor: executor to write a backup file on
+        :return: future for writing a backup file if executor is given, otherwise None
         """
         Logger.debug(tag=TAG, msg="backup() start")
 
         path: str = self._get_backup_file_path(prev_block.height)
         Logger.info(tag=TAG, msg=f"backup_file_path={path}")
 
+        rc_db_items: List[Tuple[bytes, Optional[bytes]]] = self._get_rc_db_items(rc_db, iiss_wal)
+        args = (path, revision, prev_block, instant_block_hash, is_calc_period_start_block,
+                rc_db_items, icx_db, block_batch)
+
+        if executor is None:
+            self._write_backup_file(*args)
+            return None
+
+        return executor.submit(self._write_backup_file, *args)
+
+    @classmethod
+    def _write_backup_file(cls,
+                           path: str,
+                           revision: int,
+                           prev_block: 'Block',
+                           instant_block_hash: bytes,
+                           is_calc_period_start_block: bool,
+                           rc_db_items: List[Tuple[bytes, Optional[bytes]]],
+                           icx_db: 'KeyValueDatabase',
+                           block_batch: 'BlockBatch'):
         writer = WriteAheadLogWriter(
             revision, max_log_count=2, block=prev_block, instant_block_hash=instant_block_hash)
         writer.open(path)
@@ -96,30 +124,36 @@ class BackupManager(object):
         if is_calc_period_start_block:
             writer.write_state(WALBackupState.CALC_PERIOD_END_BLOCK.value)
 
-        self._backup_rc_db(writer, rc_db, iiss_wal)
-        self._backup_state_db(writer, icx_db, block_batch)
+        writer.write_walogable(rc_db_items)
+        cls._backup_state_db(writer, icx_db, block_batch)
 
         writer.close()
 
         Logger.debug(tag=TAG, msg="backup() end")
 
     @classmethod
-    def _backup_rc_db(cls, writer: 'WriteAheadLogWriter', db: 'KeyValueDatabase', iiss_wal: 'IissWAL'):
-        def get_rc_db_generator():
-            for key, _ in iiss_wal:
-                value: Optional[bytes] = db.get(key)
-                yield key, value
-
-        writer.write_walogable(get_rc_db_generator())
+    def _get_rc_db_items(cls, db: 'KeyValueDatabase', iiss_wal: 'IissWAL') -> List[Tuple[bytes, Optional[bytes]]]:
+        keys: List[bytes] = [key for key, _ in iiss_wal]
+        return list(zip(keys, db.get_many(keys)))
 
     @classmethod
     def _backup_state_db(cls, writer: 'WriteAheadLogWriter', db: 'KeyValueDatabase', block_batch: 'BlockBatch'):
         if block_batch is None:
             block_batch = {}
 
+        # Pre-images captured during invoke save reading the previous values from state_db
+        pre_images: dict = block_batch.pre_images if isinstance(block_batch, BlockBatch) else {}
+
+        # The keys which are written without being read during invoke
+        keys: List[bytes] = [key for key in block_batch if key not in pre_images]
+        values: dict = dict(zip(keys, db.get_many(keys)))
+
         def get_state_db_generator():
             for key in block_batch:
-                value: Optional[bytes] = db.get(key)
+                if key in pre_images:
+                    value: Optional[bytes] = pre_images[key]
+                else:
+                    value: Optional[bytes] = values[key]
                 yield key, value
 
         writer.write_walogable(get_state_db_generator())
@@ -10,6 +10,8 @@ import hashlib
 import numbers
 import operator
 
+BLOOM_BYTE_SIZE = 256
+
 
 def get_chunks_for_bloom(value_hash):
     yield value_hash[:2]
@@ -29,6 +31,15 @@ def get_bloom_bits(value):
         yield bloom_bits
 
 
+def get_bloom_bit_indexes(value):
+    value_hash = hashlib.sha3_256(value).digest()
+    return (
+        ((value_hash[0] << 8) + value_hash[1]) & 2047,
+        ((value_hash[2] << 8) + value_hash[3]) & 2047,
+        ((value_hash[4] << 8) + value_hash[5]) & 2047
+    )
+
+
 class BloomFilter(numbers.Number):
     value = None
 
@@ -45,8 +56,26 @@ class BloomFilter(numbers.Number):
             self.value |= bloom_bits
 
     def extend(self, iterable):
+        """Adds all values at once
+
+        Duplicated values are hashed only once and the bits are collected in a bytearray
+        so that a big integer is created only once instead of per bit
+        """
+        values = set()
         for value in iterable:
-            self.add(value)
+            if not isinstance(value, bytes):
+                raise TypeError("Value must be of type `bytes`")
+            values.add(value)
+
+        if len(values) == 0:
+            return
+
+        bloom_bytes = bytearray(BLOOM_BYTE_SIZE)
+        for value in values:
+            for index in get_bloom_bit_indexes(value):
+                bloom_bytes[BLOOM_BYTE_SIZE - 1 - (index >> 3)] |= 1 << (index & 7)
+
+        self.value |= int.from_bytes(bloom_bytes, "big")
 
     @classmethod
     def from_iterable(cls, iterable):
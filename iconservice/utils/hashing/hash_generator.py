@@ -14,7 +14,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import hashlib
 from typing import Union, Iterable
 
@@ -28,8 +27,7 @@ class HashGenerator:
 
     @classmethod
     def generate_origin(cls, origin_data: dict) -> str:
-        copied_origin_data = copy.deepcopy(origin_data)
-        return cls._ORIGIN_GENERATOR.generate(copied_origin_data)
+        return cls._ORIGIN_GENERATOR.generate(origin_data)
 
     @classmethod
     def generate_salted_origin(cls, origin_data: dict) -> str:
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import abc
+import re
 
 
 class HashOriginGenerator(abc.ABC):
@@ -37,38 +38,46 @@ class HashOriginGeneratorV1(HashOriginGenerator):
         ".": "\\."
     })
 
-    def generate(self, json_data: dict):
-
-        def encode(data):
-            if isinstance(data, dict):
-                return encode_dict(data)
-            elif isinstance(data, list):
-                return encode_list(data)
-            else:
-                return escape(data)
-
-        def encode_dict(data: dict):
-            result = ".".join(_encode_dict(data))
-            return "{" + result + "}"
-
-        def _encode_dict(data: dict):
-            for key in sorted(data.keys()):
-                yield key
-                yield encode(data[key])
-
-        def encode_list(data: list):
-            result = ".".join(_encode_list(data))
-            return f"[" + result + "]"
-
-        def _encode_list(data: list):
-            for item in data:
-                yield encode(item)
-
-        def escape(data):
-            if data is None:
-                return "\\0"
-
-            data = str(data)
-            return data.translate(self._translator)
-
-        return ".".join(_encode_dict(json_data))
+    # Most of values are hex strings or addresses which have nothing to escape
+    _escape_pattern = re.compile(r"[\\{}\[\].]")
+
+    def generate(self, json_data: dict) -> str:
+        parts = []
+        self._encode_dict(parts, json_data)
+        return "".join(parts)
+
+    def _encode(self, parts: list, data):
+        if isinstance(data, dict):
+            parts.append("{")
+            self._encode_dict(parts, data)
+            parts.append("}")
+        elif isinstance(data, list):
+            parts.append("[")
+            self._encode_list(parts, data)
+            parts.append("]")
+        else:
+            parts.append(self._escape(data))
+
+    def _encode_dict(self, parts: list, data: dict):
+        for i, key in enumerate(sorted(data)):
+            if i > 0:
+                parts.append(".")
+            parts.append(key)
+            parts.append(".")
+            self._encode(parts, data[key])
+
+    def _encode_list(self, parts: list, data: list):
+        for i, item in enumerate(data):
+            if i > 0:
+                parts.append(".")
+            self._encode(parts, item)
+
+    def _escape(self, data) -> str:
+        if data is None:
+            return "\\0"
+
+        data = str(data)
+        if self._escape_pattern.search(data) is None:
+            return data
+
+        return data.translate(self._translator)
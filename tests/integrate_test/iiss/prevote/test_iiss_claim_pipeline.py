@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""claimIScore pipeline testcase
+
+Blocks with claimIScore transactions should have the same results
+whether CLAIM requests are sent ahead of the transactions or not.
+"""
+
+import concurrent.futures
+from typing import TYPE_CHECKING, Dict, List, Tuple
+from unittest.mock import Mock, patch
+
+from iconservice.base.address import SYSTEM_SCORE_ADDRESS
+from iconservice.base.exception import TimeoutException
+from iconservice.base.transaction import Transaction
+from iconservice.icon_constant import ConfigKey, Revision, ICX_IN_LOOP, IconScoreContextType
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class RewardCalcStub(object):
+    """Claims I-Score on behalf of reward calculator
+
+    An account which has already claimed in a block gets no I-Score until the claim is committed or reverted.
+    """
+
+    def __init__(self, iscores: Dict['Address', int]):
+        self.iscores: Dict['Address', int] = dict(iscores)
+        self.claims: Dict[bytes, Tuple['Address', int]] = {}
+        self.messages: List[tuple] = []
+
+    def install(self, proxy):
+        for name in ("claim_iscore", "send_claim_iscore", "get_claim_iscore_result",
+                     "commit_claim", "send_commit_claim", "wait_for_commit_claim", "query_iscore"):
+            setattr(proxy, name, getattr(self, name))
+
+    def claim_iscore(self, address: 'Address', block_height: int, _block_hash: bytes,
+                     _tx_index: int, tx_hash: bytes) -> Tuple[int, int]:
+        self.messages.append(("CLAIM", address))
+
+        claimed: bool = any(claim[0] == address for claim in self.claims.values())
+        iscore: int = 0 if claimed else self.iscores.get(address, 0)
+        self.claims[tx_hash] = (address, iscore)
+
+        return iscore, block_height
+
+    def send_claim_iscore(self, *args) -> 'concurrent.futures.Future':
+        future = concurrent.futures.Future()
+        future.set_result(self.claim_iscore(*args))
+        return future
+
+    @staticmethod
+    def get_claim_iscore_result(future: 'concurrent.futures.Future') -> Tuple[int, int]:
+        return future.result()
+
+    def commit_claim(self, success: bool, address: 'Address', _block_height: int, _block_hash: bytes,
+                     _tx_index: int, tx_hash: bytes):
+        self.messages.append(("COMMIT_CLAIM", address, success))
+
+        _, iscore = self.claims.pop(tx_hash)
+        if success:
+            self.iscores[address] -= iscore
+
+    def send_commit_claim(self, *args) -> 'concurrent.futures.Future':
+        future = concurrent.futures.Future()
+        future.set_result(self.commit_claim(*args))
+        return future
+
+    @staticmethod
+    def wait_for_commit_claim(future: 'concurrent.futures.Future'):
+        future.result()
+
+    def query_iscore(self, address: 'Address', block, _tx_hash) -> Tuple[int, int]:
+        claimed: bool = any(claim[0] == address for claim in self.claims.values())
+        iscore: int = 0 if claimed else self.iscores.get(address, 0)
+        self.messages.append(("QUERY", address, iscore))
+
+        return iscore, block.height
+
+
+class TestIISSClaimPipeline(TestIISSBase):
+    CLAIM_PIPELINE = True
+
+    def _make_init_config(self) -> dict:
+        conf: dict = super()._make_init_config()
+        conf[ConfigKey.ISCORE_CLAIM_PIPELINE] = self.CLAIM_PIPELINE
+        return conf
+
+    def setUp(self):
+        super().setUp()
+        self.update_governance()
+        self.set_revision(Revision.LATEST.value)
+        self.distribute_icx(accounts=self._accounts[:4], init_balance=10 * ICX_IN_LOOP)
+
+        self.rc = RewardCalcStub({account.address: (i + 1) * 10 ** 6 for i, account in enumerate(self._accounts[:4])})
+        self.rc.install(IconScoreContext.engine.iiss._reward_calc_proxy)
+
+    def _get_claimed_iscores(self, tx_results: List['TransactionResult']) -> List[tuple]:
+        return [
+            (tx_result.status, [event_log.data for event_log in tx_result.event_logs])
+            for tx_result in tx_results
+        ]
+
+    def test_claim(self):
+        accounts = self._accounts
+        balances: List[int] = [self.get_balance(account) for account in accounts[:4]]
+
+        tx_list: List[dict] = [
+            self.create_claim_tx(accounts[0]),
+            self.create_claim_tx(accounts[1]),
+            self.create_transfer_icx_tx(accounts[2], accounts[3], ICX_IN_LOOP),
+            # The second claim of an account in a block gets no I-Score
+            self.create_claim_tx(accounts[0]),
+            # Fails before claiming I-Score
+            self.create_score_call_tx(from_=accounts[2],
+                                      to_=SYSTEM_SCORE_ADDRESS,
+                                      func_name="claimIScore",
+                                      params={},
+                                      value=5),
+        ]
+        block, hash_list = self.make_and_req_block(tx_list)
+        self._write_precommit_state(block)
+        tx_results: List['TransactionResult'] = self.get_tx_results(hash_list)
+
+        self.assertEqual([
+            (1, [[1 * 10 ** 6, 1000]]),
+            (1, [[2 * 10 ** 6, 2000]]),
+            (1, []),
+            (1, [[0, 0]]),
+            (0, []),
+        ], self._get_claimed_iscores(tx_results))
+
+        fees: List[int] = [tx_result.step_price * tx_result.step_used for tx_result in tx_results]
+        self.assertEqual(balances[0] + 1000 - fees[0] - fees[3], self.get_balance(accounts[0]))
+        self.assertEqual(balances[1] + 2000 - fees[1], self.get_balance(accounts[1]))
+        self.assertEqual(balances[2] - ICX_IN_LOOP - fees[2] - fees[4], self.get_balance(accounts[2]))
+
+        self.assertEqual([0, 0, 3 * 10 ** 6, 4 * 10 ** 6],
+                         [self.rc.iscores[account.address] for account in accounts[:4]])
+        self.assertEqual([], [claim for claim in self.rc.claims.values() if claim[1] > 0])
+
+        # The claim of an account which claims twice in a block is not sent ahead
+        claims: List['Address'] = [message[1] for message in self.rc.messages if message[0] == "CLAIM"]
+        if self.CLAIM_PIPELINE:
+            self.assertEqual([accounts[1].address, accounts[2].address, accounts[0].address, accounts[0].address],
+                             claims)
+        else:
+            self.assertEqual([accounts[0].address, accounts[1].address, accounts[0].address], claims)
+
+    def test_query_iscore_in_transaction(self):
+        accounts = self._accounts
+
+        tx_list: List[dict] = [
+            self.create_score_call_tx(from_=accounts[2],
+                                      to_=SYSTEM_SCORE_ADDRESS,
+                                      func_name="queryIScore",
+                                      params={"address": str(accounts[1].address)}),
+            self.create_claim_tx(accounts[1]),
+        ]
+        tx_results: List['TransactionResult'] = self.process_confirm_block_tx(tx_list)
+
+        self.assertEqual((1, [[2 * 10 ** 6, 2000]]), self._get_claimed_iscores(tx_results)[1])
+        self.assertEqual(0, self.rc.iscores[accounts[1].address])
+        # The query should not see the claim of the next transaction
+        self.assertIn(("QUERY", accounts[1].address, 2 * 10 ** 6), self.rc.messages)
+        self.assertEqual([], [claim for claim in self.rc.claims.values() if claim[1] > 0])
+
+    def test_failed_block(self):
+        accounts = self._accounts
+        tx_list: List[dict] = [
+            self.create_claim_tx(accounts[0]),
+            self.create_claim_tx(accounts[1]),
+        ]
+
+        invoke_request = IconServiceEngine._invoke_request
+
+        def mocked_invoke_request(engine, context, request, index):
+            if index == 1:
+                raise Exception("failed block")
+            return invoke_request(engine, context, request, index)
+
+        with patch.object(IconServiceEngine, "_invoke_request", mocked_invoke_request):
+            with self.assertRaises(Exception):
+                self.make_and_req_block(tx_list)
+
+        # The claim sent ahead for the transaction which is not executed is reverted
+        if self.CLAIM_PIPELINE:
+            self.assertIn(("COMMIT_CLAIM", accounts[1].address, False), self.rc.messages)
+        self.assertNotIn(accounts[1].address, [message[1] for message in self.rc.messages if message[0] == "QUERY"])
+        self.assertEqual([], [claim for claim in self.rc.claims.values() if claim[0] == accounts[1].address])
+        self.assertEqual(2 * 10 ** 6, self.rc.iscores[accounts[1].address])
+        self.assertEqual({}, IconScoreContext.engine.iiss._pending_claims)
+
+    def test_failed_block_with_commit_claim_timeout(self):
+        if not self.CLAIM_PIPELINE:
+            self.skipTest("COMMIT_CLAIM requests are waited for only in the claim pipeline")
+
+        accounts = self._accounts
+        tx_list: List[dict] = [
+            self.create_claim_tx(accounts[0]),
+            self.create_claim_tx(accounts[1]),
+        ]
+
+        # Reward calculator does not respond to COMMIT_CLAIM requests
+        def send_commit_claim(*args) -> 'concurrent.futures.Future':
+            self.rc.commit_claim(*args)
+            return concurrent.futures.Future()
+
+        def wait_for_commit_claim(_future: 'concurrent.futures.Future'):
+            raise TimeoutException("COMMIT_CLAIM message to RewardCalculator has timed-out")
+
+        proxy = IconScoreContext.engine.iiss._reward_calc_proxy
+        proxy.send_commit_claim = send_commit_claim
+        proxy.wait_for_commit_claim = Mock(side_effect=wait_for_commit_claim)
+
+        invoke_request = IconServiceEngine._invoke_request
+        exception = Exception("failed block")
+
+        def mocked_invoke_request(engine, context, request, index):
+            if index == 1:
+                raise exception
+            return invoke_request(engine, context, request, index)
+
+        with patch.object(IconServiceEngine, "_invoke_request", mocked_invoke_request):
+            with self.assertRaises(Exception) as cm:
+                self.make_and_req_block(tx_list)
+
+        # The exception which fails the block surfaces without waiting for reward calculator
+        self.assertIs(exception, cm.exception)
+        proxy.wait_for_commit_claim.assert_not_called()
+        self.assertIn(("COMMIT_CLAIM", accounts[1].address, False), self.rc.messages)
+        self.assertEqual({}, IconScoreContext.engine.iiss._pending_claims)
+
+    def test_query_iscore_on_estimation(self):
+        accounts = self._accounts
+        tx_list: List[dict] = [
+            self.create_transfer_icx_tx(accounts[2], accounts[3], ICX_IN_LOOP),
+            self.create_claim_tx(accounts[1]),
+        ]
+
+        invoke_request = IconServiceEngine._invoke_request
+
+        def mocked_invoke_request(engine, context, request, index):
+            if index == 0:
+                # debug_estimateStep runs on another thread while a block is invoked
+                estimate_context = engine._context_factory.create(IconScoreContextType.ESTIMATION, context.block)
+                estimate_context.tx = Transaction(tx_hash=request["params"]["txHash"], index=0)
+                IconScoreContext.engine.iiss.handle_query_iscore(estimate_context, accounts[1].address)
+            return invoke_request(engine, context, request, index)
+
+        with patch.object(IconServiceEngine, "_invoke_request", mocked_invoke_request):
+            tx_results: List['TransactionResult'] = self.process_confirm_block_tx(tx_list)
+
+        # The estimation does not revert the claim sent ahead
+        self.assertEqual((1, [[2 * 10 ** 6, 2000]]), self._get_claimed_iscores(tx_results)[1])
+        self.assertNotIn(("COMMIT_CLAIM", accounts[1].address, False), self.rc.messages)
+        self.assertEqual(0, self.rc.iscores[accounts[1].address])
+
+
+class TestIISSClaimWithoutPipeline(TestIISSClaimPipeline):
+    CLAIM_PIPELINE = False
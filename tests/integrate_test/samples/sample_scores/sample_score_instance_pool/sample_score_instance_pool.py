@@ -0,0 +1,39 @@
+from iconservice import *
+
+
+class SampleScoreInstancePool(IconScoreBase):
+
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._value = VarDB('value', db, value_type=int)
+        self._values = DictDB('values', db, value_type=int)
+
+    def on_install(self) -> None:
+        super().on_install()
+
+    def on_update(self) -> None:
+        super().on_update()
+
+    @external
+    def set_value(self, value: int) -> None:
+        self._value.set(value)
+        self._values[self.msg.sender] = value
+
+    @external(readonly=True)
+    def get_value(self) -> int:
+        return self._value.get()
+
+    @external
+    def set_value_by_self_call(self, value: int) -> None:
+        self.call(self.address, "set_value", {"value": value})
+        self._value.set(self._value.get() + 1)
+
+    @external
+    def set_member(self, value: int) -> None:
+        # Changes member variables out of __init__()
+        self._member = value
+        self._value.set(value)
+
+    @external(readonly=True)
+    def has_member(self) -> bool:
+        return "_member" in self.__dict__
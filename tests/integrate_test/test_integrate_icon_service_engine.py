@@ -19,13 +19,14 @@
 import hashlib
 import time
 import unittest
+from unittest.mock import patch
 
 from iconservice.base.address import AddressPrefix, MalformedAddress, GOVERNANCE_SCORE_ADDRESS
 from iconservice.base.block import Block
 from iconservice.base.exception import ExceptionCode, InvalidParamsException
 from iconservice.base.type_converter import TypeConverter
 from iconservice.base.type_converter_templates import ParamType
-from iconservice.icon_constant import ConfigKey
+from iconservice.icon_constant import ConfigKey, IconScoreContextType
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.iconscore.icon_score_result import TransactionResult
 from iconservice.utils import icx_to_loop
@@ -555,6 +556,35 @@ class TestIconServiceEngine(TestIntegrateBase):
         self.assertEqual(ExceptionCode.INVALID_PARAMETER, e.code)
         self.assertTrue(e.message.startswith('No precommit data'))
 
+    def test_query_during_commit(self):
+        to = create_address()
+        value: int = icx_to_loop(1)
+        tx = self.create_transfer_icx_tx(self._admin, to, value)
+        block, _ = self.make_and_req_block([tx])
+
+        # Queries which start after the states are written should read the new states
+        # even before the last block is updated
+        balances = []
+
+        def query_balance(func):
+            def wrapper(*args, **kwargs):
+                context = self.icon_service_engine._context_factory.create(
+                    IconScoreContextType.QUERY, self.icon_service_engine._get_last_block())
+                balances.append(IconScoreContext.storage.icx.get_account(context, to).balance)
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        with patch.object(IconScoreContext.storage.icx, "set_last_block",
+                          query_balance(IconScoreContext.storage.icx.set_last_block)), \
+                patch.object(IconScoreContext.engine.inv, "commit",
+                             query_balance(IconScoreContext.engine.inv.commit)), \
+                patch.object(self.icon_service_engine._precommit_data_manager, "commit",
+                             query_balance(self.icon_service_engine._precommit_data_manager.commit)):
+            self._write_precommit_state(block)
+
+        self.assertEqual([value] * 3, balances)
+
     def test_commit_change_block_hash(self):
         block_height = 1
         self._to = create_address(AddressPrefix.CONTRACT)
@@ -689,6 +719,28 @@ class TestIconServiceEngine(TestIntegrateBase):
                 converted_request['method'], converted_request['params'])
             self.assertEqual(0, balance)
 
+    def test_validate_transactions(self):
+        empty_account = create_address()
+        txs = [
+            self.create_transfer_icx_tx(self._admin, self._accounts[0], 1, disable_pre_validate=True),
+            self.create_transfer_icx_tx(empty_account, self._accounts[0], 1, disable_pre_validate=True),
+            self.create_transfer_icx_tx(self._admin, self._accounts[1], 1, disable_pre_validate=True)
+        ]
+        origin_requests = [{'params': self.make_origin_params(tx['params'])} for tx in txs]
+
+        results = self.icon_service_engine.validate_transactions(txs, origin_requests)
+
+        self.assertEqual(3, len(results))
+        self.assertIsNone(results[0])
+        self.assertEqual(ExceptionCode.OUT_OF_BALANCE, results[1].code)
+        self.assertIsNone(results[2])
+        for tx, origin_request, result in zip(txs, origin_requests, results):
+            if result is None:
+                self.icon_service_engine.validate_transaction(tx, origin_request)
+            else:
+                with self.assertRaises(type(result)):
+                    self.icon_service_engine.validate_transaction(tx, origin_request)
+
 
 if __name__ == '__main__':
     unittest.main()
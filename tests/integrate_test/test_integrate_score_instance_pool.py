@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SCORE instance pool testcase
+
+Every scenario runs on two SCOREs deployed from the same package:
+one is called with the SCORE instance pool and the other without it.
+Both should return the same results and use the same steps.
+"""
+
+from typing import TYPE_CHECKING, List, Tuple
+
+from iconservice.icon_constant import ConfigKey, Revision, IconScoreContextType
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_mapper_object import IconScoreInfo
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateScoreInstancePool(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.SCORE_INSTANCE_POOL: True}
+
+    def setUp(self):
+        super().setUp()
+        self.update_governance()
+        self.set_revision(Revision.LATEST.value)
+
+    def _deploy_scores(self, score_name: str) -> Tuple['Address', 'Address']:
+        addresses = []
+        for _ in range(2):
+            tx_results: List['TransactionResult'] = self.deploy_score(score_root="sample_scores",
+                                                                      score_name=score_name,
+                                                                      from_=self._accounts[0])
+            addresses.append(tx_results[0].score_address)
+
+        return addresses[0], addresses[1]
+
+    def _score_call(self, use_pool: bool, score_address: 'Address', func_name: str, params: dict = None):
+        IconScoreContext.score_instance_pool = use_pool
+        try:
+            tx_results: List['TransactionResult'] = self.score_call(from_=self._accounts[0],
+                                                                    to_=score_address,
+                                                                    func_name=func_name,
+                                                                    params=params)
+            return tx_results[0].status, tx_results[0].step_used
+        finally:
+            IconScoreContext.score_instance_pool = True
+
+    def _query_score(self, use_pool: bool, score_address: 'Address', func_name: str):
+        IconScoreContext.score_instance_pool = use_pool
+        try:
+            return self.query_score(from_=self._accounts[0], to_=score_address, func_name=func_name)
+        finally:
+            IconScoreContext.score_instance_pool = True
+
+    @staticmethod
+    def _get_score_info(score_address: 'Address') -> 'IconScoreInfo':
+        return IconScoreContext.icon_score_mapper[score_address]
+
+    def _check_same_results(self,
+                            pooled_score_address: 'Address',
+                            score_address: 'Address',
+                            func_name: str,
+                            params: dict = None):
+        self.assertEqual(self._score_call(False, score_address, func_name, params),
+                         self._score_call(True, pooled_score_address, func_name, params))
+
+    def test_reuse_score_instance(self):
+        pooled_score_address, score_address = self._deploy_scores("sample_score_instance_pool")
+
+        for value in range(3):
+            self._check_same_results(pooled_score_address, score_address, "set_value", {"value": hex(value)})
+            self.assertEqual(self._query_score(False, score_address, "get_value"),
+                             self._query_score(True, pooled_score_address, "get_value"))
+
+        score_info: 'IconScoreInfo' = self._get_score_info(pooled_score_address)
+        pooled_score = score_info.acquire_score(self._create_query_context())
+        score_info.release_score(pooled_score)
+        self.assertTrue(score_info.poolable)
+        self.assertIs(pooled_score, score_info.acquire_score(self._create_query_context()))
+
+    def test_reentrancy(self):
+        pooled_score_address, score_address = self._deploy_scores("sample_score_instance_pool")
+
+        self._check_same_results(pooled_score_address, score_address, "set_value_by_self_call", {"value": "0x5"})
+        self.assertEqual(6, self._query_score(True, pooled_score_address, "get_value"))
+        self.assertTrue(self._get_score_info(pooled_score_address).poolable)
+
+    def test_refuse_score_changing_member_variables(self):
+        pooled_score_address, score_address = self._deploy_scores("sample_score_instance_pool")
+
+        self._check_same_results(pooled_score_address, score_address, "set_member", {"value": "0x1"})
+        self.assertFalse(self._get_score_info(pooled_score_address).poolable)
+
+        # Member variables changed in the previous call should not be seen
+        self.assertFalse(self._query_score(True, pooled_score_address, "has_member"))
+        self._check_same_results(pooled_score_address, score_address, "set_value", {"value": "0x2"})
+
+    def test_refuse_score_accessing_db_on_init(self):
+        # ArrayDB reads its size from the state DB when it is created
+        pooled_score_address, score_address = self._deploy_scores("sample_array_db")
+
+        for _ in range(2):
+            self._check_same_results(pooled_score_address, score_address, "set_values")
+        self.assertFalse(self._get_score_info(pooled_score_address).poolable)
+
+    def test_refuse_score_having_non_container_member_variables(self):
+        pooled_score_address, score_address = self._deploy_scores("sample_member_variable_score")
+
+        self.assertEqual("__init__", self._query_score(True, pooled_score_address, "getName"))
+        self.assertEqual("__init__", self._query_score(False, score_address, "getName"))
+        self.assertFalse(self._get_score_info(pooled_score_address).poolable)
+
+    def _create_query_context(self) -> 'IconScoreContext':
+        context = self.icon_service_engine._context_factory.create(
+            IconScoreContextType.QUERY, self.icon_service_engine._get_last_block())
+        context.set_step_counter()
+        return context
@@ -171,6 +171,30 @@ class TestBatch(unittest.TestCase):
         ret = block_batch.digest()
         self.assertEqual(expected, ret)
 
+    def test_digest_over_chunks(self):
+        block_batch = self.block_batch
+
+        # Large enough for the data to be hashed over several chunks
+        tx_batch = TransactionBatch(create_hash_256())
+        data = []
+        for i in range(3000):
+            key = create_hash_256()
+            if i % 3 == 0:
+                value = None
+            else:
+                value = i.to_bytes(4, 'big')
+            include_state_root_hash = i % 7 != 0
+            tx_batch[key] = TransactionBatchValue(value, include_state_root_hash)
+
+            if include_state_root_hash:
+                data.append(key)
+                if value is not None:
+                    data.append(value)
+
+        block_batch.update(tx_batch)
+        expected = sha3_256(b'|'.join(data))
+        self.assertEqual(expected, block_batch.digest())
+
     def test_block_batch_update_tx_index(self):
         block_batch = self.block_batch
 
@@ -55,6 +55,16 @@ class TestKeyValueDatabase(unittest.TestCase):
         value = db.get(b'key1')
         self.assertIsNone(value)
 
+    def test_get_many(self):
+        db = self.db
+
+        db.put(b'key0', b'value0')
+        db.put(b'key2', b'value2')
+
+        self.assertEqual([b'value0', None, b'value2'], db.get_many([b'key0', b'key1', b'key2']))
+        self.assertEqual([None], db.get_many([b'key1']))
+        self.assertEqual([], db.get_many([]))
+
     def test_write_batch(self):
         data = {
             b'key0': BlockBatchValue(b'value0', True, [-1]),
@@ -68,6 +78,140 @@ class TestKeyValueDatabase(unittest.TestCase):
         self.assertEqual(b'value0', db.get(b'key0'))
 
 
+class TestKeyValueDatabaseWithCache(unittest.TestCase):
+
+    def setUp(self):
+        self.state_db_root_path = 'state_db'
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+
+        self.db = KeyValueDatabase.from_path(self.state_db_root_path, True, cache_size=1024)
+
+    def tearDown(self):
+        self.db.close()
+        rmtree(self.state_db_root_path)
+
+    def test_get(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+        self.assertIsNone(db.get(b'key1'))
+
+        status: dict = db.cache.get_status()
+        self.assertEqual(2, status["hits"])
+        self.assertEqual(2, status["misses"])
+        self.assertEqual(2, status["count"])
+
+    def test_invalidate(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+
+        data = {
+            b'key0': BlockBatchValue(None, True, [-1]),
+            b'key1': BlockBatchValue(b'value1', True, [-1])
+        }
+        db.write_batch(StateWAL(data))
+        self.assertIsNone(db.get(b'key0'))
+        self.assertEqual(b'value1', db.get(b'key1'))
+
+        db.delete(b'key1')
+        self.assertIsNone(db.get(b'key1'))
+
+        db.put(b'key1', b'value2')
+        self.assertEqual(b'value2', db.get(b'key1'))
+
+    def test_stale_value_is_not_cached(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+
+        # Assume that the value has been read from LevelDB before it is overwritten
+        hit, _, generation = db.cache.get(b'key0')
+        self.assertFalse(hit)
+        db.put(b'key0', b'value1')
+        db.cache.put(b'key0', b'value0', generation)
+
+        self.assertEqual(b'value1', db.get(b'key0'))
+
+    def test_eviction(self):
+        db = self.db
+        value = b'v' * 300
+        for i in range(5):
+            db.put(i.to_bytes(1, 'big'), value)
+            db.get(i.to_bytes(1, 'big'))
+
+        status: dict = db.cache.get_status()
+        self.assertLessEqual(status["size"], status["maxSize"])
+        self.assertEqual(3, status["evictions"])
+        self.assertEqual(2, status["count"])
+        self.assertEqual(value, db.get(b'\x00'))
+
+
+class TestKeyValueSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.state_db_root_path = 'state_db'
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+
+    def tearDown(self):
+        rmtree(self.state_db_root_path)
+
+    def _test_get(self, cache_size: int):
+        db = KeyValueDatabase.from_path(self.state_db_root_path, True, cache_size=cache_size)
+        self.assertIsNone(db.snapshot)
+
+        db.put(b'key0', b'value0')
+        snapshot = db.take_snapshot()
+        self.assertIs(snapshot, db.snapshot)
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+
+        data = {
+            b'key0': BlockBatchValue(b'value1', True, [-1]),
+            b'key1': BlockBatchValue(b'value2', True, [-1])
+        }
+        db.write_batch(StateWAL(data))
+
+        # The states written after taking a snapshot are not visible through it
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+        self.assertIsNone(snapshot.get(b'key1'))
+        self.assertEqual(b'value1', db.get(b'key0'))
+
+        new_snapshot = db.take_snapshot()
+        self.assertEqual(b'value1', new_snapshot.get(b'key0'))
+        self.assertEqual(b'value2', new_snapshot.get(b'key1'))
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+
+        db.close()
+
+    def test_get(self):
+        self._test_get(cache_size=0)
+
+    def test_get_with_cache(self):
+        self._test_get(cache_size=1024)
+
+    def test_query_context(self):
+        context_db = ContextDatabase.from_path(self.state_db_root_path, True)
+        key_value_db = context_db.key_value_db
+        key_value_db.put(b'key0', b'value0')
+
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        self.assertEqual(b'value0', context_db.get(context, b'key0'))
+
+        context.snapshot = key_value_db.take_snapshot()
+        key_value_db.put(b'key0', b'value1')
+        self.assertEqual(b'value0', context_db.get(context, b'key0'))
+
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        self.assertEqual(b'value1', context_db.get(context, b'key0'))
+
+        key_value_db.close()
+
+
 class TestContextDatabaseOnWriteMode(unittest.TestCase):
     def setUp(self):
         state_db_root_path = 'state_db'
@@ -106,6 +250,40 @@ class TestContextDatabaseOnWriteMode(unittest.TestCase):
         value = self.context_db.get(context, address.body)
         self.assertEqual(100, int.from_bytes(value, 'big'))
 
+    def test_pre_images(self):
+        context = self.context
+        context_db = self.context_db
+        context_db.key_value_db.put(b'key0', b'value0')
+
+        context_db.get(context, b'key0')
+        context_db.get(context, b'key1')
+        context_db.put(context, b'key0', b'new value0')
+        context_db.put(context, b'key2', b'value2')
+        self.assertEqual(b'new value0', context_db.get(context, b'key0'))
+
+        context.block_batch.update(context.tx_batch)
+        context.tx_batch.clear()
+        self.assertEqual(b'value2', context_db.get(context, b'key2'))
+
+        # Only the values which have been read before this block changes them are kept
+        self.assertEqual({b'key0': b'value0', b'key1': None}, context.block_batch.pre_images)
+
+    def test_get_many(self):
+        context = self.context
+        context_db = self.context_db
+        context_db.key_value_db.put(b'key0', b'value0')
+        context_db.key_value_db.put(b'key1', b'value1')
+
+        context_db.put(context, b'key1', b'new value1')
+        context.block_batch.update(context.tx_batch)
+        context.tx_batch.clear()
+        context_db.put(context, b'key2', b'value2')
+
+        keys = [b'key0', b'key1', b'key2', b'key3']
+        self.assertEqual([context_db.get(context, key) for key in keys], context_db.get_many(context, keys))
+        self.assertEqual([b'value0', b'new value1', b'value2', None], context_db.get_many(context, keys))
+        self.assertEqual({b'key0': b'value0', b'key3': None}, context.block_batch.pre_images)
+
     def test_put(self):
         """WritableDatabase supports put()
         """
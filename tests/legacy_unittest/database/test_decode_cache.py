@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock
+
+import pytest
+
+from iconservice.base.block import Block
+from iconservice.database.decode_cache import BlockDecodeCache
+from iconservice.icon_constant import IconScoreContextType
+
+
+class Value(object):
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def copy(self) -> 'Value':
+        return Value(self.data)
+
+
+@pytest.fixture
+def context():
+    context = Mock()
+    context.type = IconScoreContextType.INVOKE
+    context.block = Block(1, None, 0, None, 0)
+    return context
+
+
+@pytest.fixture
+def from_bytes():
+    return Mock(side_effect=Value)
+
+
+def test_get(context, from_bytes):
+    cache = BlockDecodeCache()
+
+    value = cache.get(context, b"key", b"value", from_bytes)
+    assert value.data == b"value"
+
+    # Decoded once while the value is not changed and callers get a copy
+    value.data = b"changed"
+    assert cache.get(context, b"key", b"value", from_bytes).data == b"value"
+    assert from_bytes.call_count == 1
+
+    # Decoded again for a new value
+    assert cache.get(context, b"key", b"new value", from_bytes).data == b"new value"
+    assert from_bytes.call_count == 2
+
+
+def test_put(context, from_bytes):
+    cache = BlockDecodeCache()
+
+    cache.put(context, b"key", b"value", Value(b"value"))
+    assert cache.get(context, b"key", b"value", from_bytes).data == b"value"
+    from_bytes.assert_not_called()
+
+
+@pytest.mark.parametrize("context_type", [IconScoreContextType.QUERY, IconScoreContextType.ESTIMATION, None])
+def test_not_cached_out_of_invoke(context, from_bytes, context_type):
+    cache = BlockDecodeCache()
+    if context_type is None:
+        context = None
+    else:
+        context.type = context_type
+
+    cache.put(context, b"key", b"value", Value(b"value"))
+    cache.get(context, b"key", b"value", from_bytes)
+    cache.get(context, b"key", b"value", from_bytes)
+    assert from_bytes.call_count == 2
+
+
+def test_reset_on_new_block(context, from_bytes):
+    cache = BlockDecodeCache()
+    cache.get(context, b"key", b"value", from_bytes)
+
+    context.block = Block(2, None, 0, None, 0)
+    cache.get(context, b"key", b"value", from_bytes)
+    assert from_bytes.call_count == 2
+
+    cache.clear()
+    cache.get(context, b"key", b"value", from_bytes)
+    assert from_bytes.call_count == 3
@@ -150,3 +150,73 @@ class TestTransactionBatch(unittest.TestCase):
         block_batch = BlockBatch()
         block_batch.update(tx_batch)
         self.assertEqual(BlockBatchValue(b'value0', True, [-1]), block_batch[b'key0'])
+
+    def test_revert_call_with_overwritten_keys(self):
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value0', True)
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value1', True)
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value2', True)
+        tx_batch[b'key1'] = TransactionBatchValue(b'value3', True)
+        self.assertEqual(TransactionBatchValue(b'value2', True), tx_batch[b'key0'])
+
+        # The values recorded by the outer call are visible again after revert
+        tx_batch.revert_call()
+        self.assertEqual(TransactionBatchValue(b'value1', True), tx_batch[b'key0'])
+        self.assertIsNone(tx_batch[b'key1'])
+        self.assertFalse(b'key1' in tx_batch)
+        tx_batch.leave_call()
+
+        tx_batch.revert_call()
+        self.assertEqual(TransactionBatchValue(b'value0', True), tx_batch[b'key0'])
+        tx_batch.leave_call()
+
+        self.assertEqual(TransactionBatchValue(b'value0', True), tx_batch[b'key0'])
+
+        tx_batch.clear()
+        self.assertFalse(b'key0' in tx_batch)
+
+
+class TestBlockBatch(unittest.TestCase):
+    def test_overlay(self):
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value0', True)
+        tx_batch[b'key1'] = TransactionBatchValue(b'value1', True)
+
+        prev_block_batch = BlockBatch()
+        prev_block_batch.update(tx_batch)
+        self.assertEqual(dict(prev_block_batch), prev_block_batch.overlay)
+
+        tx_batch = TransactionBatch()
+        tx_batch[b'key1'] = TransactionBatchValue(b'value2', True, 0)
+
+        block_batch = BlockBatch()
+        block_batch.set_prev_overlay(prev_block_batch.overlay)
+        block_batch.update(tx_batch)
+
+        # The newest value is found in the overlay
+        self.assertEqual(BlockBatchValue(b'value0', True, [-1]), block_batch.overlay[b'key0'])
+        self.assertEqual(BlockBatchValue(b'value2', True, [0]), block_batch.overlay[b'key1'])
+        self.assertEqual([b'key1'], list(block_batch))
+
+        # The prev block has been committed to stateDB
+        block_batch.set_prev_overlay(None)
+        self.assertEqual(dict(block_batch), block_batch.overlay)
+
+        block_batch.clear()
+        self.assertEqual({}, block_batch.overlay)
+
+    def test_pre_images(self):
+        block_batch = BlockBatch()
+        block_batch.set_pre_image(b'key0', b'value0')
+        block_batch.set_pre_image(b'key1', None)
+
+        # The first pre-image is kept
+        block_batch.set_pre_image(b'key0', b'value1')
+        self.assertEqual({b'key0': b'value0', b'key1': None}, block_batch.pre_images)
+
+        block_batch.clear()
+        self.assertEqual({}, block_batch.pre_images)
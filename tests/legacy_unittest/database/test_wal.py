@@ -16,6 +16,7 @@
 import os
 import random
 import unittest
+from unittest.mock import patch
 
 import pytest
 
@@ -113,6 +114,36 @@ class TestWriteAheadLog(unittest.TestCase):
 
         reader.close()
 
+    def test_flush_state(self):
+        revision = Revision.IISS.value
+        log_count = 2
+        instant_block_hash = create_block_hash()
+
+        for group_sync, expected_fsync_count in ((False, 2), (True, 1)):
+            writer = WriteAheadLogWriter(
+                revision, log_count, self.block, instant_block_hash, group_sync=group_sync)
+            writer.open(self.path)
+
+            with patch("iconservice.database.wal.os.fsync") as fsync:
+                writer.write_walogable(WALogableData(self.log_data[0]))
+                writer.write_walogable(WALogableData(self.log_data[1]))
+                writer.flush()
+
+                writer.write_state(WALState.WRITE_RC_DB.value, add=True)
+                writer.flush_state()
+                assert fsync.call_count == expected_fsync_count
+
+            writer.close()
+
+            # The state change is visible to the reader even if it is not fsynced
+            reader = WriteAheadLogReader()
+            reader.open(self.path)
+            assert reader.state == WALState.WRITE_RC_DB.value
+            assert reader.log_count == log_count
+            for i in range(log_count):
+                assert dict(reader.get_iterator(i)) == self.log_data[i]
+            reader.close()
+
     def test_invalid_magic_key(self):
         revision = Revision.IISS.value
         log_count = 2
@@ -14,6 +14,8 @@
 from __future__ import unicode_literals
 import itertools
 
+import pytest
+
 from hypothesis import (
     strategies as st,
     given,
@@ -78,6 +80,28 @@ def test_bloom_filter_from_iterable_method(log_entries):
     check_bloom(bloom, log_entries)
 
 
+@given(log_entries)
+@settings(max_examples=2000)
+def test_bloom_filter_extend_equals_add(log_entries):
+    bloom = BloomFilter()
+    expected_bloom = BloomFilter()
+
+    for address, topics in log_entries:
+        bloom.extend(itertools.chain([address, address], topics))
+        expected_bloom.add(address)
+        for topic in topics:
+            expected_bloom.add(topic)
+
+    assert int(bloom) == int(expected_bloom)
+
+
+def test_bloom_filter_extend_with_invalid_value():
+    bloom = BloomFilter()
+
+    with pytest.raises(TypeError):
+        bloom.extend([b'value', 'value'])
+
+
 def test_casting_to_integer():
     bloom = BloomFilter()
 
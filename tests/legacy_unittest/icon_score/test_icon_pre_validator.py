@@ -24,7 +24,7 @@ from iconservice.base.address import SYSTEM_SCORE_ADDRESS
 from iconservice.base.exception import ExceptionCode, InvalidRequestException, \
     InvalidParamsException, OutOfBalanceException
 from iconservice.deploy import DeployEngine
-from iconservice.icon_constant import MAX_DATA_SIZE, FIXED_FEE
+from iconservice.icon_constant import MAX_DATA_SIZE, FIXED_FEE, DeployState
 from iconservice.iconscore.icon_pre_validator import IconPreValidator
 from iconservice.iconscore.icon_score_context import IconScoreContext, IconScoreContextType
 from iconservice.icx import IcxEngine, IcxStorage
@@ -250,6 +250,13 @@ class TestTransactionValidator(unittest.TestCase):
                 self.assertEqual(e.exception.code, ExceptionCode.ILLEGAL_FORMAT)
                 self.assertEqual(e.exception.message, "Invalid message length")
 
+        # The size measured by the caller is used as it is
+        with patch('iconservice.iconscore.icon_pre_validator.get_input_data_size') as mock:
+            self.validator._check_input_data_size({"data": ANY}, MAX_DATA_SIZE)
+            with self.assertRaises(InvalidRequestException):
+                self.validator._check_input_data_size({"data": ANY}, MAX_DATA_SIZE + 1)
+            mock.assert_not_called()
+
     def test_check_from_can_charge_fee_v2(self):
         self.validator._check_balance = Mock()
 
@@ -637,6 +644,26 @@ class TestTransactionValidator(unittest.TestCase):
             e.exception.message,
             f"Out of balance: from={_from} balance={balance} value={value} fee={fee}")
 
+    def test_check_balance_with_cache(self):
+        validator = IconPreValidator(use_cache=True)
+        IconScoreContext.engine.icx.get_balance = Mock(return_value=200)
+        _from = create_address()
+
+        validator._check_balance(self.context, _from, 100, 10)
+        validator._check_balance(self.context, _from, 150, 10)
+        IconScoreContext.engine.icx.get_balance.assert_called_once_with(self.context, _from)
+
+        with self.assertRaises(OutOfBalanceException):
+            validator._check_balance(self.context, _from, 200, 10)
+
+        deploy_info = Mock(deploy_state=DeployState.ACTIVE)
+        IconScoreContext.storage.deploy.get_deploy_info = Mock(return_value=deploy_info)
+        score_address = create_address(1)
+
+        self.assertTrue(validator._is_score_active(self.context, score_address))
+        self.assertTrue(validator._is_score_active(self.context, score_address))
+        IconScoreContext.storage.deploy.get_deploy_info.assert_called_once_with(self.context, score_address)
+
     def test_is_inactive_score(self):
         address = create_address()
         self.validator._is_score_active = Mock(return_value=True)
@@ -24,7 +24,7 @@ from iconservice.database.db import ContextDatabase
 from iconservice.deploy import DeployStorage
 from iconservice.deploy.storage import \
     IconScoreDeployTXParams, IconScoreDeployInfo, DeployType, DeployState
-from iconservice.icon_constant import ZERO_TX_HASH
+from iconservice.icon_constant import ZERO_TX_HASH, IconScoreContextType
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from tests import create_tx_hash, create_address
 
@@ -290,6 +290,7 @@ class TestIconScoreDeployStorage(unittest.TestCase):
 
     def test_put_deploy_info(self):
         context = Mock(spec=IconScoreContext)
+        context.type = IconScoreContextType.DIRECT
         score_address = create_address(1)
         deploy_info = IconScoreDeployInfo(
             score_address, DeployState.INACTIVE, create_address(), ZERO_TX_HASH, create_tx_hash())
@@ -301,6 +302,7 @@ class TestIconScoreDeployStorage(unittest.TestCase):
 
     def test_get_deploy_info(self):
         context = Mock(spec=IconScoreContext)
+        context.type = IconScoreContextType.DIRECT
 
         score_address = create_address(1)
         self.storage._create_db_key = Mock(return_value=score_address.to_bytes())
@@ -314,6 +316,43 @@ class TestIconScoreDeployStorage(unittest.TestCase):
         self.storage._db.get = Mock(return_value=deploy_info.to_bytes())
         self.assertEqual(deploy_info.to_bytes(), self.storage.get_deploy_info(context, score_address).to_bytes())
 
+    @patch('iconservice.deploy.storage.IconScoreDeployInfo.from_bytes', side_effect=IconScoreDeployInfo.from_bytes)
+    def test_get_deploy_info_with_cache(self, from_bytes):
+        context = Mock(spec=IconScoreContext)
+        context.type = IconScoreContextType.INVOKE
+        context.block = Mock(height=1)
+
+        score_address = create_address(1)
+        deploy_info = IconScoreDeployInfo(
+            score_address, DeployState.INACTIVE, create_address(), ZERO_TX_HASH, create_tx_hash())
+        self.storage._db.get = Mock(return_value=deploy_info.to_bytes())
+
+        ret = self.storage.get_deploy_info(context, score_address)
+        ret.deploy_state = DeployState.ACTIVE
+        ret = self.storage.get_deploy_info(context, score_address)
+        self.assertEqual(deploy_info.to_bytes(), ret.to_bytes())
+        from_bytes.assert_called_once()
+
+        # The deploy info which has just been written is not decoded again
+        ret.deploy_state = DeployState.ACTIVE
+        self.storage.put_deploy_info(context, ret)
+        self.storage._db.get = Mock(return_value=ret.to_bytes())
+        self.assertEqual(ret.to_bytes(), self.storage.get_deploy_info(context, score_address).to_bytes())
+        from_bytes.assert_called_once()
+
+        # The value in db has been changed, e.g. by revert_call()
+        self.storage._db.get = Mock(return_value=deploy_info.to_bytes())
+        self.assertEqual(deploy_info.to_bytes(), self.storage.get_deploy_info(context, score_address).to_bytes())
+        self.assertEqual(2, from_bytes.call_count)
+
+        # The cache is cleared on a new block and on rollback
+        context.block = Mock(height=2)
+        self.storage.get_deploy_info(context, score_address)
+        self.assertEqual(3, from_bytes.call_count)
+        self.storage.rollback(context, 1, create_tx_hash())
+        self.storage.get_deploy_info(context, score_address)
+        self.assertEqual(4, from_bytes.call_count)
+
     def test_put_deploy_tx_params(self):
         context = Mock(spec=IconScoreContext)
         tx_hash = create_tx_hash()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.icon_constant import RCCalculateResult
+from iconservice.iiss.reward_calc.ipc.message import *
+from iconservice.iiss.reward_calc.ipc.message_queue import MessageQueue
+from iconservice.iiss.reward_calc.ipc.server import IPCServer
+from tools.rc_emulator.emulator import RewardCalcEmulator
+
+
+class TestRewardCalcEmulator(unittest.TestCase):
+    def setUp(self):
+        self.prev_loop = asyncio.get_event_loop()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.notifications = []
+        self.queue = MessageQueue(self.loop, notify_message=(), notify_handler=self.notifications.append)
+
+        self.path = tempfile.mkdtemp()
+        self.sock_path = os.path.join(self.path, "test.sock")
+
+        self.server = IPCServer(log_interval=0)
+        self.server.open(self.loop, self.queue, self.sock_path)
+        self.server.start()
+
+        self.address = Address.from_data(AddressPrefix.EOA, b"address")
+        self.emulator = RewardCalcEmulator(iscore_table={self.address: 5000}, default_iscore=10)
+        self.emulator_task = asyncio.ensure_future(self.emulator.run(self.sock_path), loop=self.loop)
+
+    def tearDown(self):
+        self.queue.put(NoneRequest(), wait_for_response=False)
+        self.server.stop()
+        self.loop.run_until_complete(asyncio.gather(*self.server._tasks, return_exceptions=True))
+        self.loop.run_until_complete(asyncio.wait_for(self.emulator_task, 5))
+        self.server.close()
+        self.loop.close()
+        asyncio.set_event_loop(self.prev_loop)
+        shutil.rmtree(self.path)
+
+    def _request(self, request: 'Request') -> 'Response':
+        return self.loop.run_until_complete(asyncio.wait_for(self.queue.put(request), 5))
+
+    def test_ready(self):
+        response: 'VersionResponse' = self._request(VersionRequest())
+        self.assertEqual(MessageType.VERSION, response.MSG_TYPE)
+        self.assertIsInstance(self.notifications[0], ReadyNotification)
+
+    def test_claim(self):
+        other = Address.from_data(AddressPrefix.EOA, b"other")
+        block_hash: bytes = os.urandom(32)
+        tx_hash: bytes = os.urandom(32)
+
+        response: 'QueryResponse' = self._request(QueryRequest(other, 1, None, None))
+        self.assertEqual((other, 10), (response.address, response.iscore))
+
+        response: 'ClaimResponse' = self._request(ClaimRequest(self.address, 1, block_hash, 0, tx_hash))
+        self.assertEqual((self.address, 1, block_hash, 0, tx_hash, 5000),
+                         (response.address, response.block_height, response.block_hash,
+                          response.tx_index, response.tx_hash, response.iscore))
+
+        self._request(CommitClaimRequest(False, self.address, 1, block_hash, 0, tx_hash))
+        self.assertEqual(5000, self._request(QueryRequest(self.address, 1, None, None)).iscore)
+
+        self._request(ClaimRequest(self.address, 1, block_hash, 0, tx_hash))
+        self._request(CommitClaimRequest(True, self.address, 1, block_hash, 0, tx_hash))
+        self.assertEqual(0, self._request(QueryRequest(self.address, 1, None, None)).iscore)
+
+    def test_calculate(self):
+        response: 'CalculateResponse' = self._request(CalculateRequest("iiss_db_path", 10))
+        self.assertEqual((RCCalculateResult.SUCCESS, 10), (response.status, response.block_height))
+
+        response: 'QueryCalculateResultResponse' = self._request(QueryCalculateResultRequest(10))
+        self.assertEqual((RCCalculateResult.SUCCESS, 10, 5000),
+                         (response.status, response.block_height, response.iscore))
+
+        notification: 'CalculateDoneNotification' = self.notifications[-1]
+        self.assertIsInstance(notification, CalculateDoneNotification)
+        self.assertEqual((True, 10, 5000, response.state_hash),
+                         (notification.success, notification.block_height,
+                          notification.iscore, notification.state_hash))
+
+        response: 'QueryCalculateResultResponse' = self._request(QueryCalculateResultRequest(20))
+        self.assertEqual(RCCalculateResult.INVALID_BLOCK_HEIGHT, response.status)
+
+    def test_block(self):
+        block_hash: bytes = os.urandom(32)
+
+        response: 'StartBlockResponse' = self._request(StartBlockRequest(1, block_hash))
+        self.assertEqual((1, block_hash), (response.block_height, response.block_hash))
+
+        response: 'CommitBlockResponse' = self._request(CommitBlockRequest(True, 1, block_hash))
+        self.assertEqual((True, 1, block_hash), (response.success, response.block_height, response.block_hash))
+
+        response: 'RollbackResponse' = self._request(RollbackRequest(0, bytes(32)))
+        self.assertEqual((True, 0, bytes(32)), (response.success, response.block_height, response.block_hash))
+
+        response: 'InitResponse' = self._request(InitRequest(0))
+        self.assertEqual((True, 0), (response.success, response.block_height))
+
+        self.assertEqual(1, self.emulator.message_counts[MessageType.COMMIT_BLOCK])
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import unittest
+from typing import List
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.base.block import Block
+from iconservice.iiss.reward_calc.ipc.message import *
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+
+
+class MessageQueueStub(object):
+    """Keeps requests and lets a test respond to them
+    """
+
+    def __init__(self, loop: 'asyncio.AbstractEventLoop'):
+        self._loop = loop
+        self.requests: List['Request'] = []
+        self.futures: List['asyncio.Future'] = []
+
+    def put(self, request: 'Request', wait_for_response: bool = True) -> 'asyncio.Future':
+        future: asyncio.Future = self._loop.create_future()
+        self.requests.append(request)
+        self.futures.append(future)
+        return future
+
+    def respond(self, index: int, response: 'Response'):
+        self.futures[index].set_result(response)
+
+
+class TestRewardCalcProxy(unittest.TestCase):
+    def setUp(self):
+        self.prev_loop = asyncio.get_event_loop()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.queue = MessageQueueStub(self.loop)
+
+        self.proxy = RewardCalcProxy(icon_rc_path="", ipc_timeout=5, iscore_query_cache_ttl=60)
+        self.proxy._loop = self.loop
+        self.proxy._message_queue = self.queue
+
+        self.address = Address.from_data(AddressPrefix.EOA, b"address")
+        self.block = Block(block_height=10, block_hash=os.urandom(32), timestamp=0, prev_hash=os.urandom(32))
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(self.prev_loop)
+
+    def _start_query(self, address: 'Address', tx_hash: bytes = None) -> 'asyncio.Future':
+        task = asyncio.ensure_future(self.proxy._query_iscore(address, self.block, tx_hash), loop=self.loop)
+        self._run_once()
+        return task
+
+    def _run_once(self):
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+    def _respond_query(self, index: int, iscore: int):
+        request: 'QueryRequest' = self.queue.requests[index]
+        self.queue.respond(index, QueryResponse(request.msg_id, request.address, self.block.height, iscore))
+
+    def _query_once(self, iscore: int) -> int:
+        """Queries I-Score of self.address and responds with a given I-Score if a request is sent
+        """
+        count: int = len(self.queue.requests)
+        task = self._start_query(self.address)
+        if len(self.queue.requests) > count:
+            self._respond_query(count, iscore)
+        return self.loop.run_until_complete(task).iscore
+
+    def test_coalesce_queries(self):
+        tasks = [self._start_query(self.address) for _ in range(3)]
+        other_task = self._start_query(Address.from_data(AddressPrefix.EOA, b"other"))
+        self.assertEqual(2, len(self.queue.requests))
+
+        self._respond_query(0, 100)
+        self._respond_query(1, 200)
+
+        responses = self.loop.run_until_complete(asyncio.gather(*tasks, other_task))
+        self.assertEqual([100, 100, 100, 200], [response.iscore for response in responses])
+        self.assertEqual({}, self.proxy._iscore_query_futures)
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        task = self._start_query(self.address)
+        cancelled_task = self._start_query(self.address)
+
+        cancelled_task.cancel()
+        self._run_once()
+
+        self._respond_query(0, 100)
+        self.assertEqual(100, self.loop.run_until_complete(task).iscore)
+
+    def test_cache(self):
+        self.assertEqual(100, self._query_once(100))
+        self.assertEqual(1, len(self.queue.requests))
+
+        # Cached I-Score is returned without a request both on the event loop and on query threads
+        response = self.loop.run_until_complete(self.proxy._query_iscore(self.address, self.block, None))
+        self.assertEqual(100, response.iscore)
+        key: tuple = self.proxy._get_iscore_query_key(self.address, self.block)
+        self.assertEqual(100, self.proxy._get_cached_iscore(key).iscore)
+        self.assertEqual(1, len(self.queue.requests))
+
+        # Expired
+        self.proxy._iscore_query_cache[key] = (0, self.proxy._iscore_query_cache[key][1])
+        self.assertEqual(200, self._query_once(200))
+        self.assertEqual(2, len(self.queue.requests))
+
+    def test_no_cache(self):
+        self.proxy._iscore_query_cache_ttl = 0
+
+        self.assertEqual(100, self._query_once(100))
+        self.assertEqual(200, self._query_once(200))
+        self.assertEqual(2, len(self.queue.requests))
+
+    def test_query_in_invoke(self):
+        self._query_once(100)
+
+        # I-Score queried in a transaction is neither cached nor shared
+        tasks = [self._start_query(self.address, os.urandom(32)) for _ in range(2)]
+        self.assertEqual(3, len(self.queue.requests))
+
+        self._respond_query(1, 0)
+        self._respond_query(2, 0)
+        responses = self.loop.run_until_complete(asyncio.gather(*tasks))
+        self.assertEqual([0, 0], [response.iscore for response in responses])
+        self.assertEqual(100, self._query_once(0))
+
+    def test_invalidate_on_commit_claim(self):
+        other = Address.from_data(AddressPrefix.EOA, b"other")
+        self._query_once(100)
+        task = self._start_query(other)
+        self._respond_query(1, 200)
+        self.loop.run_until_complete(task)
+
+        commit_task = asyncio.ensure_future(
+            self.proxy._commit_claim(True, self.address, 11, os.urandom(32), 0, os.urandom(32)), loop=self.loop)
+        self._run_once()
+        self.queue.respond(2, CommitClaimResponse(self.queue.requests[2].msg_id))
+        self.loop.run_until_complete(commit_task)
+
+        self.assertEqual(0, self._query_once(0))
+        self.assertEqual(4, len(self.queue.requests))
+
+        task = self._start_query(other)
+        self.assertEqual(200, self.loop.run_until_complete(task).iscore)
+        self.assertEqual(4, len(self.queue.requests))
+
+    def test_invalidate_on_commit_block(self):
+        self._query_once(100)
+
+        commit_task = asyncio.ensure_future(
+            self.proxy._commit_block(True, 11, os.urandom(32)), loop=self.loop)
+        self._run_once()
+        request: 'CommitBlockRequest' = self.queue.requests[1]
+        self.queue.respond(1, CommitBlockResponse(request.msg_id, True, 11, request.block_hash))
+        self.loop.run_until_complete(commit_task)
+
+        self.assertEqual(0, self._query_once(0))
+        self.assertEqual(3, len(self.queue.requests))
+
+    def test_response_after_invalidation_is_not_cached(self):
+        task = self._start_query(self.address)
+
+        self.proxy.calculate_done_handler(CalculateDoneNotification(0, True, 10, 0, bytes(32)))
+
+        # A query after invalidation does not join the request sent before it
+        new_task = self._start_query(self.address)
+        self.assertEqual(2, len(self.queue.requests))
+
+        self._respond_query(0, 100)
+        self._respond_query(1, 200)
+        self.assertEqual(100, self.loop.run_until_complete(task).iscore)
+        self.assertEqual(200, self.loop.run_until_complete(new_task).iscore)
+        self.assertEqual(200, self._query_once(300))
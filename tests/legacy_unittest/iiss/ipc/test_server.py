@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+import msgpack
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.iiss.reward_calc.ipc.message import (
+    MessageType, NoneRequest, QueryRequest, QueryResponse
+)
+from iconservice.iiss.reward_calc.ipc.message_queue import MessageQueue
+from iconservice.iiss.reward_calc.ipc.server import IPCServer
+from iconservice.utils import int_to_bytes
+
+
+class StandInRewardCalculator(object):
+    """Answers QueryRequests over the unix socket like icon_rc does
+    """
+
+    def __init__(self):
+        self.writes: int = 0
+        self.requests = []
+
+    async def run(self, path: str, count: int):
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(msgpack.dumps((MessageType.READY, 0, (1, 0, b"\x00" * 32))))
+
+        unpacker = msgpack.Unpacker(raw=True)
+        while len(self.requests) < count:
+            data: bytes = await reader.read(64 * 1024)
+
+            self.writes += 1
+            unpacker.feed(data)
+
+            for msg_type, msg_id, payload in unpacker:
+                self.requests.append(msg_id)
+                address, block_height = payload[0], payload[1]
+                writer.write(msgpack.dumps((msg_type, msg_id, (address, int_to_bytes(msg_id), block_height))))
+
+        await writer.drain()
+        writer.close()
+
+
+class TestIPCServer(unittest.TestCase):
+    def setUp(self):
+        self.prev_loop = asyncio.get_event_loop()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.notifications = []
+        self.queue = MessageQueue(self.loop, notify_message=(), notify_handler=self.notifications.append)
+
+        self.path = tempfile.mkdtemp()
+        self.sock_path = os.path.join(self.path, "test.sock")
+
+        self.server = IPCServer(log_interval=0)
+        self.server.open(self.loop, self.queue, self.sock_path)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.loop.run_until_complete(asyncio.gather(*self.server._tasks, return_exceptions=True))
+        self.server.close()
+        self.loop.close()
+        asyncio.set_event_loop(self.prev_loop)
+        shutil.rmtree(self.path)
+
+    def test_get_requests(self):
+        requests = [NoneRequest() for _ in range(3)]
+        for request in requests:
+            self.queue.put(request, wait_for_response=False)
+
+        self.assertEqual(requests, self.loop.run_until_complete(self.server._get_requests()))
+
+        with self.assertRaises(asyncio.QueueEmpty):
+            self.queue.get_nowait()
+
+    def test_send_queued_requests_at_once(self):
+        address = Address.from_data(AddressPrefix.EOA, b"address")
+        requests = [QueryRequest(address, i, None, None) for i in range(100)]
+        futures = [self.queue.put(request) for request in requests]
+
+        rc = StandInRewardCalculator()
+        self.loop.run_until_complete(asyncio.wait_for(rc.run(self.sock_path, len(requests)), 5))
+
+        self.assertEqual(1, rc.writes)
+        self.assertEqual([request.msg_id for request in requests], rc.requests)
+        self.assertEqual(MessageType.READY, self.notifications[0].MSG_TYPE)
+
+        self.loop.run_until_complete(asyncio.wait(futures, timeout=5))
+        for request, future in zip(requests, futures):
+            response: 'QueryResponse' = future.result()
+            self.assertIsInstance(response, QueryResponse)
+            self.assertEqual(address, response.address)
+            self.assertEqual(request.block_height, response.block_height)
+            self.assertEqual(request.msg_id, response.iscore)
@@ -94,6 +94,9 @@ def _create_inner_task(
     def state_get(self, key):
         return state_db.get(key)
 
+    def state_get_many(self, keys):
+        return [state_db.get(key) for key in keys]
+
     def rc_put(key, value):
         rc_db[key] = value
 
@@ -101,8 +104,10 @@ def _create_inner_task(
         return rc_db.get(key)
 
     context_db = Mock(spec=ContextDatabase)
-    context_db.key_value_db = state_db
+    context_db.key_value_db = Mock(spec=KeyValueDatabase)
+    context_db.key_value_db.snapshot = None
     context_db.get = state_get
+    context_db.get_many = state_get_many
     context_db.put = state_put
 
     iiss_mock_db = Mock(spec=KeyValueDatabase)
@@ -169,6 +174,9 @@ def _create_service_engine(
     def state_get(self, key):
         return state_db.get(key)
 
+    def state_get_many(self, keys):
+        return [state_db.get(key) for key in keys]
+
     def rc_put(key, value):
         rc_db[key] = value
 
@@ -176,8 +184,10 @@ def _create_service_engine(
         return rc_db.get(key)
 
     context_db = Mock(spec=ContextDatabase)
-    context_db.key_value_db = state_db
+    context_db.key_value_db = Mock(spec=KeyValueDatabase)
+    context_db.key_value_db.snapshot = None
     context_db.get = state_get
+    context_db.get_many = state_get_many
     context_db.put = state_put
 
     iiss_mock_db = Mock(spec=KeyValueDatabase)
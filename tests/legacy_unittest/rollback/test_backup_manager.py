@@ -18,8 +18,12 @@ import os
 import shutil
 import unittest
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
 
 from iconservice.base.block import Block
+from iconservice.base.exception import IllegalFormatException
+from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue
 from iconservice.database.db import KeyValueDatabase
 from iconservice.database.wal import WriteAheadLogReader, WALDBType
 from iconservice.icon_constant import Revision
@@ -147,6 +151,135 @@ class TestBackupManager(unittest.TestCase):
         self._check_if_rollback_is_done(self.rc_db, self.org_rc_db_data)
         self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
 
+    def test_run_with_executor(self):
+        block_hash: bytes = hashlib.sha3_256(b"block_hash").digest()
+        prev_hash: bytes = hashlib.sha3_256(b"prev_hash").digest()
+        instant_block_hash: bytes = hashlib.sha3_256(b"instant_block_hash").digest()
+
+        last_block = Block(
+            block_height=100,
+            block_hash=block_hash,
+            timestamp=0,
+            prev_hash=prev_hash,
+            cumulative_fee=0
+        )
+        block_batch = OrderedDict()
+        block_batch[b"key0"] = b"new value0"
+        block_batch[b"key1"] = None
+
+        rc_batch = OrderedDict()
+        rc_batch[b"key0"] = b"hello"
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = self.backup_manager.run(icx_db=self.state_db,
+                                         rc_db=self.rc_db,
+                                         revision=Revision.DECENTRALIZATION.value,
+                                         prev_block=last_block,
+                                         block_batch=block_batch,
+                                         iiss_wal=rc_batch.items(),
+                                         is_calc_period_start_block=False,
+                                         instant_block_hash=instant_block_hash,
+                                         executor=executor)
+
+        # rc_db can be written as soon as run() returns
+        self._commit_rc_db(self.rc_db, rc_batch)
+
+        future.result()
+        executor.shutdown()
+
+        self._commit_state_db(self.state_db, block_batch)
+        self._rollback(last_block)
+        self._check_if_rollback_is_done(self.rc_db, self.org_rc_db_data)
+        self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
+
+    def test_run_with_pre_images(self):
+        block_hash: bytes = hashlib.sha3_256(b"block_hash").digest()
+        prev_hash: bytes = hashlib.sha3_256(b"prev_hash").digest()
+        instant_block_hash: bytes = hashlib.sha3_256(b"instant_block_hash").digest()
+
+        last_block = Block(
+            block_height=100,
+            block_hash=block_hash,
+            timestamp=0,
+            prev_hash=prev_hash,
+            cumulative_fee=0
+        )
+
+        tx_batch = TransactionBatch()
+        tx_batch[b"key0"] = TransactionBatchValue(b"new value0", True, 0)
+        tx_batch[b"key1"] = TransactionBatchValue(None, True, 0)
+        block_batch = BlockBatch(last_block)
+        block_batch.update(tx_batch)
+        # The pre-image of key1 is not captured, so it is read from state_db
+        block_batch.set_pre_image(b"key0", b"value0")
+
+        # state_db is not read for the keys whose pre-images are captured
+        state_db = Mock(wraps=self.state_db)
+        self.backup_manager.run(icx_db=state_db,
+                                rc_db=self.rc_db,
+                                revision=Revision.DECENTRALIZATION.value,
+                                prev_block=last_block,
+                                block_batch=block_batch,
+                                iiss_wal=[],
+                                is_calc_period_start_block=False,
+                                instant_block_hash=instant_block_hash)
+        state_db.get_many.assert_called_once_with([b"key1"])
+
+        self._commit_state_db(self.state_db, OrderedDict((key, value.value) for key, value in block_batch.items()))
+        self._rollback(last_block)
+        self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
+
+    def test_run_with_multiple_backup_files(self):
+        state_db_data = {key: value for key, value in self.state_db.iterator()}
+        self._backup_blocks((100, 101))
+        self.rc_db.close()
+        self.rc_db = None
+
+        # The values in the oldest backup file are taken
+        self.rollback_manager.run(102, 100, term_start_block_height=0)
+        assert state_db_data == {key: value for key, value in self.state_db.iterator()}
+
+    def test_run_with_broken_backup_file(self):
+        paths = self._backup_blocks((100, 101))
+        state_db_data = {key: value for key, value in self.state_db.iterator()}
+
+        # Break the logs of the newest backup file
+        with open(paths[-1], "r+b") as f:
+            f.truncate(os.path.getsize(paths[-1]) - 4)
+
+        with self.assertRaises(IllegalFormatException):
+            self.rollback_manager.run(102, 100, term_start_block_height=0)
+
+        # No db is written with a part of backup files
+        assert state_db_data == {key: value for key, value in self.state_db.iterator()}
+
+    def _backup_blocks(self, block_heights: tuple) -> list:
+        paths = []
+        for i, block_height in enumerate(block_heights):
+            block = Block(
+                block_height=block_height,
+                block_hash=hashlib.sha3_256(f"block_hash{i}".encode()).digest(),
+                timestamp=0,
+                prev_hash=hashlib.sha3_256(b"prev_hash").digest(),
+                cumulative_fee=0
+            )
+            block_batch = OrderedDict()
+            block_batch[b"key0"] = f"new value{i}".encode()
+            block_batch[f"new key{i}".encode()] = b"value"
+
+            self.backup_manager.run(icx_db=self.state_db,
+                                    rc_db=self.rc_db,
+                                    revision=Revision.DECENTRALIZATION.value,
+                                    prev_block=block,
+                                    block_batch=block_batch,
+                                    iiss_wal=[],
+                                    is_calc_period_start_block=False,
+                                    instant_block_hash=block.hash)
+            self._commit_state_db(self.state_db, block_batch)
+            paths.append(os.path.join(self.backup_root_path, get_backup_filename(block_height)))
+
+        return paths
+
     @staticmethod
     def _commit_state_db(db: 'KeyValueDatabase', block_batch: OrderedDict):
         db.write_batch(block_batch.items())
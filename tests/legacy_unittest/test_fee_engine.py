@@ -55,12 +55,17 @@ def create_context_db():
     def get(context, key):
         return memory_db.get(key)
 
+    # noinspection PyUnusedLocal
+    def get_many(context, keys):
+        return [memory_db.get(key) for key in keys]
+
     # noinspection PyUnusedLocal
     def delete(context, key):
         del memory_db[key]
 
     context_db = Mock(spec=ContextDatabase)
     context_db.get = get
+    context_db.get_many = get_many
     context_db.put = put
     context_db.delete = delete
 
@@ -22,6 +22,7 @@ import pytest
 
 from iconservice.base.block import Block
 from iconservice.base.block import NULL_BLOCK
+from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue
 from iconservice.precommit_data_manager import PrecommitDataManager
 
 
@@ -176,6 +177,60 @@ class TestPrecommitDataManager(object):
             precommit_data = manager.get(block.hash)
             assert precommit_data.block_batch.block == block
 
+    def test_commit_with_overlay(self, create_precommit_data_manager):
+        """
+        root - parent - child
+
+        :param create_precommit_data_manager:
+        :return:
+        """
+        root = Block(
+            block_height=100,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=self.block_hash()
+        )
+        parent = Block(
+            block_height=root.height + 1,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=root.hash
+        )
+        child = Block(
+            block_height=parent.height + 1,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=parent.hash
+        )
+        manager = create_precommit_data_manager(root)
+
+        prev_overlay = None
+        for block, keys in ((parent, (b"key0", b"key1")), (child, (b"key1", b"key2"))):
+            tx_batch = TransactionBatch()
+            for key in keys:
+                tx_batch[key] = TransactionBatchValue(block.hash, True)
+
+            block_batch = BlockBatch(block)
+            block_batch.set_prev_overlay(prev_overlay)
+            block_batch.update(tx_batch)
+            prev_overlay = block_batch.overlay
+
+            precommit_data = Mock()
+            precommit_data.block_batch = block_batch
+            manager.push(precommit_data)
+
+        overlay: dict = manager.get(child.hash).block_batch.overlay
+        assert overlay[b"key0"].value == parent.hash
+        assert overlay[b"key1"].value == child.hash
+        assert overlay[b"key2"].value == child.hash
+
+        # The states of the committed block are excluded from the overlay of its child
+        manager.commit(parent)
+        overlay: dict = manager.get(child.hash).block_batch.overlay
+        assert b"key0" not in overlay
+        assert overlay[b"key1"].value == child.hash
+        assert overlay[b"key2"].value == child.hash
+
     def test_push(self, manager):
         pass
 
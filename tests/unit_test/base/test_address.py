@@ -21,7 +21,7 @@ import pytest
 
 from iconservice.base.address import Address, AddressPrefix, ICON_EOA_ADDRESS_PREFIX, ICON_CONTRACT_ADDRESS_PREFIX, \
     ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS, is_icon_address_valid, split_icon_address, MalformedAddress
-from iconservice.base.exception import ExceptionCode
+from iconservice.base.exception import ExceptionCode, InvalidParamsException
 from tests import create_address
 
 
@@ -53,6 +53,20 @@ class TestAddress:
         table = {addr1: 100}
         assert table[addr1] == table[addr2]
 
+    @pytest.mark.parametrize("prefix", [0, 1])
+    def test_interned(self, prefix):
+        addr = create_address(prefix=prefix)
+        assert not hasattr(addr, "__dict__")
+
+        assert Address.from_string(str(addr)) is Address.from_string(str(addr))
+        assert Address.from_bytes(addr.to_bytes()) is Address.from_bytes(addr.to_bytes())
+        assert Address.from_string(str(addr)) == Address.from_bytes(addr.to_bytes()) == addr
+
+    @pytest.mark.parametrize("address", [None, 1, [], b"hx" + bytes(20)])
+    def test_from_string_not_str(self, address):
+        with pytest.raises(InvalidParamsException):
+            Address.from_string(address)
+
     @pytest.mark.parametrize("prefix", [0, 1])
     def test_address_from_to_bytes(self, prefix):
         addr1 = create_address(prefix)
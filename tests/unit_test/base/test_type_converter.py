@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from typing import TYPE_CHECKING, Optional, Union
 
 import pytest
@@ -201,6 +202,33 @@ def test_call_data_convert():
     assert data_value != params[ConstantKeys.VALUE]
 
 
+def test_convert_does_not_share_original_data():
+    data_to = create_address()
+    request = {
+        ConstantKeys.METHOD: 'icx_sendTransaction',
+        ConstantKeys.PARAMS: {
+            ConstantKeys.FROM: str(create_address()),
+            ConstantKeys.DATA_TYPE: 'call',
+            ConstantKeys.DATA: {
+                ConstantKeys.METHOD: 'transfer',
+                ConstantKeys.PARAMS: {'_to': str(data_to), '_value': hex(10)}
+            },
+            'unknown': {'key': ['value']}
+        }
+    }
+    expected = copy.deepcopy(request)
+
+    ret_params = TypeConverter.convert(request, ParamType.INVOKE_TRANSACTION)
+    params = ret_params[ConstantKeys.PARAMS]
+    assert params[ConstantKeys.DATA][ConstantKeys.PARAMS] == {'_to': str(data_to), '_value': hex(10)}
+    assert params['unknown'] == {'key': ['value']}
+
+    # Converted data can be changed without affecting the original one
+    params[ConstantKeys.DATA][ConstantKeys.PARAMS]['_to'] = data_to
+    params['unknown']['key'].append('new_value')
+    assert request == expected
+
+
 def test_deploy_data_convert():
     content_type = 'application/zip'
     content = CONTENT
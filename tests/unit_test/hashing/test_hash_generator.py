@@ -13,6 +13,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+
 import pytest
 
 from iconservice.utils.hashing.hash_generator import HashGenerator
@@ -62,3 +64,21 @@ def test_generate_hash(tx_data, tx_hash):
     actual_tx_hash = HashGenerator.generate_hash(tx_data)
 
     assert actual_tx_hash == tx_hash
+
+
+def test_generate_origin():
+    tx_data = {
+        "to": "hx1ada76577eac29b1e60efee22aac66af9f434036",
+        "value": 10,
+        "data": {
+            "params": ["a.b", None, {"c": "[d]"}, []],
+            "method": "{\\}"
+        }
+    }
+    copied_tx_data = copy.deepcopy(tx_data)
+
+    origin = HashGenerator.generate_origin(tx_data)
+
+    assert origin == "data.{method.\\{\\\\\\}.params.[a\\.b.\\0.{c.\\[d\\]}.[]]}." \
+                     "to.hx1ada76577eac29b1e60efee22aac66af9f434036.value.10"
+    assert tx_data == copied_tx_data
@@ -23,8 +23,10 @@ from typing_extensions import TypedDict
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.base.exception import InvalidParamsException
 from iconservice.iconscore.typing.conversion import (
+    compile_str_to_object,
     convert_score_parameters,
     object_to_str,
+    str_to_object,
     str_to_object_in_struct,
 )
 from iconservice.iconscore.typing.element import normalize_signature
@@ -167,3 +169,67 @@ def test_str_to_object_in_struct(age, success):
     else:
         with pytest.raises(InvalidParamsException):
             str_to_object_in_struct(params, Person)
+
+
+@pytest.mark.parametrize(
+    "type_hint,value",
+    [
+        (int, "0x10"),
+        (int, "-16"),
+        (int, 16),
+        (bool, "0x1"),
+        (bytes, "0x1234"),
+        (str, "hello"),
+        (Address, str(Address(AddressPrefix.EOA, os.urandom(20)))),
+        (Address, ["hx"]),
+        (Optional[int], None),
+        (Optional[int], "0x1"),
+        (Optional[int], {}),
+        (List[int], ["0x1", "0x2"]),
+        (List[int], "0x1"),
+        (List[int], [None]),
+        (Dict[str, int], {"a": "0x1"}),
+        (Dict[str, int], []),
+        (Person, {"name": "john", "age": "0xa"}),
+        (Person, {"name": "john", "age": None}),
+        (Person, {"name": "john"}),
+        (Person, {"name": "john", "age": "0xa", "wallet": None}),
+        (Person, ["john"]),
+        (List[User], [{"name": "a", "age": "0x1", "single": "0x0", "wallet": None}]),
+        (List[User], [{"name": "a"}]),
+        (set, "0x1"),
+    ]
+)
+def test_compile_str_to_object(type_hint, value):
+    converter = compile_str_to_object(type_hint)
+
+    try:
+        expected = str_to_object(value, type_hint)
+    except InvalidParamsException as e:
+        with pytest.raises(InvalidParamsException) as exc_info:
+            converter(value)
+        assert exc_info.value.message == e.message
+    else:
+        assert converter(value) == expected
+
+
+def test_convert_score_parameters_with_function_metadata():
+    class TestScore:
+        def func(self, user: User, count: int = 1, memo: bytes = None):
+            pass
+
+    function = FunctionMetadata(TestScore.func)
+    user = {"name": "hello", "age": 30, "single": True, "wallet": None}
+
+    params = object_to_str({"user": user})
+    assert function.converter(params) == {"user": user}
+    assert params["count"] == 1
+    assert params["memo"] is None
+
+    params = object_to_str({"user": user, "count": 2, "memo": b"hi"})
+    assert function.converter(params) == convert_score_parameters(params, function.signature)
+
+    with pytest.raises(InvalidParamsException):
+        function.converter({"count": "0x1"})
+    with pytest.raises(InvalidParamsException):
+        function.converter({"user": object_to_str(user), "unknown": "0x0"})
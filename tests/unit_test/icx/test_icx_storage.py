@@ -21,6 +21,7 @@ import pytest
 
 from iconservice import Address
 from iconservice.base.block import Block
+from iconservice.database.batch import BlockBatch, TransactionBatch
 from iconservice.database.db import ContextDatabase
 from iconservice.icon_constant import Revision, IconScoreContextType
 from iconservice.iconscore.context.context import ContextContainer
@@ -103,3 +104,53 @@ class TestIcxStorage:
             account = storage.get_account(context, ADDRESS)
             assert account.balance == expected_balance
             assert account.unstakes_info == remaining_unstakes
+
+    @pytest.mark.parametrize("revision", [Revision.FIX_BALANCE_BUG.value - 1, Revision.FIX_BALANCE_BUG.value])
+    @pytest.mark.parametrize("intent", [Intent.TRANSFER, Intent.STAKE, Intent.DELEGATED, Intent.ALL])
+    def test_get_accounts(self, storage, context, mocker, revision, intent):
+        mocker.patch.object(IconScoreContext, "revision", PropertyMock(return_value=revision))
+
+        addresses = [Address.from_string(f"hx{i:040x}") for i in range(3)]
+        for i, address in enumerate(addresses[:2]):
+            coin_part = CoinPart(CoinPartType.GENERAL, CoinPartFlag.HAS_UNSTAKE, balance=100 + i)
+            coin_part.set_dirty(True)
+            stake_part = StakePart(stake=10 + i, unstake=0, unstake_block_height=0)
+            stake_part.set_dirty(True)
+            storage.put_account(context, Account(address, 0, revision, coin_part=coin_part, stake_part=stake_part))
+
+        accounts = storage.get_accounts(context, addresses, intent)
+        assert accounts == [storage.get_account(context, address, intent) for address in addresses]
+        assert [account.address for account in accounts] == addresses
+
+    def test_get_account_with_part_cache(self, storage, context, mocker):
+        mocker.patch.object(IconScoreContext, "revision", PropertyMock(return_value=Revision.LATEST.value))
+        context.type = IconScoreContextType.INVOKE
+        context.block_batch = BlockBatch(context.block)
+        context.tx_batch = TransactionBatch()
+
+        coin_part = CoinPart(CoinPartType.GENERAL, balance=100)
+        coin_part.set_dirty(True)
+        storage.put_account(context, Account(ADDRESS, 0, Revision.LATEST.value, coin_part=coin_part))
+
+        # The part written in this block is not decoded again
+        from_bytes = mocker.spy(CoinPart, "from_bytes")
+        account = storage.get_account(context, ADDRESS)
+        assert account.balance == 100
+        from_bytes.assert_not_called()
+
+        # Changes on an account which is not put do not affect the cached part
+        account.deposit(10)
+        assert storage.get_account(context, ADDRESS).balance == 100
+
+        # The cached part follows the state of tx_batch on internal calls
+        context.tx_batch.enter_call()
+        storage.put_account(context, account)
+        assert storage.get_account(context, ADDRESS).balance == 110
+        context.tx_batch.revert_call()
+        assert storage.get_account(context, ADDRESS).balance == 100
+        assert from_bytes.call_count == 1
+
+        # The cache is not shared with the next block
+        context.block = Block(1, None, 0, None, 0)
+        assert storage.get_account(context, ADDRESS).balance == 100
+        assert from_bytes.call_count == 2
@@ -247,6 +247,19 @@ class TestRcDataStorage:
         # Last tx data's index prefix and tx index should be equal
         assert actual_tx_index == actual_recorded_index
 
+    def test_encode_rc_data_once(self, dummy_header, dummy_gv, dummy_prep, dummy_tx, mocker):
+        dummy_iiss_data_list = [dummy_header, dummy_gv, dummy_prep, dummy_tx]
+        make_values = [mocker.spy(iiss_data, "make_value") for iiss_data in dummy_iiss_data_list]
+
+        # IissWAL is iterated both to write WAL and to commit RC DB
+        iiss_wal: 'IissWAL' = IissWAL(dummy_iiss_data_list, -1, Revision.IISS.value)
+        items = list(iiss_wal)
+        assert items == list(iiss_wal)
+
+        for iiss_data, make_value in zip(dummy_iiss_data_list, make_values):
+            assert make_value.call_count == 1
+            assert iiss_data.get_encoded_value() == iiss_data.make_value()
+
     def test_get_calc_response_before_put_it(self, rc_data_storage):
         # TEST: If there is no prev_calc_period_issued_i_score, should return None
         actual_i_score, _, _ = rc_data_storage.get_calc_response_from_rc()
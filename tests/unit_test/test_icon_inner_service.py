@@ -14,31 +14,44 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import copy
 import threading
 from unittest.mock import Mock
 
 import pytest
 from iconcommons import IconConfig
 
-from iconservice.base.exception import FatalException, InvalidBaseTransactionException, IconServiceBaseException
+from iconservice.base.exception import FatalException, InvalidBaseTransactionException, IconServiceBaseException, \
+    OutOfBalanceException, ExceptionCode
 from iconservice.base.type_converter_templates import ConstantKeys
-from iconservice.icon_constant import RPCMethod, ENABLE_THREAD_FLAG
+from iconservice.icon_config import default_icon_config
+from iconservice.icon_constant import RPCMethod, ENABLE_THREAD_FLAG, ConfigKey
 from iconservice.icon_inner_service import IconScoreInnerTask
 from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.iconscore.icon_score_step import OutOfStepException
 from tests import create_block_hash
 
 
-@pytest.fixture(params=[ENABLE_THREAD_FLAG, ~ENABLE_THREAD_FLAG])
-def inner_task(mocker, request):
-    mocker.patch.object(IconScoreInnerTask, "_open")
-    mocker.patch.object(IconScoreInnerTask, "_close")
-    inner_task = IconScoreInnerTask(Mock(spec=IconConfig))
-    inner_task._thread_flag = request.param
-    icon_service_engine = Mock(spec=IconServiceEngine)
-    inner_task._icon_service_engine = icon_service_engine
+@pytest.fixture
+def create_inner_task(mocker):
+    def func(thread_flag, query_thread_count: int = 1):
+        mocker.patch.object(IconScoreInnerTask, "_open")
+        mocker.patch.object(IconScoreInnerTask, "_close")
+        conf = IconConfig("", copy.deepcopy(default_icon_config))
+        conf[ConfigKey.QUERY_THREAD_COUNT] = query_thread_count
+        inner_task = IconScoreInnerTask(conf)
+        inner_task._thread_flag = thread_flag
+        icon_service_engine = Mock(spec=IconServiceEngine)
+        inner_task._icon_service_engine = icon_service_engine
+
+        return inner_task
+
+    return func
 
-    return inner_task
+
+@pytest.fixture(params=[ENABLE_THREAD_FLAG, ~ENABLE_THREAD_FLAG])
+def inner_task(create_inner_task, request):
+    return create_inner_task(request.param)
 
 
 @pytest.fixture()
@@ -231,3 +244,85 @@ class TestIconInnerService:
         assert status_requests[0] != call_thread_id
         assert status_requests[0] != estimate_thread_id
         assert call_thread_id != estimate_thread_id
+
+    def test_query_with_multiple_threads(self, create_inner_task):
+        inner_task = create_inner_task(ENABLE_THREAD_FLAG, query_thread_count=2)
+        icx_call_request = {
+            ConstantKeys.METHOD: RPCMethod.ICX_CALL,
+            ConstantKeys.PARAMS: {}
+        }
+
+        # Each query waits for the other one, which is possible only if they are processed concurrently
+        barrier = threading.Barrier(2, timeout=5)
+
+        def mocked_query(method, params):
+            barrier.wait()
+            return threading.get_ident()
+
+        inner_task._icon_service_engine.query = mocked_query
+        loop = asyncio.get_event_loop()
+
+        # Act
+        thread_ids = loop.run_until_complete(
+            asyncio.gather(*[inner_task.query(icx_call_request) for _ in range(2)]))
+
+        # Checks
+        assert len(set(thread_ids)) == 2
+
+    def test_validate_transactions(self, inner_task):
+        requests = [{"method": "icx_sendTransaction", "params": {}} for _ in range(3)]
+        exception = OutOfBalanceException("out of balance")
+
+        def mocked_validate_transactions(converted_requests, origin_requests):
+            assert len(converted_requests) == len(origin_requests) == 3
+            return [None, exception, None]
+
+        inner_task._icon_service_engine.validate_transactions = mocked_validate_transactions
+        loop = asyncio.get_event_loop()
+
+        # Act
+        responses = loop.run_until_complete(inner_task.validate_transactions({ConstantKeys.TRANSACTIONS: requests}))
+
+        assert len(responses) == 3
+        assert responses[0] == responses[2] == hex(0)
+        assert responses[1]['error']['code'] == 32000 + int(exception.code)
+        assert responses[1]['error']['message'] == exception.message
+        assert not inner_task._close.called
+
+    @pytest.mark.parametrize("exception, expected_msg, expected_code",
+                             [(exception, exception.args[0], 32001) for exception in EXCEPTIONS
+                              if not isinstance(exception, InvalidBaseTransactionException)]
+                             + [(exception, exception.message, 32000 + int(exception.code)) for exception in
+                                IS_BASE_EXCEPTIONS])
+    def test_exception_catch_on_validate_transactions(self, exception, expected_msg, expected_code, inner_task):
+        requests = [{"method": "icx_sendTransaction", "params": {}} for _ in range(2)]
+
+        def mocked_validate_transactions(converted_requests, origin_requests):
+            raise exception
+
+        inner_task._icon_service_engine.validate_transactions = mocked_validate_transactions
+        loop = asyncio.get_event_loop()
+
+        # Act
+        responses = loop.run_until_complete(inner_task.validate_transactions({ConstantKeys.TRANSACTIONS: requests}))
+
+        assert len(responses) == 2
+        assert responses[0] is not responses[1]
+        for response in responses:
+            assert response['error']['code'] == expected_code
+            assert response['error']['message'] == expected_msg
+        assert not inner_task._close.called
+
+    def test_validate_transactions_before_ready(self, inner_task):
+        requests = [{"method": "icx_sendTransaction", "params": {}} for _ in range(2)]
+        inner_task._icon_service_engine.is_reward_calculator_ready.return_value = False
+        loop = asyncio.get_event_loop()
+
+        # Act
+        responses = loop.run_until_complete(inner_task.validate_transactions({ConstantKeys.TRANSACTIONS: requests}))
+
+        assert len(responses) == 2
+        assert responses[0] is not responses[1]
+        for response in responses:
+            assert response['error']['code'] == 32000 + ExceptionCode.SERVICE_NOT_READY
+        inner_task._icon_service_engine.validate_transactions.assert_not_called()
@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import json
+import sys
+from typing import Dict
+
+from iconservice.base.address import Address
+from iconservice.iiss.reward_calc.ipc.message import MessageType
+from tools.rc_emulator.emulator import RewardCalcEmulator
+
+
+def get_parser() -> 'argparse.ArgumentParser':
+    parser = argparse.ArgumentParser(prog="rc_emulator", description="Stand-in reward calculator")
+
+    # Options passed by iconservice when it launches icon_rc
+    parser.add_argument("-ipc-addr", dest="ipc_addr", required=True, help="Unix domain socket path of iconservice")
+    parser.add_argument("-client", action="store_true", help="Ignored")
+    parser.add_argument("-monitor", action="store_true", help="Ignored")
+    parser.add_argument("-db-count", dest="db_count", help="Ignored")
+    parser.add_argument("-db", help="Ignored")
+    parser.add_argument("-iissdata", help="Ignored")
+    parser.add_argument("-log-file", dest="log_file", help="Ignored")
+
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Response latency in seconds")
+    parser.add_argument("--message-latency", dest="message_latencies", action="append", default=[],
+                        help="Response latency of a message type in seconds. ex) CLAIM:0.01")
+    parser.add_argument("--iscore-table", dest="iscore_table",
+                        help="JSON file which maps an address to I-Score. ex) {\"hx...\": 1000}")
+    parser.add_argument("--default-iscore", dest="default_iscore", type=int, default=0,
+                        help="I-Score of the addresses not in the I-Score table")
+
+    return parser
+
+
+def _parse_message_latencies(values: list) -> Dict['MessageType', float]:
+    latencies = {}
+    for value in values:
+        name, latency = value.split(":")
+        latencies[MessageType[name.upper()]] = float(latency)
+
+    return latencies
+
+
+def _load_iscore_table(path: str) -> Dict['Address', int]:
+    if path is None:
+        return {}
+
+    with open(path, "r") as f:
+        table: dict = json.load(f)
+
+    return {Address.from_string(k): int(v) for k, v in table.items()}
+
+
+def main() -> int:
+    args = get_parser().parse_args()
+
+    emulator = RewardCalcEmulator(iscore_table=_load_iscore_table(args.iscore_table),
+                                  default_iscore=args.default_iscore,
+                                  latency=args.latency,
+                                  message_latencies=_parse_message_latencies(args.message_latencies))
+
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(emulator.run(args.ipc_addr))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
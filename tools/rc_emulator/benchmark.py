@@ -0,0 +1,253 @@
+"""Measures IPC latency between iconservice and the stand-in reward calculator
+
+IconServiceEngine invokes and commits blocks including claimIScore transactions
+and queries I-Score after each block through the real RewardCalcProxy.
+The reward calculator process is replaced with tools.rc_emulator.
+
+(venv) :~/icon-service$ python3 -m tools.rc_emulator.benchmark --blocks 100 --claims 10 --latency 0.001
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from iconcommons.logger import Logger
+from iconservice.icon_constant import ConfigKey, Revision
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.utils import icx_to_loop
+from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
+
+# RewardCalcProxy methods and the messages they send
+_PROXY_METHODS = {
+    "get_version": "VERSION",
+    "claim_iscore": "CLAIM",
+    "query_iscore": "QUERY",
+    "calculate": "CALCULATE",
+    "commit_block": "COMMIT_BLOCK",
+    "commit_claim": "COMMIT_CLAIM",
+    "query_calculate_status": "QUERY_CALCULATE_STATUS",
+    "query_calculate_result": "QUERY_CALCULATE_RESULT",
+    "rollback": "ROLLBACK",
+    "init_reward_calculator": "INIT",
+    "start_block": "START_BLOCK",
+    # Waiting for the responses to CLAIM and COMMIT_CLAIM requests
+    "get_claim_iscore_result": "CLAIM(wait)",
+    "wait_for_commit_claim": "COMMIT_CLAIM(wait)",
+}
+
+_READY_TIMEOUT = 10
+
+
+class RewardCalcBenchmark(TestIISSBase):
+    def __init__(self, work_dir: str, emulator_args: List[str], claim_pipeline: bool = False):
+        super().__init__()
+
+        self._work_dir: str = work_dir
+        self._emulator_args: List[str] = emulator_args
+        self._claim_pipeline: bool = claim_pipeline
+        self._rc_path: Optional[str] = None
+
+        self._loop: Optional['asyncio.AbstractEventLoop'] = None
+        self._loop_thread: Optional['threading.Thread'] = None
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+
+    @classmethod
+    def _mock_ipc(cls, mock_calculate: callable = None):
+        # Use the real RewardCalcProxy which launches the stand-in reward calculator
+        pass
+
+    def _make_init_config(self) -> dict:
+        conf: dict = super()._make_init_config()
+        conf[ConfigKey.AMQP_KEY] = f"rc_emulator_{os.getpid()}"
+        conf[ConfigKey.ICON_RC_DIR_PATH] = self._rc_path
+        conf[ConfigKey.ICON_RC_MONITOR] = False
+        conf[ConfigKey.ISCORE_CLAIM_PIPELINE] = self._claim_pipeline
+        return conf
+
+    def setUp(self):
+        self._rc_path = self._create_rc_launcher()
+
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+        super().setUp()
+
+    def tearDown(self):
+        if self._loop_thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+
+        super().tearDown()
+
+        # Let IPCServer tasks finish their cancellation
+        tasks = asyncio.all_tasks(self._loop)
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
+
+    def _create_rc_launcher(self) -> str:
+        """Creates an executable which is launched by RewardCalcProxy instead of icon_rc
+        """
+        root_path: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        args: str = " ".join(self._emulator_args)
+
+        path: str = os.path.join(self._work_dir, "icon_rc")
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n")
+            f.write(f'PYTHONPATH="{root_path}" exec "{sys.executable}" -m tools.rc_emulator {args} "$@"\n')
+
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+        return path
+
+    def _genesis_invoke(self) -> tuple:
+        # IPC messages are handled on the event loop running in another thread like iconservice does
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+
+        future = asyncio.run_coroutine_threadsafe(self._wait_for_ready(), self._loop)
+        future.result(_READY_TIMEOUT)
+
+        self._trace_proxy()
+
+        return super()._genesis_invoke()
+
+    async def _wait_for_ready(self):
+        await self.icon_service_engine.get_ready_future()
+
+    def _trace_proxy(self):
+        proxy = IconScoreContext.engine.iiss._reward_calc_proxy
+
+        for name, msg_type in _PROXY_METHODS.items():
+            setattr(proxy, name, self._trace(getattr(proxy, name), self._latencies[msg_type]))
+
+    @staticmethod
+    def _trace(func: callable, latencies: List[float]) -> callable:
+        def wrapper(*args, **kwargs):
+            start: float = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+        return wrapper
+
+    def run_blocks(self, blocks: int, claims: int, queries: int) -> float:
+        """Invokes and commits blocks with claimIScore transactions
+
+        :param blocks: the number of blocks
+        :param claims: the number of claimIScore transactions in a block
+        :param queries: the number of queryIScore calls after each block
+        :return: elapsed time in seconds
+        """
+        self.update_governance()
+        # IISS calculation starts only when the revision changes to Revision.IISS
+        self.set_revision(Revision.IISS.value)
+        self.set_revision(Revision.LATEST.value)
+        self.distribute_icx(self._accounts, icx_to_loop(100))
+
+        for latencies in self._latencies.values():
+            latencies.clear()
+
+        start: float = time.perf_counter()
+
+        for i in range(blocks):
+            tx_list: List[dict] = [
+                self.create_claim_tx(self._accounts[(i * claims + j) % len(self._accounts)])
+                for j in range(claims)
+            ]
+            self.process_confirm_block_tx(tx_list)
+
+            for j in range(queries):
+                self.query_iscore(self._accounts[(i + j) % len(self._accounts)])
+
+        return time.perf_counter() - start
+
+    def report(self, blocks: int, elapsed: float):
+        print(f"{blocks} blocks in {elapsed:.3f}s ({blocks / elapsed:.1f} blocks/s)")
+        print(f"{'message':<24}{'count':>8}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}")
+
+        for msg_type, latencies in self._latencies.items():
+            if len(latencies) == 0:
+                continue
+
+            latencies = sorted(latencies)
+            print(f"{msg_type:<24}{len(latencies):>8}"
+                  f"{_percentile(latencies, 50):>10.3f}"
+                  f"{_percentile(latencies, 90):>10.3f}"
+                  f"{_percentile(latencies, 99):>10.3f}"
+                  f"{latencies[-1] * 1000:>10.3f}")
+
+
+def _percentile(sorted_values: List[float], percent: int) -> float:
+    index: int = min(len(sorted_values) - 1, len(sorted_values) * percent // 100)
+    return sorted_values[index] * 1000
+
+
+def get_parser() -> 'argparse.ArgumentParser':
+    parser = argparse.ArgumentParser(prog="rc_emulator.benchmark", description="Reward calculator IPC benchmark")
+    parser.add_argument("--blocks", type=int, default=100, help="The number of blocks to invoke")
+    parser.add_argument("--claims", type=int, default=10, help="claimIScore transactions in a block")
+    parser.add_argument("--queries", type=int, default=10, help="queryIScore calls after each block")
+    parser.add_argument("--latency", type=float, default=0.0, help="Response latency of the reward calculator")
+    parser.add_argument("--message-latency", dest="message_latencies", action="append", default=[],
+                        help="Response latency of a message type in seconds. ex) CLAIM:0.01")
+    parser.add_argument("--claim-pipeline", dest="claim_pipeline", action="store_true",
+                        help="Send CLAIM requests ahead of claimIScore transactions")
+    parser.add_argument("--iscore", type=int, default=10 ** 6, help="Claimable I-Score of each account")
+    parser.add_argument("--log-level", dest="log_level", default="info", help="Log level of iconservice")
+
+    return parser
+
+
+def main() -> int:
+    args = get_parser().parse_args()
+
+    work_dir: str = tempfile.mkdtemp()
+    cwd: str = os.getcwd()
+
+    Logger.load_config({
+        ConfigKey.LOG: {
+            ConfigKey.LOG_LEVEL: args.log_level,
+            ConfigKey.LOG_OUTPUT_TYPE: "file",
+            ConfigKey.LOG_FILE_PATH: os.path.join(work_dir, "iconservice.log"),
+        }
+    })
+
+    RewardCalcBenchmark.setUpClass()
+
+    iscore_table_path: str = os.path.join(work_dir, "iscore_table.json")
+    with open(iscore_table_path, "w") as f:
+        json.dump({str(account.address): args.iscore for account in RewardCalcBenchmark._accounts}, f)
+
+    emulator_args: List[str] = ["--latency", str(args.latency), "--iscore-table", iscore_table_path]
+    for value in args.message_latencies:
+        emulator_args.extend(["--message-latency", value])
+
+    benchmark = RewardCalcBenchmark(work_dir, emulator_args, args.claim_pipeline)
+
+    # iconservice creates its databases in the current directory
+    os.chdir(work_dir)
+    try:
+        benchmark.setUp()
+        try:
+            elapsed: float = benchmark.run_blocks(args.blocks, args.claims, args.queries)
+            benchmark.report(args.blocks, elapsed)
+        finally:
+            benchmark.tearDown()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+import asyncio
+import hashlib
+from typing import Dict, Optional, Tuple, Any
+
+import msgpack
+
+from iconservice.base.address import Address
+from iconservice.icon_constant import RCCalculateResult
+from iconservice.iiss.reward_calc.ipc.message import MessageType
+from iconservice.utils import int_to_bytes
+
+RC_VERSION = 7
+
+
+class RewardCalcEmulator(object):
+    """Stand-in for icon_rc which speaks the IPC protocol of iconservice
+
+    It does not calculate anything.
+    I-Score of each account comes from an I-Score table and claimed I-Score is reset to 0 on COMMIT_CLAIM.
+    Every response is delayed by the latency given for its message type.
+    """
+
+    def __init__(self,
+                 iscore_table: Optional[Dict['Address', int]] = None,
+                 default_iscore: int = 0,
+                 latency: float = 0.0,
+                 message_latencies: Optional[Dict['MessageType', float]] = None):
+        self._iscore_table: Dict['Address', int] = dict(iscore_table) if iscore_table else {}
+        self._default_iscore: int = default_iscore
+        self._latency: float = latency
+        self._message_latencies: Dict['MessageType', float] = dict(message_latencies) if message_latencies else {}
+
+        self._block_height: int = 0
+        self._block_hash: bytes = bytes(32)
+        self._calc_block_height: int = 0
+        self._calc_state_hash: bytes = bytes(32)
+        self._claims: Dict[bytes, int] = {}
+
+        self._writer: Optional['asyncio.StreamWriter'] = None
+        self._message_counts: Dict['MessageType', int] = {}
+
+        self._handlers = {
+            MessageType.VERSION: self._handle_version,
+            MessageType.CLAIM: self._handle_claim,
+            MessageType.QUERY: self._handle_query,
+            MessageType.CALCULATE: self._handle_calculate,
+            MessageType.COMMIT_BLOCK: self._handle_commit_block,
+            MessageType.COMMIT_CLAIM: self._handle_commit_claim,
+            MessageType.QUERY_CALCULATE_STATUS: self._handle_query_calculate_status,
+            MessageType.QUERY_CALCULATE_RESULT: self._handle_query_calculate_result,
+            MessageType.ROLLBACK: self._handle_rollback,
+            MessageType.INIT: self._handle_init,
+            MessageType.START_BLOCK: self._handle_start_block,
+        }
+
+    @property
+    def message_counts(self) -> Dict['MessageType', int]:
+        return self._message_counts
+
+    def get_iscore(self, address: 'Address') -> int:
+        return self._iscore_table.get(address, self._default_iscore)
+
+    async def run(self, path: str, retry: int = 50):
+        """Connects to iconservice and handles requests until the connection is closed
+
+        :param path: unix domain socket path of iconservice
+        :param retry: the number of connection retries at an interval of 0.1 second
+        """
+        reader, writer = await self._connect(path, retry)
+        self._writer = writer
+
+        self._send(MessageType.READY, 0, (RC_VERSION, self._block_height, self._block_hash))
+
+        unpacker = msgpack.Unpacker(raw=False)
+
+        while True:
+            data: bytes = await reader.read(64 * 1024)
+            if len(data) == 0:
+                break
+
+            unpacker.feed(data)
+
+            for message in unpacker:
+                await self._handle(message)
+
+        writer.close()
+        self._writer = None
+
+    @staticmethod
+    async def _connect(path: str, retry: int) -> Tuple['asyncio.StreamReader', 'asyncio.StreamWriter']:
+        for i in range(retry):
+            try:
+                return await asyncio.open_unix_connection(path)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if i == retry - 1:
+                    raise
+                await asyncio.sleep(0.1)
+
+    async def _handle(self, message: list):
+        msg_type = MessageType(message[0])
+        msg_id: int = message[1]
+
+        if msg_type == MessageType.NONE:
+            return
+
+        self._message_counts[msg_type] = self._message_counts.get(msg_type, 0) + 1
+
+        latency: float = self._message_latencies.get(msg_type, self._latency)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        payload: Any = message[2] if len(message) > 2 else None
+        self._handlers[msg_type](msg_id, payload)
+
+    def _send(self, msg_type: 'MessageType', msg_id: int, payload: Optional[tuple] = None):
+        items = (msg_type, msg_id) if payload is None else (msg_type, msg_id, payload)
+        self._writer.write(msgpack.dumps(items))
+
+    def _handle_version(self, msg_id: int, _payload: None):
+        self._send(MessageType.VERSION, msg_id, (RC_VERSION, self._block_height))
+
+    def _handle_claim(self, msg_id: int, payload: list):
+        address, block_height, block_hash, tx_index, tx_hash = payload
+
+        iscore: int = self.get_iscore(Address.from_bytes_including_prefix(address))
+        self._claims[tx_hash] = iscore
+
+        self._send(MessageType.CLAIM, msg_id,
+                   (address, block_height, block_hash, tx_index, tx_hash, int_to_bytes(iscore)))
+
+    def _handle_commit_claim(self, msg_id: int, payload: list):
+        success, address, _block_height, _block_hash, _tx_index, tx_hash = payload
+
+        iscore: int = self._claims.pop(tx_hash, 0)
+        if success and iscore > 0:
+            self._iscore_table[Address.from_bytes_including_prefix(address)] = 0
+
+        self._send(MessageType.COMMIT_CLAIM, msg_id)
+
+    def _handle_query(self, msg_id: int, payload: list):
+        address = payload[0]
+        iscore: int = self.get_iscore(Address.from_bytes_including_prefix(address))
+
+        self._send(MessageType.QUERY, msg_id, (address, int_to_bytes(iscore), self._calc_block_height))
+
+    def _handle_calculate(self, msg_id: int, payload: list):
+        _db_path, block_height = payload
+
+        self._calc_block_height = block_height
+        self._calc_state_hash = hashlib.sha3_256(int_to_bytes(block_height)).digest()
+
+        self._send(MessageType.CALCULATE, msg_id, (RCCalculateResult.SUCCESS, block_height))
+        self._send(MessageType.CALCULATE_DONE, 0,
+                   (True, block_height, int_to_bytes(self._get_total_iscore()), self._calc_state_hash))
+
+    def _handle_query_calculate_status(self, msg_id: int, _payload: None):
+        self._send(MessageType.QUERY_CALCULATE_STATUS, msg_id, (RCCalculateResult.SUCCESS, self._calc_block_height))
+
+    def _handle_query_calculate_result(self, msg_id: int, block_height: int):
+        status = RCCalculateResult.SUCCESS \
+            if block_height == self._calc_block_height else RCCalculateResult.INVALID_BLOCK_HEIGHT
+
+        self._send(MessageType.QUERY_CALCULATE_RESULT, msg_id,
+                   (status, block_height, int_to_bytes(self._get_total_iscore()), self._calc_state_hash))
+
+    def _handle_commit_block(self, msg_id: int, payload: list):
+        success, block_height, block_hash = payload
+
+        if success:
+            self._block_height = block_height
+            self._block_hash = block_hash
+
+        self._send(MessageType.COMMIT_BLOCK, msg_id, (success, block_height, block_hash))
+
+    def _handle_rollback(self, msg_id: int, payload: list):
+        block_height, block_hash = payload
+
+        self._block_height = block_height
+        self._block_hash = block_hash
+        self._claims.clear()
+
+        self._send(MessageType.ROLLBACK, msg_id, (True, block_height, block_hash))
+
+    def _handle_init(self, msg_id: int, block_height: int):
+        self._send(MessageType.INIT, msg_id, (True, block_height))
+
+    def _handle_start_block(self, msg_id: int, payload: list):
+        block_height, block_hash = payload
+        self._send(MessageType.START_BLOCK, msg_id, (block_height, block_hash))
+
+    def _get_total_iscore(self) -> int:
+        return sum(self._iscore_table.values())